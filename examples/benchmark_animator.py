@@ -0,0 +1,88 @@
+"""
+Benchmark de frames por segundo del animador.
+
+Este script mide cuántos frames por segundo procesa la animación de GeoFlux
+Sort con dos estrategias de dibujado, sobre el backend Agg (sin ventana):
+    1. Redibujado completo de la figura en cada frame (blit=False)
+    2. Blitting por regiones: solo se redibujan las barras y textos que
+       cambian (blit=True)
+
+A partir de 1000 elementos la figura usa el nivel de detalle reducido
+(columnas de un píxel con mínimo, máximo y highlight dominante) en lugar de
+una barra por elemento.
+
+Ejecutar:
+    python examples/benchmark_animator.py
+
+Requisitos:
+    pip install matplotlib tabulate
+"""
+
+import random
+import sys
+import os
+import time
+from itertools import islice
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from tabulate import tabulate
+
+# Añadir el directorio raíz del proyecto al PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from geoflux_sorter import geoflux_sort_generator
+from geoflux_sorter.animator import create_bar_plot, update_plot, BinnedRenderer
+
+
+def measure_fps(data, blit, max_frames, max_seconds=5.0):
+    """
+    Mide los frames por segundo de la animación sobre unos datos.
+
+    Args:
+        data (list): Valores a animar
+        blit (bool): Si se usa blitting por regiones
+        max_frames (int): Número máximo de frames a procesar
+        max_seconds (float): Tiempo máximo de medición
+
+    Returns:
+        tuple: (frames por segundo, modo de dibujado)
+    """
+    fig, renderer = create_bar_plot(data, blit=blit)
+    fig.canvas.draw()
+    frames = islice(geoflux_sort_generator(data, frames='delta'), max_frames)
+
+    count = 0
+    start_time = time.perf_counter()
+    for frame in frames:
+        update_plot(frame, renderer)
+        if not blit:
+            fig.canvas.draw()
+        count += 1
+        if time.perf_counter() - start_time > max_seconds:
+            break
+    elapsed = time.perf_counter() - start_time
+    plt.close(fig)
+    mode = "LOD" if isinstance(renderer, BinnedRenderer) else "barras"
+    return count / elapsed, mode
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("BENCHMARK - FRAMES POR SEGUNDO DEL ANIMADOR")
+    print("=" * 60 + "\n")
+
+    results = []
+    for size in [200, 1000, 5000, 100000]:
+        print(f"Probando tamaño {size}...", end=" ")
+        data = [random.randint(1, 1000) for _ in range(size)]
+        full_fps, mode = measure_fps(data, blit=False, max_frames=300)
+        blit_fps, _ = measure_fps(data, blit=True, max_frames=3000)
+        results.append([size, mode, f"{full_fps:.1f}", f"{blit_fps:.1f}", f"{blit_fps / full_fps:.1f}x"])
+        print("Completado")
+
+    headers = ["Tamaño", "Modo", "FPS redibujado completo", "FPS por regiones", "Aceleración"]
+    print("\n" + tabulate(results, headers=headers, tablefmt="grid"))
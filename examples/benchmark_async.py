@@ -0,0 +1,130 @@
+"""
+Benchmark de la latencia del bucle de eventos durante una ordenación.
+
+Este script mide cuánto se retrasa una tarea de asyncio que late cada
+milisegundo mientras otra tarea ordena una lista:
+    1. geoflux_sort llamado directamente desde la corrutina (bloquea el bucle)
+    2. geoflux_sort_async cooperativo, cediendo cada 1000 pasos de comparación
+    3. geoflux_sort_async cooperativo, cediendo solo entre fases
+    4. geoflux_sort_async delegado al ejecutor de hilos por defecto
+    5. geoflux_sort_async delegado a un ProcessPoolExecutor
+
+La tabla muestra la duración de la ordenación y el retraso de los latidos
+(máximo y percentil 99) respecto al milisegundo esperado. Los datos son
+flotantes para que el núcleo no use la ruta de conteo de enteros.
+
+Ejecutar:
+    python examples/benchmark_async.py
+
+Requisitos:
+    pip install tabulate
+"""
+
+import sys
+import os
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from tabulate import tabulate
+
+# Añadir el directorio raíz del proyecto al PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from geoflux_sorter import geoflux_sort, geoflux_sort_async
+from geoflux_sorter.bench import generate_workload
+
+# Intervalo del latido que mide la latencia del bucle (segundos)
+INTERVALO = 0.001
+
+
+async def _latir(retrasos, parar):
+    """Duerme INTERVALO en bucle y anota cuánto tarda de más cada despertar."""
+    while not parar.is_set():
+        inicio = time.perf_counter()
+        await asyncio.sleep(INTERVALO)
+        retrasos.append(time.perf_counter() - inicio - INTERVALO)
+
+
+async def _medir(ordenar, datos):
+    """Ejecuta una ordenación junto al latido; devuelve (duración, retrasos)."""
+    retrasos = []
+    parar = asyncio.Event()
+    latido = asyncio.create_task(_latir(retrasos, parar))
+    # Dejar que el latido arranque antes de empezar a ordenar
+    await asyncio.sleep(INTERVALO)
+    arr = list(datos)
+    inicio = time.perf_counter()
+    await ordenar(arr)
+    duracion = time.perf_counter() - inicio
+    parar.set()
+    await latido
+    assert arr == sorted(datos)
+    return duracion, retrasos
+
+
+async def benchmark_async(size=20000, workloads=['nearly_sorted', 'clustered', 'random']):
+    """
+    Mide la latencia del bucle de eventos con cada modo de ordenación.
+
+    Args:
+        size (int): Número de elementos
+        workloads (list): Cargas de trabajo de ``geoflux_sorter.bench``
+
+    Returns:
+        list: Filas [carga, modo, duración, retraso máximo, p99, latidos]
+    """
+    async def bloqueante(arr):
+        geoflux_sort(arr)
+
+    async def cooperativo(arr):
+        await geoflux_sort_async(arr, offload_threshold=None)
+
+    async def por_fase(arr):
+        await geoflux_sort_async(arr, yield_every=None, offload_threshold=None)
+
+    async def hilo(arr):
+        await geoflux_sort_async(arr, offload_threshold=0)
+
+    results = []
+    with ProcessPoolExecutor(max_workers=1) as procesos:
+        async def proceso(arr):
+            await geoflux_sort_async(arr, executor=procesos, offload_threshold=0)
+
+        # Arrancar el proceso trabajador fuera de la medición
+        await geoflux_sort_async([2.0, 1.0], executor=procesos, offload_threshold=0)
+
+        modos = [
+            ("bloqueante", bloqueante),
+            ("cooperativo (cada 1000)", cooperativo),
+            ("cooperativo (por fase)", por_fase),
+            ("hilo", hilo),
+            ("proceso", proceso),
+        ]
+        for workload in workloads:
+            # Flotantes: los enteros de rango acotado irían por la ruta de conteo
+            datos = [valor + 0.5 for valor in generate_workload(workload, size)]
+            for nombre, ordenar in modos:
+                duracion, retrasos = await _medir(ordenar, datos)
+                retrasos.sort()
+                maximo = retrasos[-1] if retrasos else duracion
+                p99 = retrasos[int(len(retrasos) * 0.99)] if retrasos else duracion
+                results.append([
+                    workload, nombre,
+                    f"{duracion * 1000:.1f}", f"{maximo * 1000:.1f}",
+                    f"{p99 * 1000:.1f}", len(retrasos),
+                ])
+    return results
+
+
+if __name__ == "__main__":
+    size = 20000
+    print(f"Midiendo la latencia del bucle de eventos durante la ordenación (n = {size})...")
+    results = asyncio.run(benchmark_async(size))
+    print(tabulate(
+        results,
+        headers=["Carga", "Modo", "Ordenación (ms)", "Retraso máx (ms)",
+                 "Retraso p99 (ms)", "Latidos"],
+        tablefmt="grid",
+    ))
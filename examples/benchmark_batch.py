@@ -0,0 +1,124 @@
+"""
+Benchmark del ordenamiento por lotes de muchos arreglos pequeños.
+
+Este script compara el rendimiento, en arreglos ordenados por segundo, de:
+    1. Un bucle que llama a geoflux_sort para cada arreglo
+    2. geoflux_sort_many en el proceso actual
+    3. geoflux_sort_many repartido entre 4 procesos
+    4. geoflux_sort_rows sobre una matriz de NumPy (una fila por arreglo)
+
+Cargas de trabajo:
+    - cortos: enteros, longitudes entre 2 y 20
+    - mixtos: flotantes, 80% de longitudes entre 2 y 20 y el resto hasta 200
+    - filas: matriz de flotantes de 16 columnas (el bucle ordena cada fila
+      convertida a lista)
+
+Cada caso se mide tres veces sobre una copia nueva del lote y se muestra
+el mejor tiempo.
+
+Ejecutar:
+    python examples/benchmark_batch.py
+
+Requisitos:
+    pip install tabulate numpy
+"""
+
+import sys
+import os
+import random
+import time
+import numpy as np
+from tabulate import tabulate
+
+# Añadir el directorio raíz del proyecto al PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from geoflux_sorter import geoflux_sort, geoflux_sort_many, geoflux_sort_rows
+
+
+def generar_lote(workload, count, rng):
+    """
+    Genera un lote de listas según la carga de trabajo.
+
+    Args:
+        workload (str): 'cortos' o 'mixtos'
+        count (int): Número de listas
+        rng (random.Random): Generador de números aleatorios
+
+    Returns:
+        list: Lista de listas
+    """
+    lote = []
+    for _ in range(count):
+        if workload == 'cortos':
+            n = rng.randint(2, 20)
+            lote.append([rng.randrange(1000) for _ in range(n)])
+        else:
+            n = rng.randint(2, 20) if rng.random() < 0.8 else rng.randint(21, 200)
+            lote.append([rng.random() for _ in range(n)])
+    return lote
+
+
+def cronometrar(func, preparar, repeats=3):
+    """Mejor tiempo de ``func(datos)`` con datos nuevos de ``preparar()`` en cada ejecución."""
+    mejor = float('inf')
+    for _ in range(repeats):
+        datos = preparar()
+        inicio = time.perf_counter()
+        func(datos)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def benchmark_batch(count=100000, workers=4):
+    """
+    Mide el rendimiento de cada forma de ordenar el lote.
+
+    Args:
+        count (int): Número de arreglos por lote
+        workers (int): Procesos del modo multiproceso
+
+    Returns:
+        list: Filas [carga, método, tiempo, arreglos por segundo, aceleración]
+    """
+    def bucle(lote):
+        for arr in lote:
+            geoflux_sort(arr)
+
+    results = []
+    for workload in ['cortos', 'mixtos']:
+        lote = generar_lote(workload, count, random.Random(0))
+        metodos = [
+            ("bucle geoflux_sort", bucle),
+            ("geoflux_sort_many", geoflux_sort_many),
+            (f"geoflux_sort_many ({workers} procesos)",
+             lambda l: geoflux_sort_many(l, workers=workers)),
+        ]
+        base = None
+        for nombre, func in metodos:
+            tiempo = cronometrar(func, lambda: [list(arr) for arr in lote])
+            base = base or tiempo
+            results.append([workload, nombre, f"{tiempo * 1000:.0f}",
+                            f"{count / tiempo:,.0f}", f"{base / tiempo:.1f}x"])
+
+    matriz = np.random.default_rng(0).random((count, 16))
+    tiempo_bucle = cronometrar(bucle, matriz.tolist)
+    tiempo_filas = cronometrar(geoflux_sort_rows, matriz.copy)
+    results.append(["filas", "bucle geoflux_sort", f"{tiempo_bucle * 1000:.0f}",
+                    f"{count / tiempo_bucle:,.0f}", "1.0x"])
+    results.append(["filas", "geoflux_sort_rows", f"{tiempo_filas * 1000:.0f}",
+                    f"{count / tiempo_filas:,.0f}", f"{tiempo_bucle / tiempo_filas:.1f}x"])
+    return results
+
+
+if __name__ == "__main__":
+    count = 100000
+    print(f"Ordenando lotes de {count} arreglos pequeños...")
+    results = benchmark_batch(count)
+    print(tabulate(
+        results,
+        headers=["Carga", "Método", "Tiempo (ms)", "Arreglos/s", "Aceleración"],
+        tablefmt="grid",
+    ))
@@ -0,0 +1,115 @@
+"""
+Benchmark de memoria y tiempo al ordenar búferes tipados.
+
+Este script compara dos formas de ordenar un ``array.array``:
+    1. Ida y vuelta por lista: ``tolist()``, ``geoflux_sort`` sobre la
+       lista (con ``engine='auto'``) y copia del resultado al búfer
+    2. Ordenamiento in-place a través del búfer: ``geoflux_sort(buf)``
+       envuelve la memoria del arreglo en una vista de NumPy sin copiarla
+
+La memoria adicional se mide con ``tracemalloc`` (pico de bytes reservados
+durante el ordenamiento, dividido entre el número de elementos). Un
+``float`` de Python ocupa 24 bytes más 8 del puntero de la lista, frente a
+los 8 bytes del valor en el búfer; el ordenamiento del búfer solo reserva
+las máscaras e índices temporales del motor vectorizado.
+
+Ejecutar:
+    python examples/benchmark_buffers.py
+
+Requisitos:
+    pip install numpy tabulate
+"""
+
+import sys
+import os
+import time
+import tracemalloc
+from array import array
+from tabulate import tabulate
+
+# Añadir el directorio raíz del proyecto al PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from geoflux_sorter import geoflux_sort
+from geoflux_sorter.bench import generate_workload
+
+
+def ordenar_por_lista(buf):
+    """Ordena un ``array.array`` pasando por una lista de objetos de Python."""
+    lista = buf.tolist()
+    geoflux_sort(lista, engine='auto')
+    buf[:] = array(buf.typecode, lista)
+
+
+def ordenar_bufer(buf):
+    """Ordena un ``array.array`` in-place a través de su búfer."""
+    geoflux_sort(buf)
+
+
+def medir(func, datos, typecode):
+    """
+    Mide el pico de memoria adicional y el tiempo de un ordenamiento.
+
+    La memoria y el tiempo se miden en ejecuciones separadas para que el
+    rastreo de ``tracemalloc`` no infle los tiempos.
+
+    Returns:
+        tuple: (bytes por elemento, segundos)
+    """
+    buf = array(typecode, datos)
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    func(buf)
+    pico = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+
+    buf = array(typecode, datos)
+    inicio = time.perf_counter()
+    func(buf)
+    tiempo = time.perf_counter() - inicio
+
+    assert buf.tolist() == sorted(datos)
+    return pico / len(datos), tiempo
+
+
+def benchmark_buffers(sizes=[100000, 500000]):
+    """
+    Compara la ida y vuelta por lista con el ordenamiento del búfer.
+
+    Args:
+        sizes (list): Tamaños de los arreglos a probar
+
+    Returns:
+        list: Filas [carga, tipo, tamaño, bytes/elem lista, bytes/elem
+            búfer, tiempo lista, tiempo búfer]
+    """
+    casos = [
+        ('nearly_sorted', 'd', float),
+        ('few_unique', 'q', int),
+        ('random', 'd', float),
+    ]
+    results = []
+    for size in sizes:
+        for workload, typecode, conversion in casos:
+            datos = [conversion(x) for x in generate_workload(workload, size)]
+            memoria_lista, tiempo_lista = medir(ordenar_por_lista, datos, typecode)
+            memoria_bufer, tiempo_bufer = medir(ordenar_bufer, datos, typecode)
+            results.append([
+                workload, typecode, size,
+                f"{memoria_lista:.1f}", f"{memoria_bufer:.1f}",
+                f"{tiempo_lista:.4f}", f"{tiempo_bufer:.4f}",
+            ])
+    return results
+
+
+if __name__ == "__main__":
+    print("Comparando la ida y vuelta por lista con el ordenamiento del búfer...")
+    results = benchmark_buffers()
+    print(tabulate(
+        results,
+        headers=["Carga", "Tipo", "Tamaño", "B/elem lista", "B/elem búfer",
+                 "Lista (s)", "Búfer (s)"],
+        tablefmt="grid",
+    ))
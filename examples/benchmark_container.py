@@ -0,0 +1,105 @@
+"""
+Benchmark de GeoFluxList frente a reordenar la lista completa.
+
+Este script simula un flujo constante de inserciones sobre una lista
+ordenada y compara dos estrategias:
+    1. Añadir cada valor y llamar a geoflux_sort sobre toda la lista
+    2. Insertar en un GeoFluxList (búfer + migración por grupos)
+
+Cada cierto número de inserciones se realiza una consulta de rango, que
+obliga a GeoFluxList a integrar su búfer.
+
+Ejecutar:
+    python examples/benchmark_container.py
+
+Requisitos:
+    pip install tabulate
+"""
+
+import random
+import sys
+import os
+import time
+from bisect import bisect_left, bisect_right
+
+from tabulate import tabulate
+
+# Añadir el directorio raíz del proyecto al PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from geoflux_sorter import geoflux_sort, GeoFluxList
+
+
+def resort_strategy(initial, inserts, query_every):
+    """
+    Inserta con append + geoflux_sort completo tras cada valor.
+
+    Args:
+        initial (list): Valores iniciales
+        inserts (list): Valores a insertar
+        query_every (int): Inserciones entre consultas de rango
+
+    Returns:
+        float: Tiempo en segundos
+    """
+    data = list(initial)
+    geoflux_sort(data)
+    start_time = time.perf_counter()
+    for count, value in enumerate(inserts, 1):
+        data.append(value)
+        geoflux_sort(data)
+        if count % query_every == 0:
+            bisect_right(data, 750) - bisect_left(data, 250)
+    return time.perf_counter() - start_time
+
+
+def container_strategy(initial, inserts, query_every):
+    """
+    Inserta en un GeoFluxList.
+
+    Args:
+        initial (list): Valores iniciales
+        inserts (list): Valores a insertar
+        query_every (int): Inserciones entre consultas de rango
+
+    Returns:
+        float: Tiempo en segundos
+    """
+    container = GeoFluxList(initial)
+    start_time = time.perf_counter()
+    for count, value in enumerate(inserts, 1):
+        container.add(value)
+        if count % query_every == 0:
+            container.count_range(250, 750)
+    return time.perf_counter() - start_time
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("BENCHMARK - GEOFLUXLIST vs. REORDENAR LA LISTA COMPLETA")
+    print("=" * 70 + "\n")
+
+    num_inserts = 2000
+    query_every = 500
+    results = []
+
+    for size in [1000, 10000, 50000]:
+        print(f"Probando tamaño inicial {size}...", end=" ")
+        initial = [random.randint(0, 1000) for _ in range(size)]
+        inserts = [random.randint(0, 1000) for _ in range(num_inserts)]
+
+        resort_time = resort_strategy(initial, inserts, query_every)
+        container_time = container_strategy(initial, inserts, query_every)
+
+        results.append([
+            size,
+            f"{resort_time / num_inserts * 1e6:.1f}µs",
+            f"{container_time / num_inserts * 1e6:.1f}µs",
+            f"{resort_time / container_time:.1f}x"
+        ])
+        print("Completado")
+
+    headers = ["Tamaño inicial", "Reordenar (por inserción)", "GeoFluxList (por inserción)", "Aceleración"]
+    print("\n" + tabulate(results, headers=headers, tablefmt="grid"))
@@ -0,0 +1,110 @@
+"""
+Benchmark de exportación de animaciones.
+
+Este script compara el tiempo de exportar los mismos frames de GeoFlux Sort
+con dos caminos:
+    1. matplotlib: figura completa por frame y ``FuncAnimation.save``
+       (ffmpeg si está instalado; si no, PillowWriter a GIF)
+    2. Renderizador rasterizado: barras dibujadas en búferes de NumPy y
+       escritas como GIF, secuencia de PNG o frames RGB crudos
+
+Ejecutar:
+    python examples/benchmark_export.py [frames]
+
+Requisitos:
+    pip install matplotlib pillow tabulate
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from itertools import islice
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import matplotlib.animation as animation
+from tabulate import tabulate
+
+# Añadir el directorio raíz del proyecto al PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from geoflux_sorter import geoflux_sort_generator, export_geoflux_animation
+from geoflux_sorter.animator import create_bar_plot, update_plot
+
+
+def export_matplotlib(data, num_frames, directory):
+    """
+    Exporta los frames con la figura de matplotlib y FuncAnimation.save.
+
+    Args:
+        data (list): Valores a animar
+        num_frames (int): Número de frames a exportar
+        directory (str): Directorio de salida
+
+    Returns:
+        tuple: (tiempo en segundos, nombre del writer)
+    """
+    fig, renderer = create_bar_plot(data, blit=False)
+    frames = list(islice(geoflux_sort_generator(data, frames='delta'), num_frames))
+    ani = animation.FuncAnimation(
+        fig, update_plot, frames=frames, fargs=(renderer,),
+        blit=False, interval=50, repeat=False
+    )
+    if animation.writers.is_available('ffmpeg'):
+        writer, path = 'ffmpeg', os.path.join(directory, 'matplotlib.mp4')
+    else:
+        writer, path = animation.PillowWriter(fps=20), os.path.join(directory, 'matplotlib.gif')
+
+    start_time = time.perf_counter()
+    ani.save(path, writer=writer)
+    elapsed = time.perf_counter() - start_time
+    plt.close(fig)
+    return elapsed, 'ffmpeg' if writer == 'ffmpeg' else 'PillowWriter'
+
+
+def export_raster(data, num_frames, path, fmt):
+    """
+    Exporta los frames con el renderizador rasterizado.
+
+    Args:
+        data (list): Valores a animar
+        num_frames (int): Número de frames a exportar
+        path (str): Destino de la exportación
+        fmt (str): 'gif', 'png' o 'raw'
+
+    Returns:
+        float: Tiempo en segundos
+    """
+    start_time = time.perf_counter()
+    export_geoflux_animation(data, path, format=fmt, interval=50, max_frames=num_frames)
+    return time.perf_counter() - start_time
+
+
+if __name__ == "__main__":
+    num_frames = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    data = [random.randint(1, 100) for _ in range(100)]
+
+    print("=" * 60)
+    print(f"BENCHMARK - EXPORTACIÓN DE {num_frames} FRAMES (100 elementos)")
+    print("=" * 60 + "\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        print("Exportando con matplotlib...", end=" ")
+        base_time, writer = export_matplotlib(data, num_frames, directory)
+        print("Completado")
+        results = [[f"matplotlib ({writer})", f"{base_time:.3f}s", f"{num_frames / base_time:.1f}", "1.0x"]]
+
+        for fmt, target in [('gif', 'raster.gif'), ('png', 'png_frames'), ('raw', 'raster.raw')]:
+            print(f"Exportando raster {fmt}...", end=" ")
+            elapsed = export_raster(data, num_frames, os.path.join(directory, target), fmt)
+            results.append([f"raster ({fmt})", f"{elapsed:.3f}s", f"{num_frames / elapsed:.1f}",
+                            f"{base_time / elapsed:.1f}x"])
+            print("Completado")
+
+    headers = ["Camino", "Tiempo", "Frames/s", "Aceleración"]
+    print("\n" + tabulate(results, headers=headers, tablefmt="grid"))
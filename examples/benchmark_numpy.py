@@ -0,0 +1,95 @@
+"""
+Script de benchmark para comparar el motor de listas con el motor NumPy.
+
+Este script mide el tiempo de GeoFlux Sort sobre listas de Python frente
+al motor vectorizado geoflux_sort_numpy sobre numpy.ndarray, con datos
+aleatorios enteros y flotantes. Para tamaños grandes (10^6 elementos) solo
+se ejecuta el motor NumPy, ya que el motor de listas es O(n²).
+
+Ejecutar:
+    python examples/benchmark_numpy.py
+
+Requisitos:
+    pip install numpy tabulate
+"""
+
+import random
+import time
+import sys
+import os
+
+import numpy as np
+from tabulate import tabulate
+
+# Añadir el directorio raíz del proyecto al PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from geoflux_sorter import geoflux_sort, geoflux_sort_numpy
+
+
+def measure(algorithm, data):
+    """
+    Mide el tiempo de ejecución de un algoritmo sobre una copia de los datos.
+
+    Args:
+        algorithm (callable): Función de ordenamiento in-place
+        data (list | numpy.ndarray): Datos a ordenar
+
+    Returns:
+        float: Tiempo en segundos
+    """
+    data_copy = data.copy()
+    start_time = time.perf_counter()
+    algorithm(data_copy)
+    return time.perf_counter() - start_time
+
+
+def benchmark_engines(list_sizes, numpy_only_sizes):
+    """
+    Ejecuta la comparación entre ambos motores.
+
+    Args:
+        list_sizes (list): Tamaños en los que se miden ambos motores
+        numpy_only_sizes (list): Tamaños en los que solo se mide el motor NumPy
+
+    Returns:
+        list: Filas con [tamaño, tipo, lista, numpy, aceleración]
+    """
+    results = []
+
+    for size in list_sizes + numpy_only_sizes:
+        print(f"Probando tamaño {size}...", end=" ")
+
+        int_data = np.array(random.sample(range(1, size * 10), size), dtype=np.int64)
+        float_data = np.random.default_rng(size).random(size)
+
+        for label, data in (("int64", int_data), ("float64", float_data)):
+            numpy_time = measure(geoflux_sort_numpy, data)
+
+            if size in list_sizes:
+                list_time = measure(geoflux_sort, data.tolist())
+                results.append([
+                    size, label,
+                    f"{list_time:.6f}s",
+                    f"{numpy_time:.6f}s",
+                    f"{list_time / numpy_time:.1f}x"
+                ])
+            else:
+                results.append([size, label, "-", f"{numpy_time:.6f}s", "-"])
+
+        print("Completado")
+
+    return results
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("BENCHMARK - GEOFLUX LISTAS vs. GEOFLUX NUMPY")
+    print("=" * 70 + "\n")
+
+    results = benchmark_engines([1000, 2000, 5000], [100000, 1000000])
+
+    headers = ["Tamaño", "Tipo", "GeoFlux (lista)", "GeoFlux (NumPy)", "Aceleración"]
+    print("\n" + tabulate(results, headers=headers, tablefmt="grid"))
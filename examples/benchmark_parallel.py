@@ -0,0 +1,80 @@
+"""
+Benchmark de escalabilidad de geoflux_sort_parallel.
+
+Este script mide el tiempo de geoflux_sort_parallel sobre el mismo arreglo
+aleatorio variando el número de procesos, y muestra la aceleración respecto
+a la ejecución con un solo proceso (equivalente a geoflux_sort).
+
+Ejecutar:
+    python examples/benchmark_parallel.py [tamaño]
+
+Requisitos:
+    pip install tabulate
+"""
+
+import os
+import random
+import sys
+import time
+
+from tabulate import tabulate
+
+# Añadir el directorio raíz del proyecto al PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from geoflux_sorter import geoflux_sort_parallel
+
+
+def benchmark_scaling(size, worker_counts):
+    """
+    Mide el tiempo de ordenamiento para cada número de procesos.
+
+    Args:
+        size (int): Número de elementos del arreglo
+        worker_counts (list): Números de procesos a probar
+
+    Returns:
+        list: Filas con [procesos, tiempo, aceleración]
+    """
+    data = random.sample(range(1, size * 10), size)
+    expected = sorted(data)
+    results = []
+    baseline = None
+
+    for workers in worker_counts:
+        print(f"Probando {workers} proceso(s)...", end=" ")
+        data_copy = list(data)
+
+        start_time = time.perf_counter()
+        geoflux_sort_parallel(data_copy, workers=workers)
+        elapsed = time.perf_counter() - start_time
+
+        assert data_copy == expected
+        if baseline is None:
+            baseline = elapsed
+        results.append([workers, f"{elapsed:.4f}s", f"{baseline / elapsed:.2f}x"])
+        print("Completado")
+
+    return results
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 40000
+
+    # Potencias de dos hasta el número de núcleos disponibles
+    max_workers = os.cpu_count() or 1
+    worker_counts = [1]
+    while worker_counts[-1] * 2 <= max(max_workers, 8):
+        worker_counts.append(worker_counts[-1] * 2)
+
+    print("=" * 60)
+    print(f"ESCALABILIDAD - GEOFLUX PARALELO ({size} elementos, {max_workers} núcleos)")
+    print("=" * 60 + "\n")
+
+    results = benchmark_scaling(size, worker_counts)
+
+    print("\n" + tabulate(results, headers=["Procesos", "Tiempo", "Aceleración"], tablefmt="grid"))
+    print("\nNota: con más particiones que núcleos la aceleración proviene solo")
+    print("de reducir el trabajo O(n²) de cada partición.")
@@ -0,0 +1,76 @@
+"""
+Benchmark del ordenamiento parcial, la selección del k-ésimo y el top-k.
+
+Este script compara, para k mucho menor que n, el ordenamiento completo con
+las funciones que solo ordenan la región pedida:
+    1. geoflux_sort completo (engine='auto', que elige el mejor motor)
+    2. geoflux_partial_sort: los k menores, en orden, al inicio
+    3. geoflux_nth_element: el valor de la posición k
+    4. geoflux_topk: los k mayores en una lista nueva
+
+Cada caso se mide con ``geoflux_sorter.bench.measure`` (calentamiento,
+varias repeticiones y una copia nueva de los datos en cada ejecución); la
+tabla muestra la mediana en milisegundos y la aceleración del ordenamiento
+parcial frente al completo.
+
+Ejecutar:
+    python examples/benchmark_partial.py
+
+Requisitos:
+    pip install tabulate
+"""
+
+import sys
+import os
+from tabulate import tabulate
+
+# Añadir el directorio raíz del proyecto al PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from geoflux_sorter import geoflux_sort, geoflux_partial_sort, geoflux_nth_element, geoflux_topk
+from geoflux_sorter.bench import generate_workload, measure
+
+
+def benchmark_partial(size=100000, ks=[10, 100, 1000],
+                      workloads=['random', 'gaussian', 'nearly_sorted', 'clustered'], repeats=5):
+    """
+    Compara el ordenamiento completo con las consultas parciales.
+
+    Args:
+        size (int): Número de elementos
+        ks (list): Valores de k a probar
+        workloads (list): Cargas de trabajo de ``geoflux_sorter.bench``
+        repeats (int): Repeticiones medidas por caso
+
+    Returns:
+        list: Filas [carga, k, completo, parcial, k-ésimo, top-k, aceleración]
+    """
+    results = []
+    for workload in workloads:
+        data = generate_workload(workload, size)
+        completo = measure(lambda a: geoflux_sort(a, engine='auto'), data, repeats=repeats)['median']
+        for k in ks:
+            parcial = measure(lambda a: geoflux_partial_sort(a, k), data, repeats=repeats)['median']
+            kesimo = measure(lambda a: geoflux_nth_element(a, k), data, repeats=repeats)['median']
+            topk = measure(lambda a: geoflux_topk(a, k), data, repeats=repeats)['median']
+            results.append([
+                workload, k,
+                f"{completo * 1000:.1f}", f"{parcial * 1000:.1f}",
+                f"{kesimo * 1000:.1f}", f"{topk * 1000:.1f}",
+                f"{completo / parcial:.1f}x",
+            ])
+    return results
+
+
+if __name__ == "__main__":
+    size = 100000
+    print(f"Comparando consultas parciales con el ordenamiento completo (n = {size})...")
+    results = benchmark_partial(size)
+    print(tabulate(
+        results,
+        headers=["Carga", "k", "Completo (ms)", "Parcial (ms)", "k-ésimo (ms)",
+                 "Top-k (ms)", "Aceleración"],
+        tablefmt="grid",
+    ))
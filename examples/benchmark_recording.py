@@ -0,0 +1,111 @@
+"""
+Benchmark de las grabaciones con fotogramas clave frente a regenerar los pasos.
+
+Este script graba una ejecución completa con record_sort y compara:
+    1. Llegar a un paso ejecutando geoflux_sort_generator desde el principio
+       (frames='delta' con FrameReplayer)
+    2. SortRecording.seek hacia pasos aleatorios
+    3. SortRecording.seek al paso anterior (retroceder un paso al recorrer
+       la animación hacia atrás)
+
+También muestra el tamaño del archivo frente a los bytes que ocuparían
+todos los estados completos (n valores de 8 bytes por paso).
+
+Ejecutar:
+    python examples/benchmark_recording.py
+
+Requisitos:
+    pip install tabulate numpy
+"""
+
+import sys
+import os
+import random
+import tempfile
+import time
+from tabulate import tabulate
+
+# Añadir el directorio raíz del proyecto al PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from geoflux_sorter import geoflux_sort_generator, FrameReplayer, record_sort, SortRecording
+from geoflux_sorter.bench import generate_workload
+
+
+def regenerar_hasta(datos, paso):
+    """Ejecuta el generador desde el principio hasta ``paso``; devuelve el tiempo."""
+    inicio = time.perf_counter()
+    reproductor = FrameReplayer()
+    for indice, estado in enumerate(geoflux_sort_generator(datos, frames='delta')):
+        reproductor.apply(estado)
+        if indice == paso:
+            break
+    return time.perf_counter() - inicio
+
+
+# (carga, tamaño): el generador con pasos de comparación es cuadrático en
+# datos aleatorios, por lo que esa carga usa tamaños menores
+CASOS = [('random', 1000), ('random', 2000), ('nearly_sorted', 5000), ('nearly_sorted', 20000)]
+
+
+def benchmark_recording(casos=CASOS, seeks=100):
+    """
+    Mide grabación, tamaño y acceso aleatorio para cada carga de trabajo.
+
+    Args:
+        casos (list): Pares (carga de ``geoflux_sorter.bench``, tamaño)
+        seeks (int): Saltos aleatorios medidos por grabación
+
+    Returns:
+        list: Filas [carga, n, pasos, archivo, estados completos, grabar,
+            regenerar, seek medio, retroceder]
+    """
+    results = []
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, 'ejecucion.gfr')
+        for workload, size in casos:
+            datos = generate_workload(workload, size)
+
+            inicio = time.perf_counter()
+            pasos = record_sort(datos, ruta)
+            tiempo_grabar = time.perf_counter() - inicio
+
+            objetivo = pasos * 9 // 10
+            tiempo_regenerar = regenerar_hasta(datos, objetivo)
+
+            with SortRecording(ruta) as grabacion:
+                inicio = time.perf_counter()
+                for _ in range(seeks):
+                    grabacion.seek(rng.randrange(pasos))
+                tiempo_seek = (time.perf_counter() - inicio) / seeks
+
+                grabacion.seek(objetivo)
+                inicio = time.perf_counter()
+                for paso in range(objetivo - 1, max(objetivo - 1 - seeks, -1), -1):
+                    grabacion.seek(paso)
+                tiempo_atras = (time.perf_counter() - inicio) / min(seeks, objetivo)
+
+            results.append([
+                workload, size, pasos,
+                f"{os.path.getsize(ruta) / 2 ** 20:.1f} MiB",
+                f"{pasos * size * 8 / 2 ** 20:,.0f} MiB",
+                f"{tiempo_grabar * 1000:.0f}",
+                f"{tiempo_regenerar * 1000:.0f}",
+                f"{tiempo_seek * 1000:.2f}",
+                f"{tiempo_atras * 1000:.2f}",
+            ])
+    return results
+
+
+if __name__ == "__main__":
+    print("Grabando ejecuciones y midiendo el acceso aleatorio a sus pasos...")
+    results = benchmark_recording()
+    print(tabulate(
+        results,
+        headers=["Carga", "n", "Pasos", "Archivo", "Estados completos", "Grabar (ms)",
+                 "Regenerar hasta 90% (ms)", "seek medio (ms)", "Retroceder 1 paso (ms)"],
+        tablefmt="grid",
+    ))
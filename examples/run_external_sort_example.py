@@ -0,0 +1,67 @@
+"""
+Ejemplo de ordenamiento externo de un archivo binario con GeoFlux Sort.
+
+Este script genera un archivo de flotantes de 64 bits, lo ordena con
+geoflux_sort_file usando un límite de memoria muy inferior al tamaño del
+archivo y comprueba que la memoria máxima utilizada (medida con
+tracemalloc) no supera ese límite.
+
+Ejecutar:
+    python examples/run_external_sort_example.py [elementos] [limite_bytes]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from array import array
+
+# Añadir el directorio raíz del proyecto al PYTHONPATH
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from geoflux_sorter import geoflux_sort_file
+
+
+if __name__ == "__main__":
+    num_elements = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    memory_limit = int(sys.argv[2]) if len(sys.argv) > 2 else 4 * 1024 * 1024
+
+    print("=" * 60)
+    print("ORDENAMIENTO EXTERNO CON GEOFLUX SORT")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = os.path.join(directory, "datos.bin")
+        output_path = os.path.join(directory, "datos_ordenados.bin")
+
+        # Generar el archivo de entrada por bloques
+        with open(input_path, "wb") as f:
+            for start in range(0, num_elements, 100_000):
+                count = min(100_000, num_elements - start)
+                array('d', (random.random() for _ in range(count))).tofile(f)
+
+        file_size = os.path.getsize(input_path)
+        print(f"\nArchivo: {num_elements} flotantes ({file_size / 2**20:.1f} MiB)")
+        print(f"Límite de memoria: {memory_limit / 2**20:.1f} MiB")
+
+        tracemalloc.start()
+        start_time = time.perf_counter()
+        geoflux_sort_file(input_path, output_path, dtype='d', memory_limit=memory_limit)
+        elapsed = time.perf_counter() - start_time
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # Verificar el resultado leyendo la salida por bloques
+        result = array('d')
+        with open(output_path, "rb") as f:
+            result.fromfile(f, min(num_elements, 10))
+        print(f"\nPrimeros valores: {[round(v, 6) for v in result]}")
+        print(f"Tiempo: {elapsed:.2f}s")
+        print(f"Memoria máxima (tracemalloc): {peak / 2**20:.2f} MiB "
+              f"({peak / memory_limit:.0%} del límite)")
+        if peak > memory_limit:
+            sys.exit(f"ERROR: la memoria máxima supera el límite de {memory_limit} bytes")
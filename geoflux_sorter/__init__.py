@@ -7,12 +7,52 @@ similares y los migra como unidades hacia sus posiciones correctas.
 
 Módulos principales:
     - algorithm: Implementación del algoritmo de ordenamiento
+    - batch: Ordenamiento por lotes de muchos arreglos pequeños
+    - aio: Ordenamiento desde corrutinas de asyncio sin bloquear el bucle
+    - frames: Reconstrucción de estados a partir de pasos delta
+    - recording: Grabaciones binarias de una ejecución con acceso aleatorio
+    - lexsort: Ordenamiento lexicográfico por varias columnas
+    - permutation: Aplicación de permutaciones a columnas paralelas
+    - selection: Ordenamiento parcial, k-ésimo elemento y top-k
+    - numpy_engine: Motor vectorizado para arreglos de NumPy
+    - parallel: Ordenamiento multinúcleo con particiones y fusión k-way
+    - external: Ordenamiento de archivos binarios más grandes que la memoria
+    - container: Lista ordenada con inserciones incrementales
+    - analysis: Perfil de preordenamiento y elección del motor
+    - counting: Ordenamiento por conteo para enteros de rango acotado
+    - stats: Contadores de operaciones del algoritmo
+    - tracing: Trazas de fases (trace-event JSON de Chrome) y perfilado
+    - bench: Benchmarks reproducibles con resultados en JSON
+    - palette: Colores compartidos por las visualizaciones
     - animator: Sistema de visualización y animación
+    - raster: Exportación de animaciones sin matplotlib (GIF, PNG, RGB crudo)
 
 Funciones exportadas:
-    - geoflux_sort: Ordena un arreglo in-place
+    - geoflux_sort: Ordena in-place una lista o un búfer tipado (array.array, memoryview)
+    - geoflux_argsort: Devuelve la permutación que ordena unas claves
+    - geoflux_lexsort: Permutación que ordena filas por varias columnas clave
+    - apply_permutation: Reordena columnas paralelas con una permutación
+    - geoflux_partial_sort: Ordena solo los k menores al inicio del arreglo
+    - geoflux_nth_element: Coloca el k-ésimo valor en su posición (percentiles)
+    - geoflux_topk: Devuelve los k mayores o menores valores en orden
     - geoflux_sort_generator: Versión generadora para seguimiento paso a paso
+    - geoflux_sort_async: Corrutina que ordena cediendo el control o en un ejecutor
+    - geoflux_sort_many: Ordena un lote de listas pequeñas repartiendo el coste fijo
+    - geoflux_sort_rows: Ordena in-place cada fila de una matriz de NumPy
+    - analyze: Perfil de preordenamiento (tramos, rango, distintos, inversiones)
+    - FrameReplayer: Reconstruye el arreglo a partir de pasos delta
+    - expand_frames: Convierte pasos delta en estados completos
+    - record_sort: Graba una ejecución paso a paso en un archivo binario compacto
+    - SortRecording: Lee una grabación con mmap y salta a cualquier paso
+    - geoflux_sort_numpy: Ordena un numpy.ndarray in-place con operaciones vectorizadas
+    - geoflux_sort_parallel: Ordena una lista in-place usando varios procesos
+    - geoflux_sort_file: Ordena un archivo binario con memoria acotada
+    - GeoFluxList: Lista que se mantiene ordenada al insertar valores
     - create_geoflux_animation: Crea visualizaciones animadas del algoritmo
+    - create_recording_viewer: Recorre una grabación hacia delante y hacia atrás
+    - export_geoflux_animation: Exporta la animación dibujando en búferes de NumPy
+    - SortStats: Colector de estadísticas para geoflux_sort(stats=...)
+    - SortTrace: Registro de fases para geoflux_sort(trace=...)
 
 Ejemplo básico:
     >>> from geoflux_sorter import geoflux_sort
@@ -31,13 +71,50 @@ Versión: 1.0.0
 Licencia: MIT
 """
 
-from .algorithm import geoflux_sort, geoflux_sort_generator
-from .animator import create_geoflux_animation
+from .algorithm import geoflux_sort, geoflux_argsort, geoflux_sort_generator
+from .aio import geoflux_sort_async
+from .batch import geoflux_sort_many, geoflux_sort_rows
+from .analysis import analyze
+from .lexsort import geoflux_lexsort
+from .permutation import apply_permutation
+from .selection import geoflux_partial_sort, geoflux_nth_element, geoflux_topk
+from .frames import FrameReplayer, expand_frames
+from .recording import record_sort, SortRecording
+from .numpy_engine import geoflux_sort_numpy
+from .parallel import geoflux_sort_parallel
+from .external import geoflux_sort_file
+from .container import GeoFluxList
+from .stats import SortStats
+from .tracing import SortTrace
+from .animator import create_geoflux_animation, create_recording_viewer
+from .raster import export_geoflux_animation
 
 __all__ = [
     'geoflux_sort',
+    'geoflux_argsort',
+    'geoflux_lexsort',
+    'apply_permutation',
+    'geoflux_partial_sort',
+    'geoflux_nth_element',
+    'geoflux_topk',
     'geoflux_sort_generator',
-    'create_geoflux_animation'
+    'geoflux_sort_async',
+    'geoflux_sort_many',
+    'geoflux_sort_rows',
+    'analyze',
+    'FrameReplayer',
+    'expand_frames',
+    'record_sort',
+    'SortRecording',
+    'geoflux_sort_numpy',
+    'geoflux_sort_parallel',
+    'geoflux_sort_file',
+    'GeoFluxList',
+    'create_geoflux_animation',
+    'create_recording_viewer',
+    'export_geoflux_animation',
+    'SortStats',
+    'SortTrace'
 ]
 
 __version__ = '1.0.0'
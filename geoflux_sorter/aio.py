@@ -0,0 +1,142 @@
+"""
+Ordenamiento compatible con asyncio.
+
+``geoflux_sort_async`` ordena una lista sin bloquear el bucle de eventos
+durante toda la ejecución. Tiene dos modos:
+
+    - Cooperativo: recorre ``geoflux_sort_generator`` en modo 'delta' y
+      cede el control al bucle cada N pasos de comparación, o solo entre la
+      FASE 1 y la FASE 2 de cada pasada. Los tramos modificados se aplican
+      sobre una copia con ``FrameReplayer``.
+    - Delegado: las entradas grandes se ordenan con ``geoflux_sort`` en un
+      ejecutor de hilos o de procesos configurable.
+
+En ambos modos se ordena una copia y la lista original solo se reescribe
+al terminar, de modo que cancelar la tarea la deja intacta.
+"""
+
+import asyncio
+import functools
+
+from .algorithm import geoflux_sort, geoflux_sort_generator, _completar_con_respaldo, _presupuesto_trabajo
+from .frames import FrameReplayer
+
+# Pasos de comparación entre dos cesiones de control al bucle de eventos
+_CEDER_CADA = 1000
+
+# Tamaño a partir del cual la ordenación se delega a un ejecutor
+_UMBRAL_DELEGAR = 20000
+
+
+async def geoflux_sort_async(arr, key=None, reverse=False, yield_every=_CEDER_CADA,
+                             executor=None, offload_threshold=_UMBRAL_DELEGAR, progress=None):
+    """
+    Ordena una lista in-place desde una corrutina sin bloquear el bucle de eventos.
+
+    Las listas con menos de ``offload_threshold`` elementos se ordenan en
+    modo cooperativo: el generador paso a paso avanza entre cesiones de
+    control (``await asyncio.sleep(0)``), así que otras tareas se ejecutan
+    mientras dura la ordenación. El trabajo cooperativo está acotado como el
+    del núcleo: si los pasos superan el presupuesto O(n log n), el tramo aún
+    desordenado se termina con el ordenamiento de Python, que es breve.
+
+    Las listas más grandes se ordenan con ``geoflux_sort`` en ``executor``.
+    Con hilos, el núcleo comparte el GIL con el bucle de eventos y este solo
+    avanza en los cambios de hilo (cada 5 ms por defecto); un
+    ``ProcessPoolExecutor`` evita esa espera a cambio de copiar los datos al
+    proceso (los elementos y ``key`` deben poder serializarse con pickle).
+
+    Args:
+        arr (list): Lista a ordenar in-place.
+        key (callable, optional): Función que extrae la clave de cada
+            elemento, como en ``geoflux_sort``. Por defecto None.
+        reverse (bool, optional): Si es True, el resultado queda en orden
+            descendente. Por defecto False.
+        yield_every (int | None, optional): En modo cooperativo, número de
+            pasos de comparación entre cesiones de control. None cede solo
+            al inicio de cada fase (entre la FASE 1 y la FASE 2). Por defecto
+            1000.
+        executor (concurrent.futures.Executor, optional): Ejecutor del modo
+            delegado. Por defecto None (el ejecutor de hilos del bucle).
+        offload_threshold (int | None, optional): Longitud a partir de la
+            cual se delega la ordenación; 0 delega siempre y None nunca. Por
+            defecto 20000.
+        progress (callable, optional): Se llama con un diccionario tras cada
+            cesión de control y al terminar, con 'mode' ('cooperative' o
+            'executor'), 'steps' (pasos cedidos hasta el momento),
+            'pass_type' y 'status' del último paso. En modo delegado solo se
+            llama al terminar. Por defecto None.
+
+    Returns:
+        None: La lista se modifica directamente al terminar.
+
+    Raises:
+        ValueError: Si ``yield_every`` es menor que 1.
+        asyncio.CancelledError: Si la tarea se cancela; la lista queda sin
+            cambios. En modo delegado el trabajo ya iniciado en el ejecutor
+            continúa hasta terminar, pero su resultado se descarta.
+
+    Ejemplo:
+        >>> async def atender(datos):
+        ...     await geoflux_sort_async(datos, yield_every=500)
+        ...     return datos
+        >>> asyncio.run(atender([5, 2, 9, 1, 5, 6]))
+        [1, 2, 5, 5, 6, 9]
+    """
+    if yield_every is not None and yield_every < 1:
+        raise ValueError("yield_every debe ser al menos 1")
+
+    n = len(arr)
+    if offload_threshold is not None and n >= offload_threshold:
+        bucle = asyncio.get_running_loop()
+        ordenada = await bucle.run_in_executor(
+            executor, functools.partial(_ordenar_copia, list(arr), key, reverse)
+        )
+        arr[:] = ordenada
+        if progress is not None:
+            progress({'mode': 'executor', 'steps': 0,
+                      'pass_type': 'Finalizado', 'status': 'Arreglo Ordenado'})
+        return
+
+    if yield_every is None:
+        pasos = geoflux_sort_generator(arr, key=key, reverse=reverse, frames='delta',
+                                       granularity='pass')
+    else:
+        pasos = geoflux_sort_generator(arr, key=key, reverse=reverse, frames='delta',
+                                       granularity='comparison', every=yield_every)
+    reproductor = FrameReplayer()
+    presupuesto = _presupuesto_trabajo(n)
+    cedidos = 0
+    estado = None
+    for estado in pasos:
+        reproductor.apply(estado)
+        cedidos += 1
+        if progress is not None:
+            progress({'mode': 'cooperative', 'steps': cedidos,
+                      'pass_type': estado['pass_type'], 'status': estado['status']})
+        if estado['pass_type'] in ('Finalizado', 'Detenido'):
+            break
+        if yield_every is not None and cedidos * yield_every > presupuesto:
+            break
+        await asyncio.sleep(0)
+    pasos.close()
+
+    if estado is None or estado['pass_type'] != 'Finalizado':
+        # El generador no terminó (presupuesto o parada de seguridad): el tramo
+        # aún desordenado pasa al ordenamiento O(n log n), sin migrar más grupos
+        if reproductor.keys is None:
+            _completar_con_respaldo(reproductor.array, None)
+        else:
+            _completar_con_respaldo(reproductor.keys, reproductor.array)
+        if reverse:
+            reproductor.array.reverse()
+        if progress is not None:
+            progress({'mode': 'cooperative', 'steps': cedidos,
+                      'pass_type': 'Finalizado', 'status': 'Arreglo Ordenado'})
+    arr[:] = reproductor.array
+
+
+def _ordenar_copia(datos, key, reverse):
+    """Ordena una copia en el ejecutor y la devuelve (función serializable)."""
+    geoflux_sort(datos, key=key, reverse=reverse)
+    return datos
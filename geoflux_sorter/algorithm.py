@@ -1,29 +1,250 @@
-def geoflux_sort(arr):
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import partial
+from itertools import chain
+from operator import le
+
+from .analysis import analyze, choose_engine, natural_runs
+from .counting import counting_sort_applicable, _ordenar_por_conteo, _solo_enteros
+from .numpy_engine import _es_bufer, _ordenar_bufer
+from .stats import SortStats
+
+# Motores de geoflux_sort(engine=...)
+_MOTORES = ('geoflux', 'auto', 'runs', 'fallback')
+
+# Presupuesto de trabajo del núcleo, en múltiplos de n·log2(n) posiciones recorridas
+# o reescritas; al agotarlo, la sección desordenada pasa al ordenamiento de respaldo
+_FACTOR_PRESUPUESTO = 16
+
+# Niveles de detalle de geoflux_sort_generator; cada nivel incluye los anteriores
+_GRANULARIDADES = {'pass': 0, 'migration': 1, 'group': 2, 'comparison': 3}
+
+# Textos del estado final de geoflux_sort_generator según su operación
+_TEXTOS_FINALES = {
+    'trivial': 'Arreglo muy pequeño, ya ordenado',
+    'presorted': 'Arreglo ya ordenado',
+    'sorted': 'Arreglo Ordenado',
+}
+
+
+def geoflux_sort(arr, key=None, reverse=False, stats=None, trace=None, engine='geoflux'):
     """
     Ordena un arreglo in-place utilizando el algoritmo GeoFlux Sort.
     
     GeoFlux Sort es un algoritmo bidireccional que identifica grupos de elementos
     similares y los migra como unidades hacia sus posiciones correctas.
     
+    Cuando se indica ``key``, la función se evalúa exactamente una vez por
+    elemento y las claves se guardan en un arreglo auxiliar; el algoritmo
+    ordena esas claves junto con un arreglo compacto de índices y al final
+    reordena los registros de ``arr`` según esos índices. Las claves deben
+    admitir resta y ``abs`` (por ejemplo, números), ya que el umbral de
+    similitud se calcula a partir de su rango.
+    
     Args:
-        arr (list): Arreglo de elementos comparables a ordenar in-place.
+        arr (list | buffer): Arreglo de elementos comparables a ordenar
+            in-place. También acepta objetos con protocolo de búfer
+            unidimensional y escribible de enteros o flotantes
+            (``array.array``, ``memoryview``, ``bytearray``,
+            ``numpy.ndarray``), que se ordenan a través del búfer con el
+            motor vectorizado, sin crear una lista intermedia.
+        key (callable, optional): Función que extrae la clave de ordenamiento
+            de cada elemento. Por defecto None (se comparan los elementos).
+        reverse (bool, optional): Si es True, el resultado queda en orden
+            descendente. Por defecto False.
+        stats (SortStats, optional): Colector donde acumular los contadores
+            de operaciones (pasadas, grupos, comparaciones, desplazamientos
+            e histogramas de tamaños de grupo). Sin colector se ejecuta una
+            versión del núcleo sin contadores. Por defecto None.
+        trace (SortTrace, optional): Registro donde anotar la duración de
+            cada fase del ordenamiento, exportable como trace-event JSON de
+            Chrome. Por defecto None.
+        engine (str, optional): Motor de ordenamiento. 'geoflux' (por
+            defecto) usa la migración de grupos; 'auto' analiza el arreglo
+            con ``analyze`` (una pasada más muestreo) y elige con
+            ``choose_engine`` entre 'runs' (inversión de tramos descendentes
+            y fusión natural), 'geoflux' y 'fallback' (ordenamiento O(n log n)
+            de Python). También se puede forzar 'runs' o 'fallback'. La
+            elección queda en ``stats.engines`` y en la traza.
         
     Returns:
         None: El arreglo se modifica directamente.
+    
+    Raises:
+        ValueError: Si ``engine`` no es un motor conocido, o si un búfer no
+            es unidimensional, no es escribible o contiene NaN.
+        TypeError: Si se indica ``key`` con un búfer o el formato del búfer
+            no es numérico.
         
     Complejidad Temporal:
         - Mejor caso: O(n) para arreglos ya ordenados
-        - Caso promedio: O(n²)
-        - Peor caso: O(n²)
+        - Caso promedio: O(n log n); la migración de grupos es O(n²) sobre
+          datos aleatorios, pero su trabajo está acotado
+        - Peor caso: O(n log n). Cuando las posiciones recorridas y
+          reescritas superan un presupuesto proporcional a n·log2(n), o la
+          pasada siguiente lo superaría, la sección aún desordenada se
+          termina con el ordenamiento de Python (``stats.engines`` anota
+          'budget_fallback')
         
     Complejidad Espacial:
         - O(1) auxiliar (ordenamiento in-place)
+        - O(n) auxiliar si se indica ``key`` (claves e índices)
+        
+    Nota:
+        GeoFlux Sort no es estable: los elementos con claves iguales pueden
+        cambiar su orden relativo.
         
     Ejemplo:
         >>> datos = [5, 2, 9, 1, 5, 6]
         >>> geoflux_sort(datos)
         >>> print(datos)
         [1, 2, 5, 5, 6, 9]
+        >>> registros = [('b', 3.5), ('a', 1.2), ('c', 2.8)]
+        >>> geoflux_sort(registros, key=lambda r: r[1], reverse=True)
+        >>> print(registros)
+        [('b', 3.5), ('c', 2.8), ('a', 1.2)]
+    """
+    if engine not in _MOTORES:
+        raise ValueError(f"engine debe ser uno de {', '.join(_MOTORES)}; se recibió {engine!r}")
+    
+    # Búferes tipados (array.array, memoryview, bytearray, numpy): in-place sin listas
+    if not isinstance(arr, list) and _es_bufer(arr):
+        _ordenar_bufer_con_registro(arr, key, reverse, stats, trace)
+        return
+    
+    nucleo, stats = _preparar_nucleo(stats, trace, engine)
+    
+    if trace is not None:
+        t_total = trace.now()
+        pasadas_antes, migrados_antes = stats.passes, stats.groups_migrated
+    
+    if key is None:
+        nucleo(arr, None)
+        if reverse:
+            arr.reverse()
+    else:
+        # Extraer cada clave una sola vez; los índices viajan junto a las claves
+        if trace is not None:
+            t0 = trace.now()
+        claves = [key(elemento) for elemento in arr]
+        indices = array('q', range(len(arr)))
+        if trace is not None:
+            trace.complete('key_extraction', t0, n=len(arr))
+        nucleo(claves, indices)
+        
+        if reverse:
+            indices.reverse()
+        
+        # Reordenar los registros según la permutación obtenida
+        if trace is not None:
+            t0 = trace.now()
+        arr[:] = [arr[k] for k in indices]
+        if trace is not None:
+            trace.complete('reorder', t0, n=len(arr))
+    
+    if trace is not None:
+        trace.complete('geoflux_sort', t_total, n=len(arr), passes=stats.passes - pasadas_antes,
+                       groups_migrated=stats.groups_migrated - migrados_antes)
+
+
+def geoflux_argsort(keys, reverse=False, stats=None, trace=None, engine='geoflux'):
+    """
+    Devuelve la permutación que ordena ``keys`` sin mover los datos.
+    
+    El algoritmo ordena una copia de las claves junto con un arreglo
+    compacto de índices (``array('q')``, 8 bytes por elemento) que recibe
+    exactamente los mismos movimientos; ``keys`` no se modifica. La
+    permutación resultante se aplica a varias columnas paralelas con
+    ``apply_permutation``.
+    
+    Args:
+        keys (sequence): Claves comparables (lista, ``array.array``,
+            ``numpy.ndarray`` o cualquier secuencia). Deben admitir resta y
+            ``abs``, como las claves de ``geoflux_sort``.
+        reverse (bool, optional): Si es True, la permutación produce orden
+            descendente. Por defecto False.
+        stats (SortStats, optional): Colector de contadores, como en
+            ``geoflux_sort``. Por defecto None.
+        trace (SortTrace, optional): Registro de fases, como en
+            ``geoflux_sort``. Por defecto None.
+        engine (str, optional): Motor de ordenamiento, como en
+            ``geoflux_sort``. Por defecto 'geoflux'.
+    
+    Returns:
+        array.array: Índices de tipo 'q' tales que ``keys[p[0]],
+            keys[p[1]], ...`` queda ordenado.
+    
+    Raises:
+        ValueError: Si ``engine`` no es un motor conocido.
+    
+    Nota:
+        Como ``geoflux_sort``, no es estable: los índices de claves iguales
+        pueden quedar en cualquier orden relativo.
+    
+    Ejemplo:
+        >>> precios = [9.5, 3.0, 7.25]
+        >>> list(geoflux_argsort(precios))
+        [1, 2, 0]
+    """
+    if engine not in _MOTORES:
+        raise ValueError(f"engine debe ser uno de {', '.join(_MOTORES)}; se recibió {engine!r}")
+    
+    nucleo, stats = _preparar_nucleo(stats, trace, engine)
+    
+    if trace is not None:
+        t_total = trace.now()
+        pasadas_antes, migrados_antes = stats.passes, stats.groups_migrated
+    
+    # Copia de las claves: los búferes tipados se convierten de una vez con tolist()
+    claves = keys.tolist() if hasattr(keys, 'tolist') else list(keys)
+    indices = array('q', range(len(claves)))
+    nucleo(claves, indices)
+    if reverse:
+        indices.reverse()
+    
+    if trace is not None:
+        trace.complete('geoflux_argsort', t_total, n=len(claves),
+                       passes=stats.passes - pasadas_antes,
+                       groups_migrated=stats.groups_migrated - migrados_antes)
+    return indices
+
+
+def _preparar_nucleo(stats, trace, engine):
+    """
+    Elige el núcleo de ordenamiento según los colectores y el motor.
+    
+    Returns:
+        tuple: (núcleo, stats) donde el núcleo recibe ``(arr, acompanante)``
+            y ``stats`` es el colector recibido, uno nuevo si solo se pidió
+            la traza, o None.
+    """
+    # Sin colector ni registro se usa el núcleo sin contadores, sin coste adicional
+    if stats is None and trace is None:
+        nucleo = _geoflux_nucleo
+    else:
+        if stats is None:
+            # El núcleo con registro de fases también cuenta operaciones
+            stats = SortStats()
+        stats.sorts += 1
+        nucleo = partial(_geoflux_nucleo_contado, stats=stats, trace=trace)
+    
+    if engine != 'geoflux':
+        nucleo = partial(_despachar, nucleo=nucleo, engine=engine, stats=stats, trace=trace)
+    return nucleo, stats
+
+
+def _geoflux_nucleo(arr, acompanante):
+    """
+    Núcleo in-place de GeoFlux Sort.
+    
+    Esta versión no lleva contadores; ``_geoflux_nucleo_contado`` repite la
+    misma lógica registrando las operaciones en un ``SortStats``.
+    
+    Args:
+        arr (list): Valores comparables a ordenar in-place.
+        acompanante (list | array.array, optional): Secuencia paralela a
+            ``arr`` que recibe exactamente los mismos movimientos. None si
+            solo se ordena ``arr``.
     """
     n = len(arr)
     
@@ -51,16 +272,25 @@ def geoflux_sort(arr):
                 arr[j + 1] = arr[j]
                 j -= 1
             arr[j + 1] = key
+            if acompanante is not None:
+                # Repetir el mismo desplazamiento en la secuencia acompañante
+                acompanante[j + 1:i + 1] = acompanante[i:i + 1] + acompanante[j + 1:i]
         return
     
     # Calcular umbral adaptativo para determinar similitud entre elementos
     # El umbral se ajusta automáticamente según el rango de valores
-    rango = max(arr) - min(arr)
+    minimo, maximo = min(arr), max(arr)
+    rango = maximo - minimo
     
     # Si todos los elementos son iguales, el arreglo ya está ordenado
     if rango == 0:
         return
     
+    # Enteros de rango acotado: ordenamiento por conteo en O(n + rango)
+    if counting_sort_applicable(n, rango) and _solo_enteros(arr):
+        _ordenar_por_conteo(arr, minimo, maximo, acompanante)
+        return
+    
     # Umbral de similitud: 5% del rango de valores
     # Elementos cuya diferencia sea menor al umbral se consideran "similares"
     umbral_similitud = rango * 0.05
@@ -68,31 +298,77 @@ def geoflux_sort(arr):
     # Bucle principal: continúa mientras haya elementos que necesiten moverse
     elementos_desplazados_en_ciclo = True
     
+    # Fronteras asentadas que se conservan entre pasadas: arr[0..prefijo_asentado]
+    # y arr[sufijo_asentado..n-1] siguen ordenados desde la pasada anterior
+    prefijo_asentado = 0
+    sufijo_asentado = n - 1
+    
+    # Tramos sucios (a, b): solo en las posiciones x de estos tramos puede
+    # haber un descenso arr[x] < arr[x-1]. Fuera de ellos el arreglo no cambió
+    # desde que se comprobó ordenado, y las fases no lo vuelven a recorrer.
+    sucios = [(1, n - 1)]
+    
+    # Trabajo acumulado (posiciones recorridas en los tramos sucios y reescritas por
+    # las migraciones); acota el peor caso cuadrático a O(n log n)
+    presupuesto = _presupuesto_trabajo(n)
+    trabajo = 0
+    
     while elementos_desplazados_en_ciclo:
         elementos_desplazados_en_ciclo = False
         
         # Optimización: identificar y saltar secciones ya ordenadas
-        # Encuentra el punto hasta donde el arreglo está ordenado desde el inicio
-        seccion_ordenada_inicio = 0
+        # Encuentra el punto hasta donde el arreglo está ordenado desde el inicio,
+        # continuando desde la frontera asentada en la pasada anterior
+        seccion_ordenada_inicio = prefijo_asentado
         while seccion_ordenada_inicio + 1 < n and arr[seccion_ordenada_inicio] <= arr[seccion_ordenada_inicio + 1]:
             seccion_ordenada_inicio += 1
         
         # Encuentra el punto desde donde el arreglo está ordenado hasta el final
-        seccion_ordenada_fin = n - 1
+        seccion_ordenada_fin = sufijo_asentado
         while seccion_ordenada_fin > 0 and arr[seccion_ordenada_fin - 1] <= arr[seccion_ordenada_fin]:
             seccion_ordenada_fin -= 1
         
         # Si las secciones ordenadas se solapan, el arreglo completo está ordenado
         if seccion_ordenada_inicio >= seccion_ordenada_fin:
             return
+        trabajo_previo = trabajo
 
         # === FASE 1: FLUJO ASCENDENTE ===
         # Migra grupos de elementos pequeños hacia la izquierda del arreglo
         
+        # Tramos sucios entre las secciones ordenadas; los de fuera ya no tienen descensos
+        tramos, _ = _tramos_en_rango(sucios, seccion_ordenada_inicio + 1, seccion_ordenada_fin)
+        sucios = []
+        trabajo += sum(b - a + 1 for a, b in tramos)
+        t = 0
+        forzar_grupo = False
+        
+        # arr[0..limite_ordenado] está ordenado; crece a medida que los grupos migran
+        limite_ordenado = seccion_ordenada_inicio
+        
+        # Mayor índice modificado en esta fase (para conocer el sufijo aún ordenado)
+        max_modificado = -1
+        
         # Comenzar después de la sección ya ordenada al inicio
         i = max(1, seccion_ordenada_inicio + 1)
         
         while i < seccion_ordenada_fin + 1:
+            if not forzar_grupo:
+                # Saltar hasta el siguiente tramo sucio: lo de en medio no tiene descensos
+                while t < len(tramos) and tramos[t][1] < i:
+                    t += 1
+                if t == len(tramos):
+                    if limite_ordenado == i - 1:
+                        # No quedan descensos hasta el sufijo ordenado
+                        limite_ordenado = seccion_ordenada_fin
+                    break
+                if tramos[t][0] > i:
+                    if limite_ordenado == i - 1:
+                        # arr[i-1..a-1] está ordenado: la sección ordenada crece sin recorrerlo
+                        limite_ordenado = tramos[t][0] - 1
+                    i = tramos[t][0]
+            forzar_grupo = False
+            
             # Identificar un grupo de elementos con valores similares
             grupo_inicio = i
             grupo_fin = i
@@ -117,37 +393,113 @@ def geoflux_sort(arr):
                 min_valor = grupo_valores[0]
                 
                 # Encontrar la posición de inserción del grupo
-                # Buscar hacia atrás hasta encontrar un elemento menor o igual
+                # Buscar hacia atrás, de forma lineal, solo en la zona desordenada
                 j = grupo_inicio - 1
-                while j >= 0 and arr[j] > min_valor:
+                while j > limite_ordenado and arr[j] > min_valor:
                     j -= 1
                 
-                # La posición de inserción es justo después del último elemento menor
-                punto_insercion = j + 1
+                if j == limite_ordenado:
+                    # El recorrido alcanzó la sección ordenada: búsqueda por galope
+                    punto_insercion, _ = _galope_izquierda(arr, min_valor, limite_ordenado)
+                else:
+                    # La posición de inserción es justo después del último elemento menor
+                    punto_insercion = j + 1
                 
-                # Guardar los elementos que serán desplazados por el grupo
-                elementos_a_desplazar = arr[punto_insercion:grupo_inicio]
+                if acompanante is None:
+                    # Guardar los elementos que serán desplazados por el grupo
+                    elementos_a_desplazar = arr[punto_insercion:grupo_inicio]
+                    
+                    # Reconstruir el segmento: grupo ordenado + elementos desplazados
+                    nuevo_segmento = grupo_valores + elementos_a_desplazar
+                    
+                    # Fusionar el segmento: si un elemento del grupo supera a uno desplazado,
+                    # la simple concatenación reintroduce inversiones y el flujo opuesto
+                    # puede deshacer la migración indefinidamente. Timsort resuelve la
+                    # fusión en tiempo lineal cuando los desplazados ya estaban ordenados.
+                    nuevo_segmento.sort()
+                    
+                    # Aplicar los cambios al arreglo original
+                    arr[punto_insercion:grupo_fin + 1] = nuevo_segmento
+                else:
+                    # Mismo segmento (grupo + desplazados) expresado como posiciones
+                    _reubicar_segmento(arr, acompanante, punto_insercion, chain(
+                        range(grupo_inicio, grupo_fin + 1), range(punto_insercion, grupo_inicio)
+                    ))
+                max_modificado = max(max_modificado, grupo_fin)
                 
-                # Reconstruir el segmento: grupo ordenado + elementos desplazados
-                nuevo_segmento = grupo_valores + elementos_a_desplazar
+                # El segmento cambió y su borde derecho se compara con el grupo siguiente,
+                # que se procesa aunque no esté en un tramo sucio
+                sucios.append((punto_insercion, grupo_fin + 1))
+                forzar_grupo = True
                 
-                # Aplicar los cambios al arreglo original
-                for idx, val in enumerate(nuevo_segmento):
-                    arr[punto_insercion + idx] = val
+                # Si el grupo se insertó en la sección ordenada, ésta absorbe el segmento
+                if punto_insercion <= limite_ordenado + 1:
+                    limite_ordenado = grupo_fin
                 
                 # Marcar que se realizaron cambios en este ciclo
                 elementos_desplazados_en_ciclo = True
+                
+                # El segmento reescrito cuenta para el presupuesto de trabajo
+                trabajo += grupo_fin + 1 - punto_insercion
+                if trabajo > presupuesto:
+                    break
+            elif limite_ordenado == grupo_inicio - 1:
+                # El grupo continúa la sección ordenada: extenderla mientras siga ordenado
+                while limite_ordenado < grupo_fin and arr[limite_ordenado] <= arr[limite_ordenado + 1]:
+                    limite_ordenado += 1
+                # Si se detuvo dentro del grupo, el descenso queda pendiente para la FASE 2
+                if limite_ordenado < grupo_fin:
+                    sucios.append((limite_ordenado + 1, grupo_fin))
+            elif grupo_fin > grupo_inicio:
+                # Los descensos internos del grupo quedan pendientes para la FASE 2
+                segmento = arr[grupo_inicio:grupo_fin + 1]
+                if not all(map(le, segmento, segmento[1:])):
+                    sucios.append((grupo_inicio + 1, grupo_fin))
             
             # Avanzar al siguiente grupo (después del grupo actual)
             i = grupo_fin + 1
         
+        if trabajo > presupuesto:
+            # Peor caso: la sección aún desordenada pasa al ordenamiento O(n log n)
+            _completar_con_respaldo(arr, acompanante)
+            return
+        
         # === FASE 2: FLUJO DESCENDENTE ===
         # Migra grupos de elementos grandes hacia la derecha del arreglo
         
+        # Los tramos sucios fuera del rango de esta fase pasan a la pasada siguiente
+        tramos, sucios = _tramos_en_rango(sucios, seccion_ordenada_inicio + 1, seccion_ordenada_fin)
+        t = len(tramos) - 1
+        trabajo += sum(b - a + 1 for a, b in tramos)
+        forzar_grupo = False
+        
+        # arr[limite_ordenado_fin..n-1] está ordenado (excluyendo lo modificado en FASE 1)
+        limite_ordenado_fin = max(seccion_ordenada_fin, max_modificado + 1)
+        
+        # Menor índice modificado en esta fase (para conocer el prefijo aún ordenado)
+        min_modificado = n
+        
         # Comenzar antes de la sección ya ordenada al final
         i = min(n - 2, seccion_ordenada_fin - 1)
         
         while i >= seccion_ordenada_inicio:
+            if not forzar_grupo:
+                # Retroceder hasta el siguiente tramo sucio: un grupo que termina en i
+                # solo migra si hay un descenso en la posición i + 1
+                while t >= 0 and tramos[t][0] > i + 1:
+                    t -= 1
+                if t < 0:
+                    if limite_ordenado_fin == i + 1:
+                        # No quedan descensos desde el prefijo ordenado
+                        limite_ordenado_fin = seccion_ordenada_inicio
+                    break
+                if tramos[t][1] < i + 1:
+                    if limite_ordenado_fin == i + 1:
+                        # arr[b..i+1] está ordenado: la sección ordenada crece sin recorrerlo
+                        limite_ordenado_fin = tramos[t][1]
+                    i = tramos[t][1] - 1
+            forzar_grupo = False
+            
             # Identificar un grupo de elementos con valores similares
             grupo_inicio = i
             grupo_fin = i
@@ -172,28 +524,703 @@ def geoflux_sort(arr):
                 max_valor = grupo_valores[-1]
                 
                 # Encontrar la posición final para el grupo
-                # Buscar hacia adelante hasta encontrar un elemento mayor o igual
+                # Buscar hacia adelante, de forma lineal, solo en la zona desordenada
                 j = grupo_fin + 1
-                while j < n and arr[j] < max_valor:
+                while j < limite_ordenado_fin and arr[j] < max_valor:
                     j += 1
                 
-                # Guardar los elementos que serán desplazados por el grupo
-                elementos_a_desplazar = arr[grupo_fin + 1:j]
+                if j == limite_ordenado_fin and j < n:
+                    # El recorrido alcanzó la sección ordenada: búsqueda por galope
+                    j, _ = _galope_derecha(arr, max_valor, limite_ordenado_fin)
+                
+                if acompanante is None:
+                    # Guardar los elementos que serán desplazados por el grupo
+                    elementos_a_desplazar = arr[grupo_fin + 1:j]
+                    
+                    # Reconstruir el segmento: elementos desplazados + grupo ordenado
+                    nuevo_segmento = elementos_a_desplazar + grupo_valores
+                    
+                    # Fusionar el segmento (ver la FASE 1 de _geoflux_nucleo)
+                    nuevo_segmento.sort()
+                    
+                    # Aplicar los cambios al arreglo original
+                    arr[grupo_inicio:j] = nuevo_segmento
+                else:
+                    # Mismo segmento (desplazados + grupo) expresado como posiciones
+                    _reubicar_segmento(arr, acompanante, grupo_inicio, chain(
+                        range(grupo_fin + 1, j), range(grupo_inicio, grupo_fin + 1)
+                    ))
+                min_modificado = grupo_inicio
                 
-                # Reconstruir el segmento: elementos desplazados + grupo ordenado
-                nuevo_segmento = elementos_a_desplazar + grupo_valores
+                # El segmento cambió y su borde izquierdo se compara con el grupo anterior,
+                # que se procesa aunque no esté en un tramo sucio
+                sucios.append((grupo_inicio, min(j, n - 1)))
+                forzar_grupo = True
                 
-                # Aplicar los cambios al arreglo original
-                for idx, val in enumerate(nuevo_segmento):
-                    arr[grupo_inicio + idx] = val
+                # Si el grupo llegó a la sección ordenada final, ésta absorbe el segmento
+                if j >= limite_ordenado_fin:
+                    limite_ordenado_fin = grupo_inicio
                 
                 # Marcar que se realizaron cambios en este ciclo
                 elementos_desplazados_en_ciclo = True
+                
+                # El segmento reescrito cuenta para el presupuesto de trabajo
+                trabajo += j - grupo_inicio
+                if trabajo > presupuesto:
+                    break
+            elif limite_ordenado_fin == grupo_fin + 1:
+                # El grupo precede a la sección ordenada: extenderla mientras siga ordenado
+                while limite_ordenado_fin > grupo_inicio and arr[limite_ordenado_fin - 1] <= arr[limite_ordenado_fin]:
+                    limite_ordenado_fin -= 1
+                # Si se detuvo dentro del grupo, el descenso queda pendiente para la pasada siguiente
+                if limite_ordenado_fin > grupo_inicio:
+                    sucios.append((grupo_inicio + 1, limite_ordenado_fin))
+            elif grupo_fin > grupo_inicio:
+                # Los descensos internos del grupo quedan pendientes para la pasada siguiente
+                segmento = arr[grupo_inicio:grupo_fin + 1]
+                if not all(map(le, segmento, segmento[1:])):
+                    sucios.append((grupo_inicio + 1, grupo_fin))
             
             # Retroceder al siguiente grupo (antes del grupo actual)
             i = grupo_inicio - 1
+        
+        # Estimación del trabajo restante: si otra pasada como ésta agota el
+        # presupuesto, la sección desordenada pasa ya al ordenamiento O(n log n)
+        if trabajo > presupuesto or (elementos_desplazados_en_ciclo
+                                     and 2 * trabajo - trabajo_previo > presupuesto):
+            _completar_con_respaldo(arr, acompanante)
+            return
+        
+        # Fronteras que la pasada siguiente no necesita volver a comprobar
+        prefijo_asentado = max(0, min(limite_ordenado, min_modificado - 1))
+        sufijo_asentado = min(limite_ordenado_fin, n - 1)
 
-def geoflux_sort_generator(arr_original):
+
+def _tramos_en_rango(tramos, inicio, fin):
+    """
+    Fusiona tramos de posiciones y los separa según el rango [inicio, fin].
+    
+    Args:
+        tramos (list): Tramos (a, b) de posiciones, con ambos extremos
+            incluidos, en cualquier orden y posiblemente solapados.
+        inicio (int): Primera posición del rango.
+        fin (int): Última posición del rango.
+    
+    Returns:
+        tuple: (dentro, fuera), listas de tramos disjuntos; ``dentro`` está
+            ordenada y recortada al rango y ``fuera`` contiene las partes
+            que quedan fuera de él.
+    """
+    fusionados = []
+    for a, b in sorted(tramos):
+        if fusionados and a <= fusionados[-1][1] + 1:
+            if b > fusionados[-1][1]:
+                fusionados[-1][1] = b
+        else:
+            fusionados.append([a, b])
+    
+    dentro, fuera = [], []
+    for a, b in fusionados:
+        if a < inicio:
+            fuera.append((a, min(b, inicio - 1)))
+        if b > fin:
+            fuera.append((max(a, fin + 1), b))
+        a, b = max(a, inicio), min(b, fin)
+        if a <= b:
+            dentro.append((a, b))
+    return dentro, fuera
+
+
+def _geoflux_nucleo_contado(arr, acompanante, stats, trace=None):
+    """
+    Núcleo de GeoFlux Sort con contadores de operaciones.
+    
+    Misma lógica y mismos movimientos que ``_geoflux_nucleo``; además
+    registra en ``stats`` las pasadas del bucle principal, los grupos
+    identificados y migrados (con sus tamaños), las comparaciones de la
+    búsqueda del punto de inserción y los elementos desplazados. Los
+    recorridos se cuentan a partir de sus índices al terminar, no en cada
+    iteración.
+    
+    Con ``trace`` registra además la duración de cada fase (detección
+    inicial de orden, cálculo del rango y, en cada pasada, la detección de
+    secciones ordenadas, la FASE 1 y la FASE 2) y, si se agota el
+    presupuesto de trabajo, la del ordenamiento de respaldo.
+    
+    Args:
+        arr (list): Valores comparables a ordenar in-place.
+        acompanante (list | array.array, optional): Secuencia paralela a
+            ``arr`` o None.
+        stats (SortStats): Colector de contadores.
+        trace (SortTrace, optional): Registro de fases o None.
+    """
+    n = len(arr)
+    if n <= 1:
+        return
+    
+    if trace is not None:
+        t0 = trace.now()
+    is_sorted = True
+    for i in range(1, n):
+        if arr[i] < arr[i-1]:
+            is_sorted = False
+            break
+    if trace is not None:
+        trace.complete('sortedness_scan', t0, n=n, sorted=is_sorted)
+    if is_sorted:
+        return
+    
+    # Inserción directa para arreglos pequeños: cada desplazamiento cuenta
+    if n <= 20:
+        if trace is not None:
+            t0 = trace.now()
+        for i in range(1, n):
+            key = arr[i]
+            j = i - 1
+            while j >= 0 and arr[j] > key:
+                arr[j + 1] = arr[j]
+                j -= 1
+            arr[j + 1] = key
+            stats.scan_comparisons += (i - 1 - j) + (j >= 0)
+            stats.elements_shifted += i - 1 - j
+            if acompanante is not None:
+                acompanante[j + 1:i + 1] = acompanante[i:i + 1] + acompanante[j + 1:i]
+        if trace is not None:
+            trace.complete('insertion_sort', t0, n=n)
+        return
+    
+    if trace is not None:
+        t0 = trace.now()
+    minimo, maximo = min(arr), max(arr)
+    rango = maximo - minimo
+    if trace is not None:
+        trace.complete('range', t0, n=n)
+    if rango == 0:
+        return
+    
+    if counting_sort_applicable(n, rango) and _solo_enteros(arr):
+        if trace is not None:
+            t0 = trace.now()
+        _ordenar_por_conteo(arr, minimo, maximo, acompanante)
+        stats.engines['counting'] += 1
+        if trace is not None:
+            trace.complete('counting', t0, n=n, range=rango)
+        return
+    umbral_similitud = rango * 0.05
+    
+    # Contadores locales; se vuelcan en stats al terminar
+    pasadas = grupos = migrados = comparaciones_busqueda = desplazados = 0
+    tamanos_grupo = stats.group_sizes
+    tamanos_migrados = stats.migrated_group_sizes
+    
+    elementos_desplazados_en_ciclo = True
+    prefijo_asentado = 0
+    sufijo_asentado = n - 1
+    sucios = [(1, n - 1)]
+    presupuesto = _presupuesto_trabajo(n)
+    trabajo = 0
+    agotado = False
+    try:
+        while elementos_desplazados_en_ciclo:
+            elementos_desplazados_en_ciclo = False
+            pasadas += 1
+            
+            if trace is not None:
+                t_pasada = t0 = trace.now()
+            seccion_ordenada_inicio = prefijo_asentado
+            while seccion_ordenada_inicio + 1 < n and arr[seccion_ordenada_inicio] <= arr[seccion_ordenada_inicio + 1]:
+                seccion_ordenada_inicio += 1
+            seccion_ordenada_fin = sufijo_asentado
+            while seccion_ordenada_fin > 0 and arr[seccion_ordenada_fin - 1] <= arr[seccion_ordenada_fin]:
+                seccion_ordenada_fin -= 1
+            if trace is not None:
+                trace.complete('sorted_sections', t0, pass_number=pasadas,
+                               prefix=seccion_ordenada_inicio + 1, suffix=n - seccion_ordenada_fin)
+            if seccion_ordenada_inicio >= seccion_ordenada_fin:
+                if trace is not None:
+                    trace.complete('pass', t_pasada, pass_number=pasadas)
+                return
+            trabajo_previo = trabajo
+            
+            # === FASE 1: FLUJO ASCENDENTE ===
+            if trace is not None:
+                t0 = trace.now()
+                migrados_antes = migrados
+            tramos, _ = _tramos_en_rango(sucios, seccion_ordenada_inicio + 1, seccion_ordenada_fin)
+            sucios = []
+            trabajo += sum(b - a + 1 for a, b in tramos)
+            t = 0
+            forzar_grupo = False
+            limite_ordenado = seccion_ordenada_inicio
+            max_modificado = -1
+            i = max(1, seccion_ordenada_inicio + 1)
+            
+            while i < seccion_ordenada_fin + 1:
+                if not forzar_grupo:
+                    while t < len(tramos) and tramos[t][1] < i:
+                        t += 1
+                    if t == len(tramos):
+                        if limite_ordenado == i - 1:
+                            limite_ordenado = seccion_ordenada_fin
+                        break
+                    if tramos[t][0] > i:
+                        if limite_ordenado == i - 1:
+                            limite_ordenado = tramos[t][0] - 1
+                        i = tramos[t][0]
+                forzar_grupo = False
+                
+                grupo_inicio = i
+                grupo_fin = i
+                valor_referencia = arr[i]
+                j = i + 1
+                max_grupo_size = min(50, n - i)
+                while j < i + max_grupo_size and j < n and abs(arr[j] - valor_referencia) <= umbral_similitud:
+                    grupo_fin = j
+                    j += 1
+                
+                tamano = grupo_fin - grupo_inicio + 1
+                grupos += 1
+                tamanos_grupo[tamano] += 1
+                
+                if grupo_inicio > 0 and arr[grupo_inicio] < arr[grupo_inicio - 1]:
+                    grupo_valores = sorted(arr[grupo_inicio:grupo_fin + 1])
+                    min_valor = grupo_valores[0]
+                    
+                    j = grupo_inicio - 1
+                    while j > limite_ordenado and arr[j] > min_valor:
+                        j -= 1
+                    comparaciones_busqueda += (grupo_inicio - 1 - j) + (j > limite_ordenado)
+                    
+                    if j == limite_ordenado:
+                        punto_insercion, comparaciones = _galope_izquierda(arr, min_valor, limite_ordenado)
+                        comparaciones_busqueda += comparaciones
+                        stats._registrar_galope(
+                            comparaciones,
+                            limite_ordenado - punto_insercion + 1 + (punto_insercion > 0)
+                        )
+                    else:
+                        punto_insercion = j + 1
+                    
+                    if acompanante is None:
+                        elementos_a_desplazar = arr[punto_insercion:grupo_inicio]
+                        nuevo_segmento = grupo_valores + elementos_a_desplazar
+                        nuevo_segmento.sort()
+                        arr[punto_insercion:grupo_fin + 1] = nuevo_segmento
+                    else:
+                        _reubicar_segmento(arr, acompanante, punto_insercion, chain(
+                            range(grupo_inicio, grupo_fin + 1), range(punto_insercion, grupo_inicio)
+                        ))
+                    desplazados += grupo_inicio - punto_insercion
+                    migrados += 1
+                    tamanos_migrados[tamano] += 1
+                    max_modificado = max(max_modificado, grupo_fin)
+                    sucios.append((punto_insercion, grupo_fin + 1))
+                    forzar_grupo = True
+                    
+                    if punto_insercion <= limite_ordenado + 1:
+                        limite_ordenado = grupo_fin
+                    elementos_desplazados_en_ciclo = True
+                    
+                    trabajo += grupo_fin + 1 - punto_insercion
+                    if trabajo > presupuesto:
+                        break
+                elif limite_ordenado == grupo_inicio - 1:
+                    while limite_ordenado < grupo_fin and arr[limite_ordenado] <= arr[limite_ordenado + 1]:
+                        limite_ordenado += 1
+                    if limite_ordenado < grupo_fin:
+                        sucios.append((limite_ordenado + 1, grupo_fin))
+                elif grupo_fin > grupo_inicio:
+                    segmento = arr[grupo_inicio:grupo_fin + 1]
+                    if not all(map(le, segmento, segmento[1:])):
+                        sucios.append((grupo_inicio + 1, grupo_fin))
+                
+                i = grupo_fin + 1
+            
+            if trace is not None:
+                trace.complete('phase1', t0, pass_number=pasadas, groups_migrated=migrados - migrados_antes)
+            if trabajo > presupuesto:
+                if trace is not None:
+                    trace.complete('pass', t_pasada, pass_number=pasadas)
+                agotado = True
+                break
+            
+            # === FASE 2: FLUJO DESCENDENTE ===
+            if trace is not None:
+                t0 = trace.now()
+                migrados_antes = migrados
+            tramos, sucios = _tramos_en_rango(sucios, seccion_ordenada_inicio + 1, seccion_ordenada_fin)
+            trabajo += sum(b - a + 1 for a, b in tramos)
+            t = len(tramos) - 1
+            forzar_grupo = False
+            limite_ordenado_fin = max(seccion_ordenada_fin, max_modificado + 1)
+            min_modificado = n
+            i = min(n - 2, seccion_ordenada_fin - 1)
+            
+            while i >= seccion_ordenada_inicio:
+                if not forzar_grupo:
+                    while t >= 0 and tramos[t][0] > i + 1:
+                        t -= 1
+                    if t < 0:
+                        if limite_ordenado_fin == i + 1:
+                            limite_ordenado_fin = seccion_ordenada_inicio
+                        break
+                    if tramos[t][1] < i + 1:
+                        if limite_ordenado_fin == i + 1:
+                            limite_ordenado_fin = tramos[t][1]
+                        i = tramos[t][1] - 1
+                forzar_grupo = False
+                
+                grupo_inicio = i
+                grupo_fin = i
+                valor_referencia = arr[i]
+                j = i - 1
+                max_grupo_size = min(50, i + 1)
+                while j >= i - max_grupo_size and j >= 0 and abs(arr[j] - valor_referencia) <= umbral_similitud:
+                    grupo_inicio = j
+                    j -= 1
+                
+                tamano = grupo_fin - grupo_inicio + 1
+                grupos += 1
+                tamanos_grupo[tamano] += 1
+                
+                if grupo_fin + 1 < n and arr[grupo_fin] > arr[grupo_fin + 1]:
+                    grupo_valores = sorted(arr[grupo_inicio:grupo_fin + 1])
+                    max_valor = grupo_valores[-1]
+                    
+                    j = grupo_fin + 1
+                    while j < limite_ordenado_fin and arr[j] < max_valor:
+                        j += 1
+                    comparaciones_busqueda += (j - grupo_fin - 1) + (j < limite_ordenado_fin)
+                    
+                    if j == limite_ordenado_fin and j < n:
+                        j, comparaciones = _galope_derecha(arr, max_valor, limite_ordenado_fin)
+                        comparaciones_busqueda += comparaciones
+                        stats._registrar_galope(
+                            comparaciones,
+                            j - limite_ordenado_fin + (j < n)
+                        )
+                    
+                    if acompanante is None:
+                        elementos_a_desplazar = arr[grupo_fin + 1:j]
+                        nuevo_segmento = elementos_a_desplazar + grupo_valores
+                        nuevo_segmento.sort()
+                        arr[grupo_inicio:j] = nuevo_segmento
+                    else:
+                        _reubicar_segmento(arr, acompanante, grupo_inicio, chain(
+                            range(grupo_fin + 1, j), range(grupo_inicio, grupo_fin + 1)
+                        ))
+                    desplazados += j - grupo_fin - 1
+                    migrados += 1
+                    tamanos_migrados[tamano] += 1
+                    min_modificado = grupo_inicio
+                    sucios.append((grupo_inicio, min(j, n - 1)))
+                    forzar_grupo = True
+                    
+                    if j >= limite_ordenado_fin:
+                        limite_ordenado_fin = grupo_inicio
+                    elementos_desplazados_en_ciclo = True
+                    
+                    trabajo += j - grupo_inicio
+                    if trabajo > presupuesto:
+                        break
+                elif limite_ordenado_fin == grupo_fin + 1:
+                    while limite_ordenado_fin > grupo_inicio and arr[limite_ordenado_fin - 1] <= arr[limite_ordenado_fin]:
+                        limite_ordenado_fin -= 1
+                    if limite_ordenado_fin > grupo_inicio:
+                        sucios.append((grupo_inicio + 1, limite_ordenado_fin))
+                elif grupo_fin > grupo_inicio:
+                    segmento = arr[grupo_inicio:grupo_fin + 1]
+                    if not all(map(le, segmento, segmento[1:])):
+                        sucios.append((grupo_inicio + 1, grupo_fin))
+                
+                i = grupo_inicio - 1
+            
+            prefijo_asentado = max(0, min(limite_ordenado, min_modificado - 1))
+            sufijo_asentado = min(limite_ordenado_fin, n - 1)
+            if trace is not None:
+                trace.complete('phase2', t0, pass_number=pasadas, groups_migrated=migrados - migrados_antes)
+                trace.complete('pass', t_pasada, pass_number=pasadas)
+            if trabajo > presupuesto or (elementos_desplazados_en_ciclo
+                                         and 2 * trabajo - trabajo_previo > presupuesto):
+                agotado = True
+                break
+        
+        if agotado:
+            if trace is not None:
+                t0 = trace.now()
+            inicio, fin = _completar_con_respaldo(arr, acompanante)
+            stats.engines['budget_fallback'] += 1
+            if trace is not None:
+                trace.complete('budget_fallback', t0, work=trabajo, budget=presupuesto, n=fin - inicio)
+    finally:
+        stats.passes += pasadas
+        stats.groups_found += grupos
+        stats.groups_migrated += migrados
+        stats.scan_comparisons += comparaciones_busqueda
+        stats.elements_shifted += desplazados
+
+
+def _ordenar_bufer_con_registro(arr, key, reverse, stats, trace):
+    """Ordena un búfer tipado in-place anotando el motor en ``stats`` y ``trace``."""
+    if key is not None:
+        raise TypeError("key no se admite con búferes tipados; ordena una lista de registros")
+    if trace is not None:
+        t0 = trace.now()
+    _ordenar_bufer(arr, reverse)
+    if stats is not None:
+        stats.sorts += 1
+        stats.engines['buffer'] += 1
+    if trace is not None:
+        trace.complete('buffer', t0, n=len(arr))
+
+
+def _despachar(arr, acompanante, nucleo, engine, stats, trace):
+    """
+    Ordena con el motor indicado, o con el que elija el análisis si es 'auto'.
+    
+    'counting' solo lo elige el análisis; con acompañante el reparto por
+    conteo es estable y mueve el acompañante con la misma permutación.
+    
+    Args:
+        arr (list): Valores a ordenar in-place.
+        acompanante (list | array.array, optional): Secuencia paralela o None.
+        nucleo (callable): Núcleo de migración de grupos a usar.
+        engine (str): 'auto', 'runs', 'fallback' o 'geoflux'.
+        stats (SortStats, optional): Colector donde anotar el motor elegido.
+        trace (SortTrace, optional): Registro de fases.
+    """
+    tramos = perfil = None
+    if engine == 'auto':
+        if trace is not None:
+            t0 = trace.now()
+        perfil = analyze(arr)
+        engine, motivo = choose_engine(perfil)
+        tramos = perfil.run_bounds
+        if trace is not None:
+            trace.complete('analyze', t0, engine=engine, reason=motivo, runs=perfil.runs,
+                           descending_runs=perfil.descending_runs,
+                           inversion_estimate=perfil.inversion_estimate)
+    if stats is not None:
+        stats.engines[engine] += 1
+    
+    if engine == 'sorted':
+        return
+    if trace is not None:
+        t0 = trace.now()
+    if engine == 'counting':
+        _ordenar_por_conteo(arr, perfil.min, perfil.max, acompanante)
+    elif engine == 'runs':
+        _fusion_natural(arr, acompanante, tramos if tramos is not None else natural_runs(arr))
+    elif engine == 'fallback':
+        _ordenar_respaldo(arr, acompanante)
+    else:
+        nucleo(arr, acompanante)
+        return
+    if trace is not None:
+        trace.complete(engine, t0, n=len(arr))
+
+
+def _fusion_natural(arr, acompanante, tramos):
+    """
+    Invierte los tramos descendentes y fusiona los tramos naturales.
+    
+    Las fusiones se hacen de dos en dos tramos contiguos, como un mergesort
+    de abajo arriba que parte de los tramos naturales: O(n log r) para r
+    tramos. Cada fusión ordena el segmento de dos tramos, que Timsort
+    resuelve en tiempo lineal (como la fusión de segmentos del núcleo).
+    
+    Args:
+        arr (list): Valores a ordenar in-place.
+        acompanante (list | array.array, optional): Secuencia paralela o None.
+        tramos (iterable): Tramos (inicio, fin, descendente) que cubren ``arr``.
+    """
+    limites = []
+    for inicio, fin, descendente in tramos:
+        if descendente:
+            arr[inicio:fin] = arr[inicio:fin][::-1]
+            if acompanante is not None:
+                acompanante[inicio:fin] = acompanante[inicio:fin][::-1]
+        limites.append(inicio)
+    limites.append(len(arr))
+    
+    while len(limites) > 2:
+        fusionados = []
+        for k in range(0, len(limites) - 2, 2):
+            inicio, fin = limites[k], limites[k + 2]
+            if acompanante is None:
+                segmento = arr[inicio:fin]
+                segmento.sort()
+                arr[inicio:fin] = segmento
+            else:
+                _reubicar_segmento(arr, acompanante, inicio, range(inicio, fin))
+            fusionados.append(inicio)
+        if len(limites) % 2 == 0:
+            # Número impar de tramos: el último pasa sin fusionar a la siguiente ronda
+            fusionados.append(limites[-2])
+        fusionados.append(limites[-1])
+        limites = fusionados
+
+
+def _ordenar_respaldo(arr, acompanante):
+    """Ordenamiento O(n log n) de Python para datos sin estructura aprovechable."""
+    if acompanante is None:
+        arr.sort()
+    else:
+        _reubicar_segmento(arr, acompanante, 0, range(len(arr)))
+
+
+def _presupuesto_trabajo(n):
+    """Trabajo máximo del núcleo para n elementos: O(n log n), como el respaldo."""
+    return _FACTOR_PRESUPUESTO * n * max(1, n.bit_length())
+
+
+def _completar_con_respaldo(arr, acompanante):
+    """
+    Termina un ordenamiento que agotó su presupuesto de trabajo.
+    
+    Solo se reordena la sección central aún desordenada, ampliada con
+    búsquedas binarias hasta las posiciones del prefijo y del sufijo
+    ordenados que sus valores invaden. Timsort trata esos extremos como
+    tramos ya ordenados, así que el coste es O(m log m + n) para una sección
+    central de m elementos.
+    
+    Args:
+        arr (list): Valores parcialmente ordenados por el núcleo.
+        acompanante (list | array.array, optional): Secuencia paralela o None.
+    
+    Returns:
+        tuple: (inicio, fin) del segmento reordenado.
+    """
+    n = len(arr)
+    inicio = 0
+    while inicio + 1 < n and arr[inicio] <= arr[inicio + 1]:
+        inicio += 1
+    fin = n - 1
+    while fin > 0 and arr[fin - 1] <= arr[fin]:
+        fin -= 1
+    if inicio >= fin:
+        return 0, 0
+    
+    # arr[0..inicio] y arr[fin..n-1] están ordenados; los valores del resto solo
+    # desplazan la parte del prefijo mayor que su mínimo y la del sufijo menor que su máximo
+    inicio = bisect_right(arr, min(arr[inicio + 1:]), 0, inicio + 1)
+    fin = bisect_left(arr, max(arr[:fin]), fin, n)
+    if acompanante is None:
+        segmento = arr[inicio:fin]
+        segmento.sort()
+        arr[inicio:fin] = segmento
+    else:
+        _reubicar_segmento(arr, acompanante, inicio, range(inicio, fin))
+    return inicio, fin
+
+
+def _reubicar_segmento(arr, acompanante, inicio, posiciones):
+    """
+    Reescribe un segmento de ``arr`` y de su acompañante en orden de valor.
+    
+    Las posiciones se ordenan de forma estable según ``arr`` (partiendo del
+    orden recibido) y se escriben a partir de ``inicio`` en ambas secuencias,
+    de modo que el acompañante recibe exactamente la misma permutación.
+    
+    Args:
+        arr (list): Valores que determinan el orden.
+        acompanante (list | array.array): Secuencia paralela a ``arr``.
+        inicio (int): Primer índice del segmento a reescribir.
+        posiciones (iterable): Índices del segmento en su orden inicial.
+    """
+    orden = sorted(posiciones, key=arr.__getitem__)
+    fin = inicio + len(orden)
+    arr[inicio:fin] = [arr[k] for k in orden]
+    valores = [acompanante[k] for k in orden]
+    if isinstance(acompanante, array):
+        valores = array(acompanante.typecode, valores)
+    acompanante[inicio:fin] = valores
+
+
+def _galope_izquierda(arr, valor, fin):
+    """
+    Busca el punto de inserción de un valor en la sección ordenada arr[0..fin].
+    
+    Equivale al recorrido lineal ``while j >= 0 and arr[j] > valor: j -= 1``
+    partiendo de ``fin``, pero realiza primero saltos exponenciales hacia la
+    izquierda (1, 2, 4, ...) y luego una búsqueda binaria en el intervalo
+    acotado. Es eficiente cuando el punto está cerca del final de la sección.
+    
+    Args:
+        arr (list): Arreglo cuya sección arr[0..fin] está ordenada.
+        valor: Valor a insertar (mínimo del grupo que migra).
+        fin (int): Último índice de la sección ordenada.
+        
+    Returns:
+        tuple: (punto_insercion, comparaciones)
+            - punto_insercion (int): Primer índice de la sección con valor mayor a ``valor``
+            - comparaciones (int): Comparaciones realizadas por la búsqueda
+    """
+    comparaciones = 1
+    if arr[fin] <= valor:
+        return fin + 1, comparaciones
+    
+    # Fase exponencial: arr[alto] > valor se mantiene como invariante
+    alto = fin
+    paso = 1
+    bajo = 0
+    while fin - paso >= 0:
+        sonda = fin - paso
+        comparaciones += 1
+        if arr[sonda] <= valor:
+            bajo = sonda + 1
+            break
+        alto = sonda
+        paso *= 2
+    
+    # Fase binaria dentro del intervalo acotado [bajo, alto]
+    comparaciones += (alto - bajo).bit_length()
+    return bisect_right(arr, valor, bajo, alto), comparaciones
+
+
+def _galope_derecha(arr, valor, inicio):
+    """
+    Busca el punto final de un grupo en la sección ordenada arr[inicio..n-1].
+    
+    Equivale al recorrido lineal ``while j < n and arr[j] < valor: j += 1``
+    partiendo de ``inicio``, con saltos exponenciales hacia la derecha
+    seguidos de una búsqueda binaria.
+    
+    Args:
+        arr (list): Arreglo cuya sección arr[inicio..n-1] está ordenada.
+        valor: Valor a ubicar (máximo del grupo que migra).
+        inicio (int): Primer índice de la sección ordenada.
+        
+    Returns:
+        tuple: (punto_final, comparaciones)
+            - punto_final (int): Primer índice de la sección con valor mayor o igual a ``valor``
+            - comparaciones (int): Comparaciones realizadas por la búsqueda
+    """
+    n = len(arr)
+    comparaciones = 1
+    if arr[inicio] >= valor:
+        return inicio, comparaciones
+    
+    # Fase exponencial: arr[bajo] < valor se mantiene como invariante
+    bajo = inicio
+    paso = 1
+    alto = n
+    while inicio + paso < n:
+        sonda = inicio + paso
+        comparaciones += 1
+        if arr[sonda] >= valor:
+            alto = sonda
+            break
+        bajo = sonda
+        paso *= 2
+    
+    # Fase binaria dentro del intervalo acotado [bajo + 1, alto]
+    comparaciones += (alto - bajo - 1).bit_length()
+    return bisect_left(arr, valor, bajo + 1, alto), comparaciones
+
+
+def geoflux_sort_generator(arr_original, key=None, reverse=False, frames='full',
+                           granularity='comparison', every=1):
     """
     Generador que ejecuta GeoFlux Sort paso a paso, cediendo el estado en cada iteración.
     
@@ -202,31 +1229,115 @@ def geoflux_sort_generator(arr_original):
     
     Args:
         arr_original (list): Arreglo original a ordenar.
+        key (callable, optional): Función que extrae la clave de ordenamiento
+            de cada elemento; se evalúa una sola vez por elemento.
+            Por defecto None.
+        reverse (bool, optional): Si es True, el estado final queda en orden
+            descendente. Por defecto False.
+        frames (str, optional): 'full' cede una copia completa del arreglo en
+            cada paso; 'delta' cede solo el tramo modificado, de modo que el
+            coste por paso no crece con n. Por defecto 'full'.
+        granularity (str, optional): Nivel de detalle de los pasos cedidos.
+            Cada nivel incluye los anteriores:
+            - 'pass': inicio de cada pasada y estado final
+            - 'migration': además, cada grupo migrado
+            - 'group': además, identificación, extracción y punto de
+              inserción de cada grupo
+            - 'comparison': además, cada comparación de la búsqueda
+            Los pasos de niveles no solicitados no construyen sus textos ni
+            sus highlights. Por defecto 'comparison'.
+        every (int, optional): Cede solo uno de cada ``every`` pasos del
+            nivel solicitado; el estado final se cede siempre. En modo
+            'delta' los cambios de los pasos omitidos se acumulan en el
+            siguiente paso cedido. Por defecto 1.
         
     Yields:
         dict: Diccionario con información del estado actual:
-            - 'array': Copia del arreglo en el estado actual
+            - 'array': Copia del arreglo en el estado actual (solo en modo 'full')
+            - 'keys': Copia de las claves en el estado actual (solo con ``key``
+              en modo 'full')
+            - 'delta': Tupla (inicio, valores) con el tramo reescrito desde el
+              paso anterior, o None si el paso no modifica el arreglo (solo en
+              modo 'delta'). El primer paso contiene el arreglo completo.
+            - 'keys_delta': Igual que 'delta' para las claves (solo con ``key``
+              en modo 'delta')
             - 'pass_type': Tipo de pasada ('Flujo Ascendente', 'Flujo Descendente', 'Finalizado')
             - 'status': Descripción textual de la operación actual
             - 'highlights': Diccionario con índices a resaltar en visualizaciones
+            - 'operation': Tupla (tipo, inicio, fin, índice) con la operación
+              del paso, de la que se derivan 'status' y 'highlights'. Tipos:
+              'pass' (inicio de una fase), 'group', 'extract', 'compare' e
+              'insertion' (con el grupo en [inicio, fin); ``índice`` es la
+              posición comparada o el punto de inserción), 'migration' (el
+              grupo movido queda en [inicio, fin)) y los finales 'trivial',
+              'presorted', 'sorted' y 'stopped'. Los campos que no aplican
+              son None.
+    
+    Raises:
+        ValueError: Si ``frames`` o ``granularity`` no son válidos, o si
+            ``every`` es menor que 1.
             
     Ejemplo:
         >>> datos = [5, 2, 9, 1]
         >>> for estado in geoflux_sort_generator(datos):
         ...     print(f"{estado['array']} - {estado['status']}")
+        
+        Con pasos delta, ``FrameReplayer`` reconstruye el arreglo bajo demanda:
+        
+        >>> reproductor = FrameReplayer()
+        >>> for estado in geoflux_sort_generator(datos, frames='delta'):
+        ...     reproductor.apply(estado)
+        >>> reproductor.array
+        [1, 2, 5, 9]
     """
+    if frames not in ('full', 'delta'):
+        raise ValueError(f"Modo de frames desconocido: {frames}")
+    if granularity not in _GRANULARIDADES:
+        raise ValueError(f"Granularidad desconocida: {granularity}")
+    if every < 1:
+        raise ValueError("every debe ser al menos 1")
+    delta = frames == 'delta'
+    
+    # Qué tipos de paso se ceden según la granularidad (los niveles son acumulativos)
+    nivel = _GRANULARIDADES[granularity]
+    ver_migraciones = nivel >= _GRANULARIDADES['migration']
+    ver_grupos = nivel >= _GRANULARIDADES['group']
+    ver_comparaciones = nivel >= _GRANULARIDADES['comparison']
+    
     # Crear una copia del arreglo para no modificar el original
-    arr = list(arr_original)
+    if key is None:
+        arr = list(arr_original)
+        registros = None
+    else:
+        # Las claves se extraen una sola vez; los registros acompañan a sus claves
+        registros = list(arr_original)
+        arr = [key(elemento) for elemento in registros]
     n = len(arr)
     
+    # Tramo modificado desde el último paso cedido; el primero contiene todo el arreglo
+    sucio = (0, n)
+    # Pasos elegibles desde el último cedido (diezmado con ``every``)
+    omitidos = 0
+    
+    def toca():
+        """Indica si el siguiente paso elegible debe cederse según ``every``."""
+        nonlocal omitidos
+        omitidos += 1
+        if omitidos < every:
+            return False
+        omitidos = 0
+        return True
+    
+    def paso(pass_type, operacion):
+        """Construye el estado con los cambios acumulados desde el último paso cedido."""
+        nonlocal sucio
+        estado = _estado(arr, registros, delta, pass_type, operacion, sucio)
+        sucio = None
+        return estado
+    
     # Caso base: arreglos de 0 o 1 elemento
     if n <= 1:
-        yield {
-            'array': list(arr),
-            'pass_type': 'Finalizado',
-            'status': 'Arreglo muy pequeño, ya ordenado',
-            'highlights': {'all_sorted': True}
-        }
+        yield paso('Finalizado', ('trivial', None, None, None))
         return
     
     # Verificar si el arreglo ya está ordenado
@@ -237,12 +1348,9 @@ def geoflux_sort_generator(arr_original):
             break
     
     if is_sorted:
-        yield {
-            'array': list(arr),
-            'pass_type': 'Finalizado',
-            'status': 'Arreglo ya ordenado',
-            'highlights': {'all_sorted': True}
-        }
+        if reverse:
+            _invertir(arr, registros)
+        yield paso('Finalizado', ('presorted', None, None, None))
         return
     
     # Calcular umbral adaptativo de similitud
@@ -261,12 +1369,7 @@ def geoflux_sort_generator(arr_original):
         
         # Verificación de seguridad contra bucles infinitos
         if current_iterations > max_iterations:
-            yield {
-                'array': list(arr),
-                'pass_type': 'Detenido',
-                'status': 'Parada por seguridad (max_iterations)',
-                'highlights': {}
-            }
+            yield paso('Detenido', ('stopped', None, None, None))
             return
         
         elementos_desplazados_en_ciclo = False
@@ -282,21 +1385,19 @@ def geoflux_sort_generator(arr_original):
         
         # Si todo el arreglo está ordenado, finalizar
         if seccion_ordenada_inicio >= seccion_ordenada_fin:
-            yield {
-                'array': list(arr),
-                'pass_type': 'Finalizado',
-                'status': 'Arreglo Ordenado',
-                'highlights': {'all_sorted': True}
-            }
+            if reverse:
+                _invertir(arr, registros)
+                sucio = (0, n)
+            yield paso('Finalizado', ('sorted', None, None, None))
             return
         
         # === FASE 1: FLUJO ASCENDENTE ===
-        yield {
-            'array': list(arr),
-            'pass_type': 'Flujo Ascendente',
-            'status': 'Iniciando Pasada Ascendente de Grupos',
-            'highlights': {}
-        }
+        if toca():
+            yield paso('Flujo Ascendente', ('pass', None, None, None))
+        
+        # Límites de la sección ordenada, como en geoflux_sort
+        limite_ordenado = seccion_ordenada_inicio
+        max_modificado = -1
         
         i = max(1, seccion_ordenada_inicio + 1)
         
@@ -315,83 +1416,83 @@ def geoflux_sort_generator(arr_original):
                 j += 1
             
             # Visualizar el grupo identificado
-            grupo_highlights = {idx: 'grupo' for idx in range(grupo_inicio, grupo_fin + 1)}
-            yield {
-                'array': list(arr),
-                'pass_type': 'Flujo Ascendente',
-                'status': f'Identificando grupo desde A[{grupo_inicio}] hasta A[{grupo_fin}]',
-                'highlights': grupo_highlights
-            }
+            if ver_grupos and toca():
+                yield paso('Flujo Ascendente', ('group', grupo_inicio, grupo_fin + 1, None))
             
             # Verificar si el grupo debe migrar hacia la izquierda
             if grupo_inicio > 0 and arr[grupo_inicio] < arr[grupo_inicio - 1]:
                 # Extraer y guardar el grupo antes de ordenarlo
                 grupo_valores = arr[grupo_inicio:grupo_fin + 1]
-                grupo_valores_original = list(grupo_valores)
+                if ver_grupos and toca():
+                    yield paso('Flujo Ascendente', ('extract', grupo_inicio, grupo_fin + 1, None))
                 grupo_valores.sort()
                 
-                yield {
-                    'array': list(arr),
-                    'pass_type': 'Flujo Ascendente',
-                    'status': f'Extrayendo grupo {grupo_valores_original} para ordenamiento',
-                    'highlights': grupo_highlights
-                }
-                
                 # Valor mínimo del grupo para encontrar punto de inserción
                 min_valor = grupo_valores[0]
                 
                 # Buscar hacia atrás para encontrar el punto de inserción
                 j = grupo_inicio - 1
-                while j >= 0 and arr[j] > min_valor:
-                    yield {
-                        'array': list(arr),
-                        'pass_type': 'Flujo Ascendente',
-                        'status': f'Comparando A[{j}]={arr[j]} con valor mínimo del grupo {min_valor}',
-                        'highlights': {**grupo_highlights, 'j': j}
-                    }
-                    j -= 1
+                if ver_comparaciones:
+                    while j >= 0 and arr[j] > min_valor:
+                        if toca():
+                            yield paso('Flujo Ascendente', ('compare', grupo_inicio, grupo_fin + 1, j))
+                        j -= 1
+                else:
+                    # Sin pasos de comparación: galope al alcanzar la sección ordenada
+                    while j > limite_ordenado and arr[j] > min_valor:
+                        j -= 1
+                    if j == limite_ordenado:
+                        j = _galope_izquierda(arr, min_valor, limite_ordenado)[0] - 1
                 
                 # El punto de inserción está después del último elemento menor
                 punto_insercion = j + 1
                 
-                yield {
-                    'array': list(arr),
-                    'pass_type': 'Flujo Ascendente',
-                    'status': f'Punto de inserción para el grupo: {punto_insercion}',
-                    'highlights': {**grupo_highlights, 'insertion_at': punto_insercion}
-                }
-                
-                # Guardar elementos que serán desplazados
-                elementos_a_desplazar = arr[punto_insercion:grupo_inicio]
+                if ver_grupos and toca():
+                    yield paso('Flujo Ascendente', ('insertion', grupo_inicio, grupo_fin + 1, punto_insercion))
                 
-                # Reconstruir el segmento
-                nuevo_segmento = grupo_valores + elementos_a_desplazar
-                
-                # Aplicar cambios al arreglo
-                for idx, val in enumerate(nuevo_segmento):
-                    arr[punto_insercion + idx] = val
+                if registros is None:
+                    # Guardar elementos que serán desplazados
+                    elementos_a_desplazar = arr[punto_insercion:grupo_inicio]
+                    
+                    # Reconstruir el segmento
+                    nuevo_segmento = grupo_valores + elementos_a_desplazar
+                    
+                    # Fusionar el segmento (ver la FASE 1 de _geoflux_nucleo)
+                    nuevo_segmento.sort()
+                    
+                    # Aplicar cambios al arreglo
+                    arr[punto_insercion:grupo_fin + 1] = nuevo_segmento
+                else:
+                    # Mover claves y registros con la misma permutación
+                    _reubicar_segmento(arr, registros, punto_insercion, chain(
+                        range(grupo_inicio, grupo_fin + 1), range(punto_insercion, grupo_inicio)
+                    ))
+                sucio = _unir_tramos(sucio, punto_insercion, grupo_fin + 1)
+                max_modificado = max(max_modificado, grupo_fin)
+                if punto_insercion <= limite_ordenado + 1:
+                    limite_ordenado = grupo_fin
                 
                 # Mostrar el resultado de la migración
-                yield {
-                    'array': list(arr),
-                    'pass_type': 'Flujo Ascendente',
-                    'status': 'Grupo movido a nueva posición y ordenado internamente',
-                    'highlights': {idx: 'moved_group' for idx in range(punto_insercion, punto_insercion + len(grupo_valores))}
-                }
+                if ver_migraciones and toca():
+                    yield paso('Flujo Ascendente', (
+                        'migration', punto_insercion, punto_insercion + len(grupo_valores), None
+                    ))
                 
                 # Marcar que hubo cambios
                 elementos_desplazados_en_ciclo = True
+            elif limite_ordenado == grupo_inicio - 1:
+                # El grupo continúa la sección ordenada
+                while limite_ordenado < grupo_fin and arr[limite_ordenado] <= arr[limite_ordenado + 1]:
+                    limite_ordenado += 1
             
             # Avanzar al siguiente grupo
             i = grupo_fin + 1
         
         # === FASE 2: FLUJO DESCENDENTE ===
-        yield {
-            'array': list(arr),
-            'pass_type': 'Flujo Descendente',
-            'status': 'Iniciando Pasada Descendente de Grupos',
-            'highlights': {}
-        }
+        if toca():
+            yield paso('Flujo Descendente', ('pass', None, None, None))
+        
+        limite_ordenado_fin = max(seccion_ordenada_fin, max_modificado + 1)
         
         i = min(n - 2, seccion_ordenada_fin - 1)
         
@@ -410,80 +1511,189 @@ def geoflux_sort_generator(arr_original):
                 j -= 1
             
             # Visualizar el grupo identificado
-            grupo_highlights = {idx: 'grupo' for idx in range(grupo_inicio, grupo_fin + 1)}
-            yield {
-                'array': list(arr),
-                'pass_type': 'Flujo Descendente',
-                'status': f'Identificando grupo desde A[{grupo_inicio}] hasta A[{grupo_fin}]',
-                'highlights': grupo_highlights
-            }
+            if ver_grupos and toca():
+                yield paso('Flujo Descendente', ('group', grupo_inicio, grupo_fin + 1, None))
             
             # Verificar si el grupo debe migrar hacia la derecha
             if grupo_fin + 1 < n and arr[grupo_fin] > arr[grupo_fin + 1]:
                 # Extraer y guardar el grupo antes de ordenarlo
                 grupo_valores = arr[grupo_inicio:grupo_fin + 1]
-                grupo_valores_original = list(grupo_valores)
+                if ver_grupos and toca():
+                    yield paso('Flujo Descendente', ('extract', grupo_inicio, grupo_fin + 1, None))
                 grupo_valores.sort()
                 
-                yield {
-                    'array': list(arr),
-                    'pass_type': 'Flujo Descendente',
-                    'status': f'Extrayendo grupo {grupo_valores_original} para ordenamiento',
-                    'highlights': grupo_highlights
-                }
-                
                 # Valor máximo del grupo para encontrar punto de inserción
                 max_valor = grupo_valores[-1]
                 
                 # Buscar hacia adelante para encontrar el punto final
                 j = grupo_fin + 1
-                while j < n and arr[j] < max_valor:
-                    yield {
-                        'array': list(arr),
-                        'pass_type': 'Flujo Descendente',
-                        'status': f'Comparando A[{j}]={arr[j]} con valor máximo del grupo {max_valor}',
-                        'highlights': {**grupo_highlights, 'j': j}
-                    }
-                    j += 1
+                if ver_comparaciones:
+                    while j < n and arr[j] < max_valor:
+                        if toca():
+                            yield paso('Flujo Descendente', ('compare', grupo_inicio, grupo_fin + 1, j))
+                        j += 1
+                else:
+                    # Sin pasos de comparación: galope al alcanzar la sección ordenada
+                    while j < limite_ordenado_fin and arr[j] < max_valor:
+                        j += 1
+                    if j == limite_ordenado_fin and j < n:
+                        j = _galope_derecha(arr, max_valor, limite_ordenado_fin)[0]
                 
-                yield {
-                    'array': list(arr),
-                    'pass_type': 'Flujo Descendente',
-                    'status': f'Punto final para el grupo: {j}',
-                    'highlights': {**grupo_highlights}
-                }
+                if ver_grupos and toca():
+                    yield paso('Flujo Descendente', ('insertion', grupo_inicio, grupo_fin + 1, j))
                 
-                # Guardar elementos que serán desplazados
-                elementos_a_desplazar = arr[grupo_fin + 1:j]
-                
-                # Reconstruir el segmento
-                nuevo_segmento = elementos_a_desplazar + grupo_valores
-                
-                # Aplicar cambios al arreglo
-                for idx, val in enumerate(nuevo_segmento):
-                    arr[grupo_inicio + idx] = val
+                if registros is None:
+                    # Guardar elementos que serán desplazados
+                    elementos_a_desplazar = arr[grupo_fin + 1:j]
+                    
+                    # Reconstruir el segmento
+                    nuevo_segmento = elementos_a_desplazar + grupo_valores
+                    
+                    # Fusionar el segmento (ver la FASE 1 de _geoflux_nucleo)
+                    nuevo_segmento.sort()
+                    
+                    # Aplicar cambios al arreglo
+                    arr[grupo_inicio:j] = nuevo_segmento
+                else:
+                    # Mover claves y registros con la misma permutación
+                    _reubicar_segmento(arr, registros, grupo_inicio, chain(
+                        range(grupo_fin + 1, j), range(grupo_inicio, grupo_fin + 1)
+                    ))
+                sucio = _unir_tramos(sucio, grupo_inicio, j)
+                if j >= limite_ordenado_fin:
+                    limite_ordenado_fin = grupo_inicio
                 
                 # Mostrar el resultado de la migración
-                inicio_grupo_movido = grupo_inicio + len(elementos_a_desplazar)
-                fin_grupo_movido = inicio_grupo_movido + len(grupo_valores)
-                
-                yield {
-                    'array': list(arr),
-                    'pass_type': 'Flujo Descendente',
-                    'status': 'Grupo movido a nueva posición y ordenado internamente',
-                    'highlights': {idx: 'moved_group' for idx in range(inicio_grupo_movido, fin_grupo_movido)}
-                }
+                if ver_migraciones and toca():
+                    yield paso('Flujo Descendente', ('migration', j - len(grupo_valores), j, None))
                 
                 # Marcar que hubo cambios
                 elementos_desplazados_en_ciclo = True
+            elif limite_ordenado_fin == grupo_fin + 1:
+                # El grupo precede a la sección ordenada final
+                while limite_ordenado_fin > grupo_inicio and arr[limite_ordenado_fin - 1] <= arr[limite_ordenado_fin]:
+                    limite_ordenado_fin -= 1
             
             # Retroceder al siguiente grupo
             i = grupo_inicio - 1
     
     # Finalización: el arreglo está completamente ordenado
-    yield {
-        'array': list(arr),
-        'pass_type': 'Finalizado',
-        'status': 'Arreglo Ordenado',
-        'highlights': {'all_sorted': True}
-    }
\ No newline at end of file
+    if reverse:
+        _invertir(arr, registros)
+        sucio = (0, n)
+    yield paso('Finalizado', ('sorted', None, None, None))
+
+
+def _estado(arr, registros, delta, pass_type, operacion, cambio=None):
+    """
+    Construye el diccionario de estado que cede ``geoflux_sort_generator``.
+    
+    Args:
+        arr (list): Valores (o claves) en el estado actual.
+        registros (list, optional): Registros reordenados junto a las claves,
+            o None si se ordenan los valores directamente.
+        delta (bool): Si es True, solo se incluye el tramo modificado.
+        pass_type (str): Tipo de pasada.
+        operacion (tuple): Operación del paso (tipo, inicio, fin, índice).
+        cambio (tuple, optional): Límites (inicio, fin) del tramo reescrito
+            desde el paso anterior, o None si el arreglo no cambió.
+        
+    Returns:
+        dict: Estado con copias del arreglo (y de las claves, si las hay), o
+            con el tramo modificado en modo delta.
+    """
+    status, highlights = _describir_paso(pass_type, operacion, arr)
+    if delta:
+        estado = {
+            'delta': None,
+            'pass_type': pass_type,
+            'status': status,
+            'highlights': highlights,
+            'operation': operacion
+        }
+        if cambio is not None:
+            inicio, fin = cambio
+            if registros is None:
+                estado['delta'] = (inicio, arr[inicio:fin])
+            else:
+                estado['delta'] = (inicio, registros[inicio:fin])
+        if registros is not None:
+            estado['keys_delta'] = None if cambio is None else (inicio, arr[inicio:fin])
+        return estado
+    if registros is None:
+        return {
+            'array': list(arr),
+            'pass_type': pass_type,
+            'status': status,
+            'highlights': highlights,
+            'operation': operacion
+        }
+    return {
+        'array': list(registros),
+        'keys': list(arr),
+        'pass_type': pass_type,
+        'status': status,
+        'highlights': highlights,
+        'operation': operacion
+    }
+
+
+def _describir_paso(pass_type, operacion, arr):
+    """
+    Construye el texto de estado y los highlights de un paso.
+    
+    Los textos se derivan solo de la operación y del arreglo en ese paso,
+    de modo que las grabaciones de ``recording`` pueden regenerarlos sin
+    guardarlos.
+    
+    Args:
+        pass_type (str): Tipo de pasada.
+        operacion (tuple): (tipo, inicio, fin, índice) del paso; véase
+            ``geoflux_sort_generator``.
+        arr (list): Valores (o claves) en el estado del paso.
+        
+    Returns:
+        tuple: (status, highlights).
+    """
+    tipo, inicio, fin, indice = operacion
+    if tipo in _TEXTOS_FINALES:
+        return _TEXTOS_FINALES[tipo], {'all_sorted': True}
+    if tipo == 'stopped':
+        return 'Parada por seguridad (max_iterations)', {}
+    ascendente = pass_type == 'Flujo Ascendente'
+    if tipo == 'pass':
+        return f"Iniciando Pasada {'Ascendente' if ascendente else 'Descendente'} de Grupos", {}
+    if tipo == 'migration':
+        return ('Grupo movido a nueva posición y ordenado internamente',
+                {idx: 'moved_group' for idx in range(inicio, fin)})
+    
+    highlights = {idx: 'grupo' for idx in range(inicio, fin)}
+    if tipo == 'group':
+        return f'Identificando grupo desde A[{inicio}] hasta A[{fin - 1}]', highlights
+    if tipo == 'extract':
+        return f'Extrayendo grupo {arr[inicio:fin]} para ordenamiento', highlights
+    if tipo == 'compare':
+        highlights['j'] = indice
+        # El grupo aún no se ha movido; mismo desempate que su ordenación
+        # estable: el primer mínimo y el último máximo
+        if ascendente:
+            return f'Comparando A[{indice}]={arr[indice]} con valor mínimo del grupo {min(arr[inicio:fin])}', highlights
+        return f'Comparando A[{indice}]={arr[indice]} con valor máximo del grupo {max(reversed(arr[inicio:fin]))}', highlights
+    if ascendente:
+        highlights['insertion_at'] = indice
+        return f'Punto de inserción para el grupo: {indice}', highlights
+    return f'Punto final para el grupo: {indice}', highlights
+
+
+def _unir_tramos(tramo, inicio, fin):
+    """Devuelve el menor tramo (inicio, fin) que cubre ``tramo`` y [inicio, fin)."""
+    if tramo is None:
+        return (inicio, fin)
+    return (min(tramo[0], inicio), max(tramo[1], fin))
+
+
+def _invertir(arr, registros):
+    """Invierte in-place los valores y, si existen, los registros asociados."""
+    arr.reverse()
+    if registros is not None:
+        registros.reverse()
@@ -0,0 +1,265 @@
+"""
+Análisis de preordenamiento para GeoFlux Sort.
+
+Este módulo calcula, en una sola pasada, un perfil del grado de orden de
+un arreglo (tramos ascendentes y descendentes, mínimo, máximo) y lo
+completa con estimaciones por muestreo (valores distintos e inversiones).
+``geoflux_sort(..., engine='auto')`` usa ese perfil para elegir el motor:
+
+    - 'counting': ordenamiento por conteo (enteros de rango acotado).
+    - 'runs': invierte los tramos descendentes y fusiona los tramos
+      naturales de dos en dos (pocos tramos largos, arreglos invertidos).
+    - 'geoflux': migración de grupos (arreglos casi ordenados).
+    - 'fallback': ordenamiento O(n log n) de Python (datos sin estructura
+      aprovechable, donde la migración de grupos es cuadrática).
+"""
+
+import random
+from collections import Counter
+
+from .counting import counting_sort_applicable, _solo_enteros
+
+# Máximo de tramos cuyos límites se guardan en el perfil (motor 'runs')
+_MAX_TRAMOS_GUARDADOS = 64
+
+# Fracción máxima de pares invertidos para usar la migración de grupos
+_MAX_INVERSIONES_MIGRACION = 0.02
+
+# Tamaño de las muestras de valores distintos y de pares
+_MUESTRA = 1024
+
+
+class SortProfile:
+    """
+    Perfil de preordenamiento de un arreglo calculado por ``analyze``.
+
+    Attributes:
+        n (int): Número de elementos.
+        runs (int): Tramos naturales: ascendentes (no decrecientes) o
+            estrictamente descendentes, como los detecta Timsort.
+        descending_runs (int): Cuántos de esos tramos son descendentes.
+        longest_run (int): Longitud del tramo más largo.
+        min: Valor mínimo (None si el arreglo está vacío).
+        max: Valor máximo (None si el arreglo está vacío).
+        distinct_estimate (int | None): Estimación del número de valores
+            distintos (None si los valores no son hashables).
+        inversion_estimate (float): Fracción estimada de pares (i < j) con
+            arr[j] < arr[i]; 0.0 ordenado, 1.0 invertido.
+        run_bounds (list | None): Tramos (inicio, fin, descendente) si hay
+            como mucho 64; None si hay más.
+        small_int_range (bool): Todos los valores son ``int`` y su rango es
+            apto para el ordenamiento por conteo.
+    """
+
+    def __init__(self, n, runs, descending_runs, longest_run, minimo, maximo,
+                 distinct_estimate, inversion_estimate, run_bounds, small_int_range=False):
+        self.n = n
+        self.runs = runs
+        self.descending_runs = descending_runs
+        self.longest_run = longest_run
+        self.min = minimo
+        self.max = maximo
+        self.distinct_estimate = distinct_estimate
+        self.inversion_estimate = inversion_estimate
+        self.run_bounds = run_bounds
+        self.small_int_range = small_int_range
+
+    @property
+    def is_sorted(self):
+        """bool: El arreglo ya está en orden no decreciente."""
+        return self.runs <= 1 and self.descending_runs == 0
+
+    @property
+    def is_reversed(self):
+        """bool: El arreglo es un único tramo estrictamente descendente."""
+        return self.runs == 1 and self.descending_runs == 1
+
+    def as_dict(self):
+        """Devuelve el perfil como diccionario (sin los límites de los tramos)."""
+        return {
+            'n': self.n,
+            'runs': self.runs,
+            'descending_runs': self.descending_runs,
+            'longest_run': self.longest_run,
+            'min': self.min,
+            'max': self.max,
+            'distinct_estimate': self.distinct_estimate,
+            'inversion_estimate': self.inversion_estimate,
+            'small_int_range': self.small_int_range,
+        }
+
+    def __repr__(self):
+        return (
+            f"SortProfile(n={self.n}, runs={self.runs}, "
+            f"descending_runs={self.descending_runs}, longest_run={self.longest_run}, "
+            f"min={self.min!r}, max={self.max!r}, "
+            f"distinct_estimate={self.distinct_estimate}, "
+            f"inversion_estimate={self.inversion_estimate:.4f})"
+        )
+
+
+def analyze(arr, samples=_MUESTRA, seed=0):
+    """
+    Calcula el perfil de preordenamiento de un arreglo.
+
+    Una única pasada recorre los tramos naturales del arreglo; el mínimo y
+    el máximo salen de los extremos de cada tramo, sin comparar cada
+    elemento. Los valores distintos se estiman sobre una muestra
+    aleatoria (estimador Chao1) y las inversiones con pares aleatorios.
+    Solo se usa el operador ``<``, como en el ordenamiento.
+
+    Args:
+        arr (list): Arreglo a analizar; no se modifica.
+        samples (int, optional): Tamaño de las muestras de valores y de
+            pares. Por defecto 1024.
+        seed (int, optional): Semilla de los muestreos. Por defecto 0.
+
+    Returns:
+        SortProfile: Perfil del arreglo.
+
+    Ejemplo:
+        >>> perfil = analyze([1, 2, 3, 9, 8, 7, 4, 5, 6])
+        >>> perfil.runs, perfil.descending_runs, perfil.min, perfil.max
+        (3, 1, 1, 9)
+        >>> analyze(list(range(10, 0, -1))).is_reversed
+        True
+    """
+    n = len(arr)
+    if n == 0:
+        return SortProfile(0, 0, 0, 0, None, None, 0, 0.0, [])
+
+    tramos = 0
+    descendentes = 0
+    mas_largo = 0
+    limites = []
+    minimo = maximo = arr[0]
+
+    for inicio, fin, descendente in natural_runs(arr):
+        # Extremos del tramo: el primero y el último según su dirección
+        if descendente:
+            bajo, alto = arr[fin - 1], arr[inicio]
+            descendentes += 1
+        else:
+            bajo, alto = arr[inicio], arr[fin - 1]
+        tramos += 1
+        mas_largo = max(mas_largo, fin - inicio)
+        if bajo < minimo:
+            minimo = bajo
+        if maximo < alto:
+            maximo = alto
+        if limites is not None:
+            limites.append((inicio, fin, descendente))
+            if len(limites) > _MAX_TRAMOS_GUARDADOS:
+                limites = None
+
+    if tramos == 1:
+        # Un único tramo: las inversiones se conocen sin muestrear
+        inversiones = 1.0 if descendentes else 0.0
+    else:
+        inversiones = _estimar_inversiones(arr, samples, seed)
+
+    # El recorrido de tipos solo se paga si el rango ya hace rentable el conteo
+    enteros_acotados = (
+        type(minimo) is int and type(maximo) is int
+        and counting_sort_applicable(n, maximo - minimo) and _solo_enteros(arr)
+    )
+
+    return SortProfile(
+        n, tramos, descendentes, mas_largo, minimo, maximo,
+        _estimar_distintos(arr, samples, seed), inversiones, limites, enteros_acotados,
+    )
+
+
+def natural_runs(arr):
+    """
+    Recorre los tramos naturales de un arreglo.
+
+    Un tramo es no decreciente o estrictamente descendente (invertir estos
+    últimos no cambia el orden relativo de elementos iguales).
+
+    Args:
+        arr (list): Arreglo a recorrer.
+
+    Yields:
+        tuple: (inicio, fin, descendente) de cada tramo, con ``fin`` exclusivo.
+    """
+    n = len(arr)
+    i = 0
+    while i < n:
+        inicio = i
+        i += 1
+        if i < n and arr[i] < arr[i - 1]:
+            while i < n and arr[i] < arr[i - 1]:
+                i += 1
+            yield inicio, i, True
+        else:
+            while i < n and not arr[i] < arr[i - 1]:
+                i += 1
+            yield inicio, i, False
+
+
+def choose_engine(profile):
+    """
+    Elige el motor de ``geoflux_sort(..., engine='auto')`` para un perfil.
+
+    Args:
+        profile (SortProfile): Perfil calculado por ``analyze``.
+
+    Returns:
+        tuple: (motor, motivo) con el motor ('sorted', 'counting', 'runs',
+            'geoflux' o 'fallback') y una explicación breve de la decisión.
+    """
+    n = profile.n
+    if profile.is_sorted:
+        return 'sorted', "ya ordenado"
+    if n <= 20:
+        return 'geoflux', "arreglo pequeño (inserción directa)"
+    if profile.run_bounds is not None and profile.runs <= max(2, n.bit_length()):
+        return 'runs', f"{profile.runs} tramos naturales"
+    if profile.small_int_range:
+        return 'counting', f"enteros con rango {profile.max - profile.min}"
+    if profile.inversion_estimate <= _MAX_INVERSIONES_MIGRACION:
+        return 'geoflux', f"casi ordenado ({profile.inversion_estimate:.1%} de inversiones)"
+    return 'fallback', f"{profile.runs} tramos y {profile.inversion_estimate:.1%} de inversiones"
+
+
+def _estimar_distintos(arr, muestras, semilla):
+    """
+    Estima el número de valores distintos con el estimador Chao1.
+
+    Sobre una muestra aleatoria de posiciones (sin reemplazo, para no
+    confundirse con patrones periódicos) con d valores distintos, de los que f1
+    aparecen una vez y f2 dos veces, D = d + f1 * (f1 - 1) / (2 * (f2 + 1))
+    (versión con corrección de sesgo), acotado por n. Devuelve None si los
+    valores no son hashables.
+    """
+    n = len(arr)
+    if n <= muestras:
+        posiciones = range(n)
+    else:
+        posiciones = random.Random(semilla).sample(range(n), muestras)
+    try:
+        frecuencias = Counter([arr[k] for k in posiciones])
+    except TypeError:
+        return None
+    if n <= muestras:
+        return len(frecuencias)
+    repeticiones = Counter(frecuencias.values())
+    f1, f2 = repeticiones[1], repeticiones[2]
+    return min(n, len(frecuencias) + f1 * (f1 - 1) // (2 * (f2 + 1)))
+
+
+def _estimar_inversiones(arr, muestras, semilla):
+    """Fracción de pares aleatorios de posiciones distintas que están invertidos."""
+    n = len(arr)
+    rng = random.Random(semilla)
+    posiciones = range(n)
+    pares = invertidos = 0
+    for i, j in zip(rng.choices(posiciones, k=muestras), rng.choices(posiciones, k=muestras)):
+        if i < j:
+            pares += 1
+            invertidos += arr[j] < arr[i]
+        elif j < i:
+            pares += 1
+            invertidos += arr[i] < arr[j]
+    return invertidos / pares if pares else 0.0
@@ -3,136 +3,472 @@ Módulo de animación para GeoFlux Sort.
 
 Este módulo proporciona funcionalidad para crear visualizaciones animadas
 del proceso de ordenamiento de GeoFlux Sort utilizando matplotlib.
+
+Cada frame solo actualiza las barras cuya altura o color cambió respecto
+al frame anterior. Cuando el backend lo permite, además se redibujan y
+transfieren a pantalla únicamente las franjas de esas barras (blitting por
+regiones), de modo que el coste de un frame depende del tamaño del cambio
+y no del número de elementos.
+
+Para arreglos grandes se usa un nivel de detalle reducido: en lugar de una
+barra por elemento, los elementos se agrupan en columnas de un píxel
+(mínimo, máximo y highlight dominante de cada columna) que se dibujan como
+una única imagen.
+
+``create_recording_viewer`` muestra una grabación de ``record_sort`` con un
+deslizador y atajos de teclado: cada posición se reconstruye desde el
+fotograma clave más cercano, sin volver a ejecutar el algoritmo.
 """
 
+import math
+
+import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
+from matplotlib.widgets import Slider
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.ticker import MaxNLocator
+from matplotlib.transforms import Bbox
+
 from .algorithm import geoflux_sort_generator
+from .palette import COLOR_MAP, _colores_resaltados
+from .raster import RasterRenderer
+
+# Margen en píxeles alrededor de cada franja redibujada (antialiasing)
+_MARGEN_REGION = 2
+
+# Ancho de cada barra en unidades de datos (alineadas al borde izquierdo)
+_ANCHO_BARRA = 0.8
+
+# A partir de este número de elementos se usa el nivel de detalle reducido
+_UMBRAL_LOD = 1000
+
+# Hasta este número de elementos se etiqueta cada índice en el eje X
+_MAX_ETIQUETAS = 50
+
+# Pasos que avanzan o retroceden las flechas arriba/abajo del visor
+_SALTO_VISOR = 100
+
+
+class _RenderizadorFigura:
+    """
+    Base común de los renderizadores: textos de estado y blitting por regiones.
+
+    Las subclases crean sus artistas de datos, los aplican en
+    ``_actualizar_datos`` y los redibujan en ``_dibujar_datos``.
+    """
+
+    def __init__(self, fig, ax, status_text_obj, details_text_obj, artistas, blit):
+        self.fig = fig
+        self.ax = ax
+        self.status_text_obj = status_text_obj
+        self.details_text_obj = details_text_obj
+
+        # El blitting por regiones necesita restaurar fragmentos del fondo (Agg)
+        self.blit = bool(blit) and isinstance(fig.canvas, FigureCanvasAgg)
+        self._fondo = None
+        if self.blit:
+            for artista in list(artistas) + [status_text_obj, details_text_obj]:
+                artista.set_animated(True)
+            fig.canvas.mpl_connect('draw_event', self._al_dibujar)
+
+    def update(self, frame_data):
+        """
+        Aplica un frame del generador a los artistas de datos y a los textos.
+
+        Acepta frames completos ('array') y frames delta ('delta').
+
+        Args:
+            frame_data (dict): Datos del frame actual del generador.
+
+        Returns:
+            list: Artistas modificados en este frame.
+        """
+        artistas, region = self._actualizar_datos(frame_data)
+
+        # Textos de estado
+        textos = []
+        for texto_obj, texto in (
+            (self.status_text_obj, frame_data.get('status', 'Actualizando...')),
+            (self.details_text_obj, f"Pasada: {frame_data.get('pass_type', '')}"),
+        ):
+            if texto_obj.get_text() != texto:
+                texto_obj.set_text(texto)
+                textos.append(texto_obj)
+
+        if self.blit and self._fondo is not None:
+            self._dibujar_datos(region)
+            self._dibujar_textos(textos)
+
+        return artistas + textos
+
+    def _al_dibujar(self, evento):
+        """Guarda el fondo sin artistas animados y los dibuja encima."""
+        canvas = self.fig.canvas
+        self._fondo = canvas.copy_from_bbox(self.fig.bbox)
+        self._dibujar_todo()
+        self.fig.draw_artist(self.status_text_obj)
+        self.fig.draw_artist(self.details_text_obj)
+        canvas.blit(self.fig.bbox)
+
+    def _restaurar(self, x0, y0, x1, y1):
+        """Restaura el fondo en un rectángulo de píxeles (origen abajo a la izquierda)."""
+        alto = self.fig.bbox.height
+        # El fondo guardado usa filas con origen arriba; su esquina es (0, 0)
+        self.fig.canvas.restore_region(self._fondo, bbox=(x0, alto - y1, x1, alto - y0), xy=(0, 0))
+
+    def _dibujar_textos(self, textos):
+        """Redibuja y transfiere la banda horizontal de cada texto modificado."""
+        caja_fig = self.fig.bbox
+        caja_ax = self.ax.bbox
+        for texto_obj in textos:
+            # Banda horizontal del texto: por encima o por debajo de los ejes
+            if texto_obj is self.status_text_obj:
+                y0, y1 = caja_ax.y1 + 1, caja_fig.y1
+            else:
+                y0, y1 = caja_fig.y0, caja_ax.y0 - 1
+            self._restaurar(caja_fig.x0, y0, caja_fig.x1, y1)
+            self.fig.draw_artist(texto_obj)
+            self.fig.canvas.blit(Bbox.from_extents(caja_fig.x0, y0, caja_fig.x1, y1))
+
+
+class BarRenderer(_RenderizadorFigura):
+    """
+    Barras de la animación con actualización por regiones sucias.
+
+    Conserva las alturas y colores mostrados en el frame anterior y, en cada
+    frame, modifica solo los ``Rectangle`` que cambian. Con ``blit=True`` las
+    barras y los textos se marcan como animados: tras cada dibujado completo
+    de la figura se guarda el fondo sin ellos, y en cada frame se restaura y
+    redibuja únicamente la franja de cada tramo de barras modificado y la
+    banda de cada texto que cambió.
+
+    Args:
+        fig: Figura de matplotlib.
+        ax: Axes donde se dibujan las barras.
+        initial_data (list): Valores iniciales.
+        status_text_obj: Objeto de texto para mostrar el estado.
+        details_text_obj: Objeto de texto para mostrar detalles adicionales.
+        blit (bool, optional): Activa el blitting por regiones si el canvas lo
+            admite (backends basados en Agg). Por defecto False.
+    """
+
+    def __init__(self, fig, ax, initial_data, status_text_obj, details_text_obj, blit=False):
+        self.rects = list(ax.bar(
+            range(len(initial_data)),
+            initial_data,
+            align='edge',
+            width=_ANCHO_BARRA,
+            color=COLOR_MAP['default']
+        ))
+
+        # Estado mostrado actualmente
+        self._alturas = list(initial_data)
+        self._color_base = 'default'
+        self._colores = {}
+
+        super().__init__(fig, ax, status_text_obj, details_text_obj, self.rects, blit)
+
+    def _actualizar_datos(self, frame_data):
+        """Modifica las barras que cambian; devuelve (artistas, índices sucios)."""
+        n_elements = len(self.rects)
+        sucias = set()
+
+        # Alturas: solo las posiciones que cambiaron
+        alturas = self._alturas
+        if 'delta' in frame_data:
+            cambio = frame_data['delta']
+            if cambio is not None:
+                inicio, valores = cambio
+                for idx, valor in enumerate(valores[:n_elements - inicio], inicio):
+                    if alturas[idx] != valor:
+                        alturas[idx] = valor
+                        sucias.add(idx)
+        else:
+            for idx, valor in enumerate(frame_data.get('array', [])[:n_elements]):
+                if alturas[idx] != valor:
+                    alturas[idx] = valor
+                    sucias.add(idx)
+        for idx in sucias:
+            self.rects[idx].set_height(alturas[idx])
+
+        # Colores: índices resaltados ahora o en el frame anterior
+        color_base, colores = _colores_resaltados(frame_data.get('highlights', {}), n_elements)
+        if color_base != self._color_base:
+            por_revisar = range(n_elements)
+        else:
+            por_revisar = self._colores.keys() | colores.keys()
+        for idx in por_revisar:
+            nuevo = colores.get(idx, color_base)
+            if nuevo != self._colores.get(idx, self._color_base):
+                self.rects[idx].set_color(COLOR_MAP[nuevo])
+                sucias.add(idx)
+        self._color_base = color_base
+        self._colores = colores
+
+        sucias = sorted(sucias)
+        return [self.rects[idx] for idx in sucias], sucias
+
+    def _dibujar_todo(self):
+        """Dibuja todas las barras sobre el fondo recién guardado."""
+        for rect in self.rects:
+            self.ax.draw_artist(rect)
 
-# Mapa de colores para diferentes estados de elementos en la visualización
-COLOR_MAP = {
-    'default': 'skyblue',            # Color por defecto de las barras
-    'i': 'cornflowerblue',           # Índice principal actual
-    'j': 'sandybrown',               # Índice de comparación
-    'key_floating': 'hotpink',       # Elemento siendo movido
-    'shifting': 'lightcoral',        # Elementos siendo desplazados
-    'insertion_at': 'mediumpurple',  # Punto de inserción
-    'all_sorted': 'lightgreen',      # Arreglo completamente ordenado
-    'grupo': 'gold',                 # Grupo de elementos similares identificado
-    'moved_group': 'limegreen'       # Grupo que ha sido reubicado
-}
-
-
-def update_plot(frame_data, rects, status_text_obj, details_text_obj, fig, ax, n_elements, max_val):
+    def _dibujar_datos(self, sucias):
+        """Redibuja y transfiere solo las franjas de las barras modificadas."""
+        canvas = self.fig.canvas
+        caja_ax = self.ax.bbox
+        a_pixeles = self.ax.transData.transform
+        a_datos = self.ax.transData.inverted().transform
+        ultimo = len(self.rects) - 1
+
+        for primero, final in _tramos_contiguos(sucias):
+            x0 = max(caja_ax.x0, math.floor(a_pixeles((primero, 0))[0]) - _MARGEN_REGION)
+            x1 = min(caja_ax.x1, math.ceil(a_pixeles((final + _ANCHO_BARRA, 0))[0]) + _MARGEN_REGION)
+            if x1 <= x0:
+                continue
+            self._restaurar(x0, caja_ax.y0, x1, caja_ax.y1)
+
+            # Redibujar todas las barras que invaden la franja, no solo las sucias
+            desde = max(0, math.floor(a_datos((x0, 0))[0] - _ANCHO_BARRA))
+            hasta = min(ultimo, math.floor(a_datos((x1, 0))[0]))
+            for idx in range(desde, hasta + 1):
+                self.ax.draw_artist(self.rects[idx])
+            canvas.blit(Bbox.from_extents(x0, caja_ax.y0, x1, caja_ax.y1))
+
+
+class BinnedRenderer(_RenderizadorFigura):
+    """
+    Nivel de detalle reducido para arreglos grandes.
+
+    Los elementos se agrupan en tantas columnas como píxeles de ancho tienen
+    los ejes y se dibujan con un ``RasterRenderer``: cada columna muestra en
+    color sólido el mínimo de sus elementos, en un tono aclarado hasta el
+    máximo, y el highlight de mayor prioridad que contenga.
+
+    Con blitting por regiones, las columnas modificadas se escriben
+    directamente en el búfer del canvas y solo se transfiere su franja, sin
+    pasar por el remuestreo de imágenes de matplotlib. Sin blitting (por
+    ejemplo, al guardar), el raster se muestra como una imagen ``imshow``.
+
+    Args:
+        fig: Figura de matplotlib (con el layout ya ajustado).
+        ax: Axes donde se dibuja la imagen.
+        initial_data (list): Valores iniciales.
+        status_text_obj: Objeto de texto para mostrar el estado.
+        details_text_obj: Objeto de texto para mostrar detalles adicionales.
+        blit (bool, optional): Activa el blitting por regiones si el canvas lo
+            admite (backends basados en Agg). Por defecto False.
+    """
+
+    def __init__(self, fig, ax, initial_data, status_text_obj, details_text_obj, blit=False):
+        n_elements = len(initial_data)
+        max_val = max(initial_data)
+        self.ax = ax
+        self._highlights = {}
+        _, _, ancho, alto = self._interior()
+        self.raster = RasterRenderer(initial_data, ancho, alto)
+
+        if blit and isinstance(fig.canvas, FigureCanvasAgg):
+            self.image = None
+        else:
+            self.image = ax.imshow(
+                self.raster.rgb(),
+                extent=(-0.5, n_elements - 0.5, 0, max_val * 1.1 if max_val > 0 else 1),
+                aspect='auto',
+                interpolation='nearest',
+                origin='upper'
+            )
+        super().__init__(fig, ax, status_text_obj, details_text_obj, [], blit)
+
+    def _interior(self):
+        """Rectángulo de píxeles (x0, y0, ancho, alto) dentro de los bordes de los ejes."""
+        caja = self.ax.bbox
+        x0, y0 = math.ceil(caja.x0) + 1, math.ceil(caja.y0) + 1
+        x1, y1 = math.floor(caja.x1) - 1, math.floor(caja.y1) - 1
+        return x0, y0, max(1, x1 - x0), max(1, y1 - y0)
+
+    def _actualizar_datos(self, frame_data):
+        """Actualiza el raster; devuelve (artistas, columnas redibujadas)."""
+        self._highlights = frame_data.get('highlights', {})
+        columnas = self.raster.update(frame_data)
+        if self.image is None or columnas.size == 0:
+            return [], columnas
+        self.image.set_data(self.raster.rgb())
+        return [self.image], columnas
+
+    def _dibujar_todo(self):
+        """Escribe el raster completo sobre el fondo recién guardado."""
+        _, _, ancho, alto = self._interior()
+        if (ancho, alto) != (self.raster.width, self.raster.height):
+            # Los ejes cambiaron de tamaño: rehacer el raster con el estado actual
+            self.raster = RasterRenderer(self.raster.heights, ancho, alto)
+            self.raster.update({'highlights': self._highlights})
+        self._pintar(np.arange(self.raster.width))
+
+    def _dibujar_datos(self, columnas):
+        """Escribe y transfiere solo las columnas de píxeles modificadas."""
+        if columnas.size == 0:
+            return
+        x0, y0, _, alto = self._pintar(columnas)
+        self.fig.canvas.blit(Bbox.from_extents(
+            x0 + columnas.min(), y0, x0 + columnas.max() + 1, y0 + alto
+        ))
+
+    def _pintar(self, columnas):
+        """Copia columnas del raster al búfer del canvas; devuelve el rectángulo interior."""
+        x0, y0, ancho, alto = self._interior()
+        bufer = np.asarray(self.fig.canvas.buffer_rgba())
+        fila = bufer.shape[0] - (y0 + alto)
+        bufer[fila:fila + alto, x0 + columnas, :3] = self.raster.palette[self.raster.frame[:, columnas]]
+        return x0, y0, ancho, alto
+
+
+class _AnimacionPorRegiones(animation.FuncAnimation):
+    """FuncAnimation cuyo blitting lo realiza el renderizador dentro de cada frame."""
+
+    def _post_draw(self, framedata, blit):
+        # Con blit, las regiones ya se transfirieron; sin él, redibujado normal
+        if not blit:
+            super()._post_draw(framedata, blit)
+
+
+def _tramos_contiguos(indices):
+    """Agrupa índices ordenados en tramos (primero, último) consecutivos."""
+    tramo_inicio = tramo_fin = None
+    for idx in indices:
+        if tramo_fin is not None and idx == tramo_fin + 1:
+            tramo_fin = idx
+            continue
+        if tramo_fin is not None:
+            yield tramo_inicio, tramo_fin
+        tramo_inicio = tramo_fin = idx
+    if tramo_fin is not None:
+        yield tramo_inicio, tramo_fin
+
+
+def update_plot(frame_data, renderer):
     """
     Actualiza la visualización para cada frame de la animación.
-    
+
     Esta función es llamada por FuncAnimation para cada paso del algoritmo.
-    Actualiza las alturas y colores de las barras según el estado actual.
-    
+    Delegada en el renderizador, solo modifica las barras (o columnas) cuya
+    altura o color cambió respecto al frame anterior.
+
     Args:
         frame_data (dict): Datos del frame actual del generador
-        rects (list): Lista de objetos Rectangle de matplotlib
-        status_text_obj: Objeto de texto para mostrar el estado
-        details_text_obj: Objeto de texto para mostrar detalles adicionales
-        fig: Figura de matplotlib
-        ax: Axes de matplotlib
-        n_elements (int): Número de elementos en el arreglo
-        max_val (int): Valor máximo para escalar el eje Y
-        
+        renderer (BarRenderer | BinnedRenderer): Artistas de la animación
+
     Returns:
-        tuple: Tupla de objetos modificados para blit
+        tuple: Artistas modificados; vacía si el renderer ya realizó el
+            blitting por regiones
     """
     # Verificar si el generador se ha agotado
     if frame_data is None:
-        return tuple(rects) + (status_text_obj, details_text_obj)
-
-    info = frame_data
-    arr_state = info.get('array', [])
-
-    # Asegurar que arr_state tiene la longitud correcta
-    if len(arr_state) != n_elements:
-        # Fallback: mantener alturas actuales si hay discrepancia
-        current_heights = [r.get_height() for r in rects]
-        for i, rect in enumerate(rects):
-            if i < len(arr_state):
-                rect.set_height(arr_state[i])
-            else:
-                rect.set_height(current_heights[i] if i < len(current_heights) else 0)
+        return ()
+
+    artistas = renderer.update(frame_data)
+
+    # Con blitting por regiones FuncAnimation no debe limpiar ni redibujar nada
+    if renderer.blit:
+        return ()
+    return tuple(artistas)
+
+
+def create_bar_plot(initial_data, blit=False, lod=None, controls=False):
+    """
+    Crea la figura de barras utilizada por la animación.
+
+    Args:
+        initial_data (list): Lista de valores numéricos a representar
+        blit (bool, optional): Activa el blitting por regiones si el canvas
+            lo admite. Por defecto False.
+        lod (bool, optional): Usa el nivel de detalle reducido
+            (``BinnedRenderer``) en lugar de una barra por elemento. Por
+            defecto se activa a partir de 1000 elementos.
+        controls (bool, optional): Reserva una franja bajo los ejes para
+            los controles del visor de grabaciones. Por defecto False.
+
+    Returns:
+        tuple: (fig, renderer) con la figura y su renderizador
+    """
+    n_elements = len(initial_data)
+    max_val = max(initial_data) if initial_data else 10
+    if lod is None:
+        lod = n_elements > _UMBRAL_LOD
+
+    # Crear figura y ejes
+    fig, ax = plt.subplots(figsize=(12, 7))
+    ax.set_title("GeoFlux Sort Animation", fontsize=16)
+    ax.set_xlabel("Indice del Elemento")
+    ax.set_ylabel("Valor del Elemento")
+
+    # Crear objetos de texto para información de estado
+    status_text_obj = fig.text(
+        0.5, 0.95,
+        "Inicializando Animacion...",
+        ha="center",
+        va="bottom",
+        fontsize=12
+    )
+    details_text_obj = fig.text(
+        0.5, 0.01,
+        "",
+        ha="center",
+        va="bottom",
+        fontsize=10
+    )
+
+    # Configurar ejes: una etiqueta por índice solo para arreglos pequeños
+    if n_elements <= _MAX_ETIQUETAS:
+        ax.set_xticks(range(n_elements))
+        ax.set_xticklabels([str(i) for i in range(n_elements)])
     else:
-        # Actualizar alturas de todas las barras
-        for rect, val in zip(rects, arr_state):
-            rect.set_height(val)
-    
-    # Actualizar textos de estado
-    status_text_obj.set_text(info.get('status', 'Actualizando...'))
-    pass_info = f"Pasada: {info.get('pass_type', '')}"
-    details_text_obj.set_text(pass_info)
-
-    # Aplicar colores según los highlights
-    highlights = info.get('highlights', {})
-    
-    for idx, rect in enumerate(rects):
-        # Color por defecto
-        color = COLOR_MAP['default']
-        
-        # Verificar si todo el arreglo está ordenado
-        if highlights.get('all_sorted'):
-            color = COLOR_MAP['all_sorted']
-        # Verificar si el índice tiene un highlight específico
-        elif idx in highlights:
-            highlight_type = highlights[idx]
-            # Si el tipo de highlight está en el mapa de colores, usarlo
-            if isinstance(highlight_type, str) and highlight_type in COLOR_MAP:
-                color = COLOR_MAP[highlight_type]
-            # Manejar highlights específicos
-            elif highlight_type == 'i':
-                color = COLOR_MAP['i']
-            elif highlight_type == 'j':
-                color = COLOR_MAP['j']
-        # Verificar highlights especiales (punto de inserción, etc.)
-        elif idx == highlights.get('insertion_at'):
-            color = COLOR_MAP['insertion_at']
-        elif idx == highlights.get('key_floating'):
-            color = COLOR_MAP['key_floating']
-        elif idx == highlights.get('shifting_to') or idx == highlights.get('shifting_from'):
-            color = COLOR_MAP['shifting']
-        elif idx == highlights.get('i') and highlights.get('i') < n_elements:
-            color = COLOR_MAP['i']
-        elif idx == highlights.get('j') and highlights.get('j') < n_elements:
-            color = COLOR_MAP['j']
-            
-        rect.set_color(color)
-        
-    return tuple(rects) + (status_text_obj, details_text_obj)
-
-
-def create_geoflux_animation(initial_data, interval=300, save_to_file=None):
+        ax.xaxis.set_major_locator(MaxNLocator(nbins=10, integer=True))
+    ax.set_xlim(-0.5, n_elements - 0.5)
+    ax.set_ylim(0, max_val * 1.1)
+
+    # Ajustar layout
+    plt.tight_layout(rect=[0, 0.1 if controls else 0.05, 1, 0.92])
+
+    # Crear barras (o la imagen agrupada) una vez fijado el tamaño de los ejes
+    if lod:
+        renderer = BinnedRenderer(fig, ax, initial_data, status_text_obj, details_text_obj, blit=blit)
+    else:
+        renderer = BarRenderer(fig, ax, initial_data, status_text_obj, details_text_obj, blit=blit)
+
+    return fig, renderer
+
+
+def create_geoflux_animation(initial_data, interval=300, save_to_file=None, lod=None):
     """
     Crea y muestra (o guarda) una animación del proceso de GeoFlux Sort.
-    
+
     Esta función genera una visualización animada paso a paso del algoritmo
     GeoFlux Sort, mostrando cómo los grupos de elementos migran a través
     del arreglo.
-    
+
     Args:
         initial_data (list): Lista de valores numéricos a ordenar
-        interval (int, optional): Tiempo en milisegundos entre frames. 
+        interval (int, optional): Tiempo en milisegundos entre frames.
             Menor valor = animación más rápida. Por defecto 300ms.
         save_to_file (str, optional): Ruta del archivo para guardar la animación.
             Si es None, muestra la animación en pantalla. Requiere ffmpeg
             instalado para guardar. Por defecto None.
-            
+        lod (bool, optional): Agrupa los elementos en columnas de un píxel
+            dibujadas como una imagen en lugar de una barra por elemento.
+            Por defecto se activa a partir de 1000 elementos.
+
     Returns:
         matplotlib.animation.FuncAnimation: Objeto de animación creado,
             o None si no hay datos.
-            
+
     Ejemplo:
         >>> datos = [5, 2, 9, 1, 5, 6]
         >>> animacion = create_geoflux_animation(datos, interval=200)
         >>> # O para guardar:
         >>> animacion = create_geoflux_animation(datos, save_to_file="sort.mp4")
-        
+
     Nota:
         Para guardar animaciones se requiere ffmpeg instalado en el sistema
         y accesible desde el PATH.
@@ -142,69 +478,31 @@ def create_geoflux_animation(initial_data, interval=300, save_to_file=None):
         print("No se proporcionaron datos para la animación.")
         return None
 
-    # Configuración inicial
     n_elements = len(initial_data)
-    max_val = max(initial_data) if initial_data else 10
 
-    # Crear figura y ejes
-    fig, ax = plt.subplots(figsize=(12, 7))
-    ax.set_title("GeoFlux Sort Animation", fontsize=16)
-    ax.set_xlabel("Indice del Elemento")
-    ax.set_ylabel("Valor del Elemento")
+    # El blitting por regiones solo se usa en pantalla: al guardar se necesita
+    # que las barras formen parte del dibujado completo de cada frame
+    fig, renderer = create_bar_plot(initial_data, blit=save_to_file is None, lod=lod)
 
-    # Crear barras iniciales
-    bar_rects = ax.bar(
-        range(n_elements),
-        initial_data,
-        align='edge',
-        width=0.8,
-        color=COLOR_MAP['default']
-    )
-    
-    # Configurar ejes
-    ax.set_xticks(range(n_elements))
-    ax.set_xticklabels([str(i) for i in range(n_elements)])
-    ax.set_xlim(-0.5, n_elements - 0.5)
-    ax.set_ylim(0, max_val * 1.1)
-
-    # Crear objetos de texto para información de estado
-    status_text_obj = fig.text(
-        0.5, 0.95,
-        "Inicializando Animacion...",
-        ha="center",
-        va="bottom",
-        fontsize=12
-    )
-    details_text_obj = fig.text(
-        0.5, 0.01,
-        "",
-        ha="center",
-        va="bottom",
-        fontsize=10
-    )
-
-    # Crear generador del algoritmo
-    sorter_generator = geoflux_sort_generator(list(initial_data))
+    # Crear generador del algoritmo; los frames delta evitan copiar el arreglo en cada paso
+    sorter_generator = geoflux_sort_generator(list(initial_data), frames='delta')
 
     # Calcular número estimado de frames para guardar
     # Esto evita problemas al guardar animaciones largas
     save_count = min(1000, n_elements * n_elements + 100)
 
     # Crear animación
-    ani = animation.FuncAnimation(
+    ani = _AnimacionPorRegiones(
         fig,
         update_plot,
         frames=sorter_generator,
-        fargs=(bar_rects, status_text_obj, details_text_obj, fig, ax, n_elements, max_val),
-        blit=False,
+        fargs=(renderer,),
+        blit=renderer.blit,
         interval=interval,
         repeat=False,
         save_count=save_count
     )
 
-    # Ajustar layout
-    plt.tight_layout(rect=[0, 0.05, 1, 0.92])
-
     # Guardar o mostrar la animación
     if save_to_file:
         try:
@@ -227,5 +525,89 @@ def create_geoflux_animation(initial_data, interval=300, save_to_file=None):
     else:
         # Mostrar la animación en pantalla
         plt.show()
-    
+
     return ani
+
+
+def create_recording_viewer(recording, interval=100, lod=None, show=True):
+    """
+    Crea un visor que recorre una grabación hacia delante y hacia atrás.
+
+    El deslizador inferior selecciona el paso; cada cambio llama a
+    ``recording.seek``, que reconstruye el estado desde el fotograma clave
+    anterior en lugar de repetir la ordenación, y el renderizador solo
+    modifica las barras (o columnas) que cambian.
+
+    Atajos de teclado:
+        - Flechas izquierda/derecha: paso anterior/siguiente
+        - Flechas abajo/arriba: 100 pasos hacia atrás/delante
+        - Inicio/Fin: primer/último paso
+        - Espacio: reproducir o pausar
+
+    Args:
+        recording (SortRecording): Grabación abierta con ``SortRecording``.
+        interval (int, optional): Milisegundos entre pasos al reproducir.
+            Por defecto 100.
+        lod (bool, optional): Nivel de detalle reducido, como en
+            ``create_geoflux_animation``. Por defecto se activa a partir de
+            1000 elementos.
+        show (bool, optional): Muestra la figura con ``plt.show()``. Por
+            defecto True.
+
+    Returns:
+        tuple: (fig, slider) con la figura y el deslizador de pasos; hay que
+            conservar el deslizador mientras la figura esté abierta.
+
+    Ejemplo:
+        >>> record_sort(datos, "ejecucion.gfr")
+        >>> with SortRecording("ejecucion.gfr") as grabacion:
+        ...     create_recording_viewer(grabacion)
+    """
+    ultimo = len(recording) - 1
+    fig, renderer = create_bar_plot(recording.seek(0)['array'], lod=lod, controls=True)
+    # Sin blitting: el deslizador se redibuja junto con la figura en cada cambio
+    renderer.update(recording.seek(0))
+
+    eje_deslizador = fig.add_axes([0.15, 0.06, 0.7, 0.03])
+    slider = Slider(eje_deslizador, 'Paso', 0, max(ultimo, 1), valinit=0, valstep=1, valfmt='%d')
+
+    def mostrar(valor):
+        """Reconstruye el paso seleccionado y actualiza la figura."""
+        renderer.update(recording.seek(min(int(valor), ultimo)))
+        fig.canvas.draw_idle()
+
+    temporizador = fig.canvas.new_timer(interval=interval)
+
+    def avanzar():
+        """Avanza un paso durante la reproducción; se detiene al final."""
+        if slider.val >= ultimo:
+            temporizador.stop()
+        else:
+            slider.set_val(slider.val + 1)
+
+    reproduciendo = False
+
+    def al_pulsar(evento):
+        """Atajos de teclado para recorrer la grabación."""
+        nonlocal reproduciendo
+        saltos = {'left': -1, 'right': 1, 'down': -_SALTO_VISOR, 'up': _SALTO_VISOR}
+        if evento.key in saltos:
+            slider.set_val(min(max(slider.val + saltos[evento.key], 0), ultimo))
+        elif evento.key == 'home':
+            slider.set_val(0)
+        elif evento.key == 'end':
+            slider.set_val(ultimo)
+        elif evento.key == ' ':
+            reproduciendo = not reproduciendo
+            if reproduciendo:
+                temporizador.start()
+            else:
+                temporizador.stop()
+
+    slider.on_changed(mostrar)
+    temporizador.add_callback(avanzar)
+    fig.canvas.mpl_connect('key_press_event', al_pulsar)
+
+    if show:
+        plt.show()
+    return fig, slider
@@ -0,0 +1,241 @@
+"""
+Ordenamiento por lotes de muchos arreglos pequeños.
+
+Con millones de arreglos cortos, el coste fijo de cada llamada a
+``geoflux_sort`` (validación del motor, detección de búferes, preparación
+del núcleo) domina sobre el ordenamiento en sí. Este módulo ordena lotes
+completos repartiéndolos por clases de tamaño:
+
+    - Los arreglos de hasta 200 elementos se agrupan por longitud en bloques
+      bidimensionales de NumPy, y todas las filas del bloque se ordenan a la
+      vez con los intercambios condicionales de la inserción directa (la
+      rama del núcleo para n <= 20), vectorizados por columnas y agrupados
+      en rondas de transposición par-impar.
+    - Los arreglos mayores pasan directamente por el núcleo de GeoFlux Sort,
+      sin la preparación de ``geoflux_sort``.
+
+``geoflux_sort_many`` puede además repartir el lote en tandas entre varios
+procesos; ``geoflux_sort_rows`` ordena las filas de una matriz de NumPy.
+"""
+
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
+
+import numpy as np
+
+from .algorithm import _geoflux_nucleo
+from .numpy_engine import geoflux_sort_numpy, _TIPOS_SOPORTADOS
+
+# Longitud máxima de los arreglos ordenados por bloques: por encima, el coste
+# cuadrático de las rondas par-impar se acerca al del motor fila a fila
+_MAX_BLOQUE = 200
+
+# Con menos filas de una misma longitud, vectorizar no compensa
+_MIN_FILAS = 16
+
+# Arreglos por tanda enviada a cada proceso
+_TAMANO_TANDA = 20000
+
+
+def geoflux_sort_many(arrays, reverse=False, workers=None, chunk_size=_TAMANO_TANDA):
+    """
+    Ordena in-place cada lista de un lote de listas.
+
+    Equivale a llamar ``geoflux_sort(arr, reverse=reverse)`` para cada
+    lista, pero reparte el coste fijo entre todo el lote: las listas cortas
+    de enteros o de flotantes se ordenan por bloques con NumPy y las demás
+    pasan directamente por el núcleo.
+
+    Args:
+        arrays (iterable): Listas a ordenar in-place (cada una de valores
+            comparables, como en ``geoflux_sort``).
+        reverse (bool, optional): Si es True, cada lista queda en orden
+            descendente. Por defecto False.
+        workers (int, optional): Número de procesos. Con None o 1 el lote se
+            ordena en el proceso actual; con más, se reparte en tandas de
+            ``chunk_size`` listas (que se copian al proceso y de vuelta) si
+            hay al menos dos tandas. Por defecto None.
+        chunk_size (int, optional): Listas por tanda en el modo multiproceso.
+            Por defecto 20000.
+
+    Returns:
+        None: Las listas se modifican directamente.
+
+    Raises:
+        ValueError: Si ``workers`` o ``chunk_size`` son menores que 1.
+
+    Ejemplo:
+        >>> lote = [[3, 1, 2], [9.5, 4.0], [7, 7, 1, 0]]
+        >>> geoflux_sort_many(lote)
+        >>> lote
+        [[1, 2, 3], [4.0, 9.5], [0, 1, 7, 7]]
+    """
+    if workers is not None and workers < 1:
+        raise ValueError("workers debe ser al menos 1")
+    if chunk_size < 1:
+        raise ValueError("chunk_size debe ser al menos 1")
+    arrays = arrays if isinstance(arrays, list) else list(arrays)
+
+    if workers is not None and workers > 1 and len(arrays) >= 2 * chunk_size:
+        tandas = [arrays[k:k + chunk_size] for k in range(0, len(arrays), chunk_size)]
+        with ProcessPoolExecutor(max_workers=min(workers, len(tandas))) as executor:
+            for tanda, ordenadas in zip(tandas, executor.map(_ordenar_tanda, tandas, repeat(reverse))):
+                for arr, ordenada in zip(tanda, ordenadas):
+                    arr[:] = ordenada
+        return
+
+    _ordenar_lote(arrays, reverse)
+
+
+def geoflux_sort_rows(matrix, reverse=False):
+    """
+    Ordena in-place cada fila de una matriz de NumPy.
+
+    Las matrices de hasta 200 columnas se ordenan a la vez en todas las
+    filas con rondas de intercambios condicionales vectorizados; las más anchas ordenan cada
+    fila con ``geoflux_sort_numpy``.
+
+    Args:
+        matrix (numpy.ndarray): Matriz bidimensional de enteros o flotantes.
+        reverse (bool, optional): Si es True, cada fila queda en orden
+            descendente. Por defecto False.
+
+    Returns:
+        None: La matriz se modifica directamente.
+
+    Raises:
+        TypeError: Si ``matrix`` no es un ``numpy.ndarray`` o su tipo de dato
+            no es entero ni flotante.
+        ValueError: Si la matriz no es bidimensional, no es escribible o
+            contiene valores NaN.
+
+    Ejemplo:
+        >>> import numpy as np
+        >>> datos = np.array([[3, 1, 2], [6, 5, 4]])
+        >>> geoflux_sort_rows(datos)
+        >>> print(datos)
+        [[1 2 3]
+         [4 5 6]]
+    """
+    if not isinstance(matrix, np.ndarray):
+        raise TypeError("geoflux_sort_rows requiere un numpy.ndarray")
+    if matrix.dtype.kind not in _TIPOS_SOPORTADOS:
+        raise TypeError(f"Tipo de dato no soportado: {matrix.dtype}")
+    if matrix.ndim != 2:
+        raise ValueError("geoflux_sort_rows solo admite matrices bidimensionales")
+    if not matrix.flags.writeable:
+        raise ValueError("La matriz debe ser escribible para ordenarse in-place")
+
+    filas, n = matrix.shape
+    if filas == 0 or n <= 1:
+        return
+    # Los NaN no tienen un orden definido respecto al resto de valores
+    if matrix.dtype.kind == 'f' and np.isnan(matrix).any():
+        raise ValueError("La matriz contiene valores NaN")
+
+    if n <= _MAX_BLOQUE:
+        # Columnas contiguas: cada intercambio recorre memoria consecutiva
+        columnas = np.ascontiguousarray(matrix.T)
+        _ordenar_columnas(columnas)
+        matrix[...] = columnas.T
+    else:
+        for fila in matrix:
+            geoflux_sort_numpy(fila)
+    if reverse:
+        matrix[...] = matrix[:, ::-1]
+
+
+def _ordenar_tanda(tanda, reverse):
+    """Ordena una tanda de listas en un proceso del pool y la devuelve."""
+    _ordenar_lote(tanda, reverse)
+    return tanda
+
+
+def _ordenar_lote(arrays, reverse):
+    """
+    Ordena in-place un lote de listas repartiéndolas por clases de tamaño.
+
+    Las listas cortas se agrupan por longitud y cada grupo se ordena como
+    un bloque; las largas (y los bloques que no se pueden vectorizar) pasan
+    por el núcleo una a una.
+    """
+    cortas = defaultdict(list)
+    for arr in arrays:
+        n = len(arr)
+        if n <= 1:
+            continue
+        if n <= _MAX_BLOQUE:
+            cortas[n].append(arr)
+        else:
+            _geoflux_nucleo(arr, None)
+            if reverse:
+                arr.reverse()
+
+    for filas in cortas.values():
+        if len(filas) >= _MIN_FILAS and _ordenar_bloque(filas, reverse):
+            continue
+        for arr in filas:
+            _geoflux_nucleo(arr, None)
+            if reverse:
+                arr.reverse()
+
+
+def _ordenar_bloque(filas, reverse):
+    """
+    Ordena in-place listas de igual longitud como un bloque de NumPy.
+
+    Solo se vectorizan bloques de enteros (que quepan en 64 bits) o de
+    flotantes sin NaN, sin mezclar tipos, de modo que al escribir de vuelta
+    cada valor conserva su tipo de Python.
+
+    Returns:
+        bool: False si el bloque no se puede vectorizar y no se modificó.
+    """
+    tipos = set(map(type, chain.from_iterable(filas)))
+    if tipos == {int}:
+        tipo = np.int64
+    elif tipos == {float}:
+        tipo = np.float64
+    else:
+        return False
+    n = len(filas[0])
+    try:
+        bloque = np.fromiter(chain.from_iterable(filas), dtype=tipo,
+                             count=len(filas) * n).reshape(len(filas), n)
+    except OverflowError:
+        return False
+    if tipo is np.float64 and np.isnan(bloque).any():
+        return False
+
+    # Columnas contiguas: cada intercambio recorre memoria consecutiva
+    columnas = np.ascontiguousarray(bloque.T)
+    _ordenar_columnas(columnas)
+    if reverse:
+        columnas = columnas[::-1]
+    for arr, fila in zip(filas, columnas.T.tolist()):
+        arr[:] = fila
+    return True
+
+
+def _ordenar_columnas(columnas):
+    """
+    Ordena a la vez todas las filas de un bloque por transposición par-impar.
+
+    ``columnas`` tiene forma (n, filas): la posición j de todas las filas
+    está en ``columnas[j]``. Los comparadores son los de la inserción
+    directa (intercambios condicionales entre posiciones vecinas), pero
+    agrupados en rondas: en las rondas pares se comparan los pares (0, 1),
+    (2, 3)... y en las impares (1, 2), (3, 4)...; cada ronda son dos
+    operaciones de NumPy sobre todo el bloque. Tras n rondas cada fila está
+    ordenada, de modo que el número de operaciones es lineal en n en lugar
+    de los n^2 / 2 intercambios sueltos de la inserción.
+    """
+    n = columnas.shape[0]
+    for ronda in range(n):
+        paridad = ronda % 2
+        izquierda = columnas[paridad:n - 1:2]
+        derecha = columnas[paridad + 1:n:2]
+        menores = np.minimum(izquierda, derecha)
+        np.maximum(izquierda, derecha, out=derecha)
+        izquierda[...] = menores
@@ -0,0 +1,467 @@
+"""
+Banco de pruebas de rendimiento de GeoFlux Sort.
+
+Este módulo mide algoritmos de ordenamiento sobre cargas de trabajo
+reproducibles y guarda los resultados en JSON para compararlos entre
+versiones del código:
+
+    - Cargas de trabajo: aleatoria, ordenada, invertida y, sobre todo, las
+      que GeoFlux aprovecha (clusters, pocos valores distintos, casi
+      ordenada, diente de sierra, órgano, gaussiana).
+    - Medición: ``time.perf_counter``, ejecuciones de calentamiento,
+      repeticiones con el recolector de basura desactivado, mediana y rango
+      intercuartílico (IQR).
+    - Comparación: marca como regresión cada caso cuya mediana empeora más
+      que el umbral y más que el ruido medido.
+
+Uso desde la línea de comandos:
+    python -m geoflux_sorter.bench run -o base.json
+    python -m geoflux_sorter.bench run --sizes 1000 5000 --workloads clustered -o nuevo.json
+    python -m geoflux_sorter.bench compare base.json nuevo.json --threshold 0.1
+    python -m geoflux_sorter.bench trace --workload clustered --size 5000 -o traza.json
+    python -m geoflux_sorter.bench profile --workload random --size 5000
+
+``compare`` termina con código 1 si encuentra alguna regresión. ``trace``
+exporta las fases de un ordenamiento como trace-event JSON de Chrome y
+``profile`` muestra el perfil de ``cProfile`` de las funciones del paquete.
+"""
+
+import argparse
+import gc
+import json
+import math
+import platform
+import random
+import statistics
+import sys
+import time
+from functools import partial
+
+from .algorithm import geoflux_sort
+from .tracing import SortTrace, profile_sort
+
+# Versión del formato del archivo de resultados
+_FORMATO = 1
+
+
+def _aleatoria(n, rng):
+    """Permutación aleatoria sin repetidos."""
+    return rng.sample(range(n * 10), n)
+
+
+def _ordenada(n, rng):
+    """Valores ya ordenados."""
+    return list(range(n))
+
+
+def _invertida(n, rng):
+    """Valores en orden descendente."""
+    return list(range(n, 0, -1))
+
+
+def _clusters(n, rng):
+    """Bloques contiguos de valores parecidos, con los bloques desordenados."""
+    tam_bloque = max(1, int(n ** 0.5))
+    centros = rng.sample(range(0, n * 10, 10), (n + tam_bloque - 1) // tam_bloque)
+    datos = []
+    for centro in centros:
+        datos.extend(centro + rng.randint(0, 9) for _ in range(tam_bloque))
+    return datos[:n]
+
+
+def _pocos_valores(n, rng):
+    """Solo 10 valores distintos."""
+    valores = rng.sample(range(1000), 10)
+    return [rng.choice(valores) for _ in range(n)]
+
+
+def _casi_ordenada(n, rng):
+    """Valores ordenados con un 1% de intercambios aleatorios."""
+    datos = list(range(n))
+    for _ in range(max(1, n // 100)):
+        i, j = rng.randrange(n), rng.randrange(n)
+        datos[i], datos[j] = datos[j], datos[i]
+    return datos
+
+
+def _diente_sierra(n, rng):
+    """Diez tramos ascendentes consecutivos."""
+    diente = max(1, n // 10)
+    return [i % diente for i in range(n)]
+
+
+def _diente_sierra_real(n, rng):
+    """Diez tramos ascendentes de flotantes (no usa la ruta de conteo de enteros)."""
+    diente = max(1, n // 10)
+    return [i % diente + rng.random() for i in range(n)]
+
+
+def _organo(n, rng):
+    """Mitad ascendente seguida de mitad descendente."""
+    mitad = n // 2
+    return list(range(mitad)) + list(range(n - mitad, 0, -1))
+
+
+def _gaussiana(n, rng):
+    """Enteros con distribución normal alrededor de n / 2."""
+    return [int(rng.gauss(n / 2, n / 8)) for _ in range(n)]
+
+
+# Generadores de cargas de trabajo: nombre -> función (n, rng) -> list
+WORKLOADS = {
+    'random': _aleatoria,
+    'sorted': _ordenada,
+    'reversed': _invertida,
+    'clustered': _clusters,
+    'few_unique': _pocos_valores,
+    'nearly_sorted': _casi_ordenada,
+    'sawtooth': _diente_sierra,
+    'sawtooth_float': _diente_sierra_real,
+    'organ_pipe': _organo,
+    'gaussian': _gaussiana,
+}
+
+# Algoritmos medidos por defecto: nombre -> función que ordena una lista in-place
+ALGORITHMS = {
+    'geoflux': geoflux_sort,
+    'geoflux-auto': partial(geoflux_sort, engine='auto'),
+    'list.sort': list.sort,
+}
+
+
+def generate_workload(name, n, seed=0):
+    """
+    Genera una carga de trabajo reproducible.
+
+    Args:
+        name (str): Nombre de la carga (clave de ``WORKLOADS``).
+        n (int): Número de elementos.
+        seed (int, optional): Semilla del generador aleatorio. Por defecto 0.
+
+    Returns:
+        list: Datos de la carga de trabajo.
+
+    Raises:
+        ValueError: Si la carga de trabajo no existe.
+    """
+    if name not in WORKLOADS:
+        raise ValueError(
+            f"Carga de trabajo desconocida: {name!r}; opciones: {', '.join(WORKLOADS)}"
+        )
+    return WORKLOADS[name](n, random.Random(f"{name}-{n}-{seed}"))
+
+
+def measure(func, data, repeats=5, warmup=1, min_time=0.02):
+    """
+    Mide el tiempo de ordenar una copia de ``data`` con ``func``.
+
+    Cada ordenamiento trabaja sobre una copia nueva (la copia no se mide) y
+    con el recolector de basura desactivado, como ``timeit``. Igual que
+    ``timeit.autorange``, cada muestra promedia tantos ordenamientos como
+    hagan falta para durar al menos ``min_time``, de modo que las entradas
+    que se ordenan en microsegundos no queden dominadas por el ruido.
+
+    Args:
+        func (callable): Función que ordena una lista in-place.
+        data (list): Datos de entrada; no se modifican.
+        repeats (int, optional): Muestras medidas. Por defecto 5.
+        warmup (int, optional): Ordenamientos previos descartados (al menos
+            uno, que fija las iteraciones por muestra). Por defecto 1.
+        min_time (float, optional): Duración mínima de cada muestra en
+            segundos. Por defecto 0.02.
+
+    Returns:
+        dict: ``times`` (segundos por ordenamiento de cada muestra),
+            ``median``, ``iqr``, ``min`` y ``loops`` (ordenamientos por muestra).
+
+    Raises:
+        ValueError: Si ``repeats`` es menor que 1.
+    """
+    if repeats < 1:
+        raise ValueError("repeats debe ser al menos 1")
+
+    def cronometrar(iteraciones):
+        total = 0.0
+        for _ in range(iteraciones):
+            copia = list(data)
+            gc.disable()
+            inicio = time.perf_counter()
+            func(copia)
+            total += time.perf_counter() - inicio
+            if gc_activo:
+                gc.enable()
+        return total
+
+    gc_activo = gc.isenabled()
+    try:
+        calentamiento = max(1, warmup)
+        estimado = cronometrar(calentamiento) / calentamiento
+        iteraciones = max(1, math.ceil(min_time / estimado)) if estimado > 0 else 1
+        tiempos = [cronometrar(iteraciones) / iteraciones for _ in range(repeats)]
+    finally:
+        if gc_activo:
+            gc.enable()
+
+    if len(tiempos) > 1:
+        q1, _, q3 = statistics.quantiles(tiempos, n=4, method='inclusive')
+        iqr = q3 - q1
+    else:
+        iqr = 0.0
+    return {
+        'times': tiempos,
+        'median': statistics.median(tiempos),
+        'iqr': iqr,
+        'min': min(tiempos),
+        'loops': iteraciones,
+    }
+
+
+def run_benchmarks(sizes=(1000, 5000), workloads=None, algorithms=None, repeats=5,
+                   warmup=1, min_time=0.02, seed=0, progress=None):
+    """
+    Mide cada algoritmo sobre cada carga de trabajo y tamaño.
+
+    Args:
+        sizes (iterable, optional): Tamaños de entrada. Por defecto (1000, 5000).
+        workloads (iterable, optional): Nombres de cargas de trabajo. Por
+            defecto todas las de ``WORKLOADS``.
+        algorithms (dict, optional): Nombre -> función que ordena in-place.
+            Por defecto ``ALGORITHMS``.
+        repeats (int, optional): Ejecuciones medidas por caso. Por defecto 5.
+        warmup (int, optional): Ejecuciones de calentamiento. Por defecto 1.
+        min_time (float, optional): Duración mínima de cada muestra en
+            segundos (ver ``measure``). Por defecto 0.02.
+        seed (int, optional): Semilla de las cargas de trabajo. Por defecto 0.
+        progress (callable, optional): Se llama con cada resultado al terminarlo.
+
+    Returns:
+        dict: ``meta`` (entorno y parámetros) y ``results`` (una entrada por
+            algoritmo, carga y tamaño con ``median``, ``iqr``, ``min`` y ``times``).
+    """
+    workloads = list(WORKLOADS) if workloads is None else list(workloads)
+    algorithms = ALGORITHMS if algorithms is None else algorithms
+
+    resultados = []
+    for workload in workloads:
+        for size in sizes:
+            datos = generate_workload(workload, size, seed)
+            for nombre, func in algorithms.items():
+                medida = measure(func, datos, repeats=repeats, warmup=warmup, min_time=min_time)
+                resultado = {'algorithm': nombre, 'workload': workload, 'size': size}
+                resultado.update(medida)
+                resultados.append(resultado)
+                if progress is not None:
+                    progress(resultado)
+
+    return {
+        'meta': {
+            'format': _FORMATO,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'repeats': repeats,
+            'warmup': warmup,
+            'min_time': min_time,
+            'seed': seed,
+        },
+        'results': resultados,
+    }
+
+
+def save_results(results, path):
+    """Escribe los resultados de ``run_benchmarks`` en un archivo JSON."""
+    with open(path, 'w', encoding='utf-8') as archivo:
+        json.dump(results, archivo, indent=2)
+
+
+def load_results(path):
+    """Lee un archivo de resultados escrito por ``save_results``."""
+    with open(path, encoding='utf-8') as archivo:
+        return json.load(archivo)
+
+
+def compare_results(base, current, threshold=0.10):
+    """
+    Compara dos conjuntos de resultados caso a caso.
+
+    Un caso es una regresión si su mediana empeora más que ``threshold``
+    (relativo) y la diferencia supera el IQR de ambas mediciones, de modo
+    que el ruido de una máquina cargada no se confunda con una regresión.
+
+    Args:
+        base (dict): Resultados de referencia.
+        current (dict): Resultados nuevos.
+        threshold (float, optional): Empeoramiento relativo tolerado. Por
+            defecto 0.10 (10%).
+
+    Returns:
+        list: Un diccionario por caso presente en ambos archivos con
+            ``algorithm``, ``workload``, ``size``, ``base``, ``current``
+            (medianas en segundos), ``ratio`` y ``status`` ('regression',
+            'improvement' u 'ok').
+    """
+    def indexar(resultados):
+        return {(r['algorithm'], r['workload'], r['size']): r for r in resultados['results']}
+
+    referencia = indexar(base)
+    comparacion = []
+    for clave, nuevo in indexar(current).items():
+        anterior = referencia.get(clave)
+        if anterior is None:
+            continue
+        diferencia = nuevo['median'] - anterior['median']
+        ratio = nuevo['median'] / anterior['median'] if anterior['median'] > 0 else float('inf')
+        significativa = abs(diferencia) > max(anterior['iqr'], nuevo['iqr'])
+        if significativa and ratio > 1 + threshold:
+            estado = 'regression'
+        elif significativa and ratio < 1 / (1 + threshold):
+            estado = 'improvement'
+        else:
+            estado = 'ok'
+        algoritmo, carga, tamaño = clave
+        comparacion.append({
+            'algorithm': algoritmo,
+            'workload': carga,
+            'size': tamaño,
+            'base': anterior['median'],
+            'current': nuevo['median'],
+            'ratio': ratio,
+            'status': estado,
+        })
+    return comparacion
+
+
+def _tabla(filas, encabezados):
+    """Formatea filas como una tabla de texto alineada."""
+    filas = [[str(celda) for celda in fila] for fila in filas]
+    anchos = [max(len(encabezado), *(len(fila[k]) for fila in filas)) if filas else len(encabezado)
+              for k, encabezado in enumerate(encabezados)]
+    lineas = ["  ".join(e.ljust(a) for e, a in zip(encabezados, anchos)),
+              "  ".join("-" * a for a in anchos)]
+    lineas.extend("  ".join(c.ljust(a) for c, a in zip(fila, anchos)) for fila in filas)
+    return "\n".join(lineas)
+
+
+def _comando_run(args):
+    def progreso(r):
+        print(f"  {r['algorithm']:<10} {r['workload']:<14} {r['size']:>8}  "
+              f"mediana {r['median'] * 1000:.3f}ms  IQR {r['iqr'] * 1000:.3f}ms", flush=True)
+
+    algoritmos = ALGORITHMS
+    if args.algorithms:
+        desconocidos = set(args.algorithms) - set(ALGORITHMS)
+        if desconocidos:
+            raise SystemExit(f"Algoritmos desconocidos: {', '.join(sorted(desconocidos))}")
+        algoritmos = {nombre: ALGORITHMS[nombre] for nombre in args.algorithms}
+
+    resultados = run_benchmarks(
+        sizes=args.sizes, workloads=args.workloads, algorithms=algoritmos,
+        repeats=args.repeats, warmup=args.warmup, min_time=args.min_time, seed=args.seed,
+        progress=progreso,
+    )
+    if args.output:
+        save_results(resultados, args.output)
+        print(f"Resultados guardados en {args.output}")
+    return 0
+
+
+def _comando_compare(args):
+    comparacion = compare_results(load_results(args.base), load_results(args.current), args.threshold)
+    filas = [
+        [c['algorithm'], c['workload'], c['size'], f"{c['base'] * 1000:.3f}ms",
+         f"{c['current'] * 1000:.3f}ms", f"{c['ratio']:.2f}x", c['status']]
+        for c in comparacion
+    ]
+    print(_tabla(filas, ["Algoritmo", "Carga", "Tamaño", "Base", "Actual", "Ratio", "Estado"]))
+
+    regresiones = [c for c in comparacion if c['status'] == 'regression']
+    print(f"\n{len(regresiones)} regresiones en {len(comparacion)} casos "
+          f"(umbral {args.threshold:.0%})")
+    return 1 if regresiones else 0
+
+
+def _comando_trace(args):
+    datos = generate_workload(args.workload, args.size, args.seed)
+    traza = SortTrace()
+    for _ in range(args.repeats):
+        geoflux_sort(list(datos), trace=traza)
+
+    filas = [
+        [nombre, r['count'], f"{r['total'] * 1000:.3f}ms", f"{r['mean'] * 1000:.3f}ms"]
+        for nombre, r in sorted(traza.totals().items(), key=lambda item: -item[1]['total'])
+    ]
+    print(_tabla(filas, ["Fase", "Veces", "Total", "Media"]))
+    if args.output:
+        traza.save(args.output)
+        print(f"\nTraza guardada en {args.output} (abrir con chrome://tracing o ui.perfetto.dev)")
+    return 0
+
+
+def _comando_profile(args):
+    datos = generate_workload(args.workload, args.size, args.seed)
+    profile_sort(datos, repeats=args.repeats, sort_by=args.sort, limit=args.limit,
+                 path=args.output)
+    if args.output:
+        print(f"Perfil completo guardado en {args.output}")
+    return 0
+
+
+def main(argv=None):
+    """
+    Punto de entrada de ``python -m geoflux_sorter.bench``.
+
+    Args:
+        argv (list, optional): Argumentos de la línea de comandos. Por defecto
+            ``sys.argv[1:]``.
+
+    Returns:
+        int: Código de salida (1 si ``compare`` encuentra regresiones).
+    """
+    parser = argparse.ArgumentParser(prog='python -m geoflux_sorter.bench',
+                                     description="Benchmarks reproducibles de GeoFlux Sort")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run = subparsers.add_parser('run', help="Mide los algoritmos y guarda los resultados")
+    run.add_argument('--sizes', type=int, nargs='+', default=[1000, 5000])
+    run.add_argument('--workloads', nargs='+', choices=list(WORKLOADS), default=None)
+    run.add_argument('--algorithms', nargs='+', default=None,
+                     help=f"Subconjunto de: {', '.join(ALGORITHMS)}")
+    run.add_argument('--repeats', type=int, default=5)
+    run.add_argument('--warmup', type=int, default=1)
+    run.add_argument('--min-time', type=float, default=0.02,
+                     help="Duración mínima de cada muestra en segundos")
+    run.add_argument('--seed', type=int, default=0)
+    run.add_argument('-o', '--output', help="Archivo JSON de resultados")
+    run.set_defaults(func=_comando_run)
+
+    compare = subparsers.add_parser('compare', help="Compara dos archivos de resultados")
+    compare.add_argument('base')
+    compare.add_argument('current')
+    compare.add_argument('--threshold', type=float, default=0.10,
+                         help="Empeoramiento relativo tolerado (por defecto 0.10)")
+    compare.set_defaults(func=_comando_compare)
+
+    for nombre, ayuda in (('trace', "Exporta las fases de un ordenamiento (trace-event JSON)"),
+                          ('profile', "Perfila un ordenamiento con cProfile")):
+        sub = subparsers.add_parser(nombre, help=ayuda)
+        sub.add_argument('--workload', choices=list(WORKLOADS), default='random')
+        sub.add_argument('--size', type=int, default=5000)
+        sub.add_argument('--seed', type=int, default=0)
+        sub.add_argument('--repeats', type=int, default=1)
+        if nombre == 'trace':
+            sub.add_argument('-o', '--output', help="Archivo JSON de la traza")
+            sub.set_defaults(func=_comando_trace)
+        else:
+            sub.add_argument('--sort', default='cumulative',
+                             help="Criterio de orden de pstats (por defecto cumulative)")
+            sub.add_argument('--limit', type=int, default=25)
+            sub.add_argument('-o', '--output', help="Archivo del perfil completo (pstats)")
+            sub.set_defaults(func=_comando_profile)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,259 @@
+"""
+Contenedor ordenado incremental basado en la migración por grupos.
+
+Este módulo define ``GeoFluxList``, una lista que se mantiene ordenada
+mientras recibe inserciones. Los valores nuevos se acumulan en un búfer y,
+periódicamente, el búfer se ordena y se integra en el cuerpo ordenado
+migrando grupos hacia sus puntos de inserción, con la misma búsqueda por
+galope que utiliza el flujo ascendente (FASE 1) de GeoFlux Sort.
+"""
+
+from bisect import bisect_left, bisect_right
+
+from .algorithm import geoflux_sort, _galope_izquierda
+
+# Tamaño mínimo del búfer antes de integrarlo en el cuerpo ordenado
+_CARGA_MINIMA = 64
+
+
+class GeoFluxList:
+    """
+    Lista ordenada con inserciones amortizadas sublineales.
+
+    Las inserciones se acumulan en un búfer sin ordenar. Cuando el búfer
+    supera ~√n elementos, o cuando una consulta necesita el orden completo,
+    se ordena con ``geoflux_sort`` y se integra en el cuerpo: los valores
+    del búfer que comparten punto de inserción forman un grupo que migra
+    como unidad, y solo se desplaza la parte del cuerpo situada a la
+    derecha del grupo más pequeño. El coste amortizado por inserción es
+    O(√n) en lugar del O(n) de volver a ordenar toda la lista.
+
+    Args:
+        iterable (iterable, optional): Valores iniciales. Por defecto vacío.
+
+    Ejemplo:
+        >>> lista = GeoFluxList([5, 1, 9])
+        >>> lista.add(4)
+        >>> lista.update([7, 2])
+        >>> list(lista)
+        [1, 2, 4, 5, 7, 9]
+        >>> list(lista.irange(2, 5))
+        [2, 4, 5]
+    """
+
+    def __init__(self, iterable=None):
+        self._cuerpo = list(iterable) if iterable is not None else []
+        geoflux_sort(self._cuerpo)
+        self._bufer = []
+
+    # === INSERCIONES ===
+
+    def add(self, value):
+        """
+        Inserta un valor.
+
+        Args:
+            value: Valor comparable con los ya presentes.
+        """
+        self._bufer.append(value)
+        if len(self._bufer) > self._carga():
+            self._fusionar_bufer()
+
+    def update(self, iterable):
+        """
+        Inserta todos los valores de un iterable.
+
+        Args:
+            iterable (iterable): Valores a insertar.
+        """
+        self._bufer.extend(iterable)
+        if len(self._bufer) > self._carga():
+            self._fusionar_bufer()
+
+    # === ELIMINACIÓN ===
+
+    def remove(self, value):
+        """
+        Elimina una aparición de un valor.
+
+        Args:
+            value: Valor a eliminar.
+
+        Raises:
+            ValueError: Si el valor no está en la lista.
+        """
+        self._fusionar_bufer()
+        indice = bisect_left(self._cuerpo, value)
+        if indice == len(self._cuerpo) or self._cuerpo[indice] != value:
+            raise ValueError(f"{value!r} no está en la lista")
+        del self._cuerpo[indice]
+
+    def discard(self, value):
+        """
+        Elimina una aparición de un valor si está presente.
+
+        Args:
+            value: Valor a eliminar.
+        """
+        try:
+            self.remove(value)
+        except ValueError:
+            pass
+
+    # === CONSULTAS ===
+
+    def bisect_left(self, value):
+        """
+        Índice donde se insertaría ``value`` a la izquierda de sus iguales.
+
+        Args:
+            value: Valor a ubicar.
+
+        Returns:
+            int: Posición de inserción.
+        """
+        self._fusionar_bufer()
+        return bisect_left(self._cuerpo, value)
+
+    def bisect_right(self, value):
+        """
+        Índice donde se insertaría ``value`` a la derecha de sus iguales.
+
+        Args:
+            value: Valor a ubicar.
+
+        Returns:
+            int: Posición de inserción.
+        """
+        self._fusionar_bufer()
+        return bisect_right(self._cuerpo, value)
+
+    bisect = bisect_right
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True)):
+        """
+        Itera sobre los valores comprendidos en un rango.
+
+        Args:
+            minimum (optional): Límite inferior; None para no acotar.
+            maximum (optional): Límite superior; None para no acotar.
+            inclusive (tuple, optional): Si cada límite se incluye.
+                Por defecto (True, True).
+
+        Returns:
+            iterator: Valores del rango en orden ascendente.
+        """
+        inicio, fin = self._limites_rango(minimum, maximum, inclusive)
+        return iter(self._cuerpo[inicio:fin])
+
+    def count_range(self, minimum=None, maximum=None, inclusive=(True, True)):
+        """
+        Cuenta los valores comprendidos en un rango.
+
+        Args:
+            minimum (optional): Límite inferior; None para no acotar.
+            maximum (optional): Límite superior; None para no acotar.
+            inclusive (tuple, optional): Si cada límite se incluye.
+                Por defecto (True, True).
+
+        Returns:
+            int: Número de valores en el rango.
+        """
+        inicio, fin = self._limites_rango(minimum, maximum, inclusive)
+        return max(0, fin - inicio)
+
+    def __len__(self):
+        return len(self._cuerpo) + len(self._bufer)
+
+    def __getitem__(self, index):
+        self._fusionar_bufer()
+        return self._cuerpo[index]
+
+    def __iter__(self):
+        self._fusionar_bufer()
+        return iter(self._cuerpo)
+
+    def __contains__(self, value):
+        self._fusionar_bufer()
+        indice = bisect_left(self._cuerpo, value)
+        return indice < len(self._cuerpo) and self._cuerpo[indice] == value
+
+    def __repr__(self):
+        self._fusionar_bufer()
+        return f"GeoFluxList({self._cuerpo!r})"
+
+    # === FUNCIONES INTERNAS ===
+
+    def _carga(self):
+        """Tamaño de búfer a partir del cual se integra en el cuerpo (~√n)."""
+        return max(_CARGA_MINIMA, int(len(self._cuerpo) ** 0.5))
+
+    def _limites_rango(self, minimum, maximum, inclusive):
+        """Calcula los índices [inicio, fin) del cuerpo que cubren un rango."""
+        self._fusionar_bufer()
+        incluir_min, incluir_max = inclusive
+        if minimum is None:
+            inicio = 0
+        elif incluir_min:
+            inicio = bisect_left(self._cuerpo, minimum)
+        else:
+            inicio = bisect_right(self._cuerpo, minimum)
+        if maximum is None:
+            fin = len(self._cuerpo)
+        elif incluir_max:
+            fin = bisect_right(self._cuerpo, maximum)
+        else:
+            fin = bisect_left(self._cuerpo, maximum)
+        return inicio, fin
+
+    def _fusionar_bufer(self):
+        """
+        Integra el búfer en el cuerpo ordenado migrando grupos.
+
+        El búfer se ordena y se recorre de derecha a izquierda. En cada paso,
+        el mayor valor pendiente localiza su punto de inserción con la
+        búsqueda por galope de FASE 1; todos los valores pendientes que
+        comparten ese punto forman un grupo. La parte del cuerpo que el
+        grupo adelanta se desplaza a la derecha y el grupo se copia en su
+        lugar, ambos mediante asignación por rebanadas.
+        """
+        bufer = self._bufer
+        if not bufer:
+            return
+        self._bufer = []
+        geoflux_sort(bufer)
+
+        cuerpo = self._cuerpo
+        fin = len(cuerpo) - 1
+        pendientes = len(bufer)
+
+        # Reservar espacio al final; el cuerpo se reescribe de derecha a izquierda
+        cuerpo.extend(bufer)
+        escritura = len(cuerpo)
+
+        while pendientes > 0 and fin >= 0:
+            # Punto de inserción del mayor valor pendiente
+            punto_insercion, _ = _galope_izquierda(cuerpo, bufer[pendientes - 1], fin)
+
+            # El grupo lo forman los valores pendientes no menores que cuerpo[punto - 1]
+            if punto_insercion > 0:
+                grupo_inicio = bisect_left(bufer, cuerpo[punto_insercion - 1], 0, pendientes)
+            else:
+                grupo_inicio = 0
+
+            # Desplazar a la derecha los elementos del cuerpo que el grupo adelanta
+            tramo = fin + 1 - punto_insercion
+            if tramo:
+                cuerpo[escritura - tramo:escritura] = cuerpo[punto_insercion:fin + 1]
+                escritura -= tramo
+
+            # Colocar el grupo delante de los elementos desplazados
+            cuerpo[escritura - (pendientes - grupo_inicio):escritura] = bufer[grupo_inicio:pendientes]
+            escritura -= pendientes - grupo_inicio
+
+            pendientes = grupo_inicio
+            fin = punto_insercion - 1
+
+        # Los valores restantes son menores que todo el cuerpo
+        if pendientes > 0:
+            cuerpo[:pendientes] = bufer[:pendientes]
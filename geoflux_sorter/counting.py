@@ -0,0 +1,160 @@
+"""
+Ordenamiento por conteo para enteros de rango acotado.
+
+Cuando todos los valores son enteros y su rango (máximo - mínimo) es
+pequeño en relación con el número de elementos, contar cuántas veces
+aparece cada valor y reescribir el arreglo en orden cuesta O(n + rango),
+frente al coste cuadrático de la migración de grupos. ``geoflux_sort`` y
+``geoflux_sort_numpy`` usan este camino automáticamente tras calcular el
+rango. Con un acompañante (índices de ``key``, ``geoflux_argsort`` o
+``geoflux_lexsort``) cada elemento se coloca en la siguiente posición libre
+de su valor, un reparto estable que aplica la misma permutación al
+acompañante.
+
+Los arreglos grandes se cuentan sobre un búfer ``array('q')`` con
+``numpy.bincount``; los pequeños, con una lista de contadores.
+"""
+
+from array import array
+from itertools import chain, repeat
+
+import numpy as np
+
+# El conteo compensa mientras el rango no supere este múltiplo de n
+_MAX_RANGO_POR_ELEMENTO = 4
+
+# Rango máximo absoluto (limita la memoria de los contadores a 64 MiB)
+_MAX_RANGO = 1 << 23
+
+# A partir de este tamaño se cuenta sobre búferes de NumPy
+_MIN_NUMPY = 1000
+
+# Límites de los enteros que caben en un búfer de 64 bits
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+
+def counting_sort_applicable(n, rango):
+    """
+    Modelo de coste: indica si el conteo compensa para n valores y un rango.
+
+    Args:
+        n (int): Número de elementos.
+        rango (int): Máximo menos mínimo de los valores.
+
+    Returns:
+        bool: True si O(n + rango) es preferible y la memoria está acotada.
+    """
+    return rango <= _MAX_RANGO and rango <= _MAX_RANGO_POR_ELEMENTO * n
+
+
+def _solo_enteros(arr):
+    """Todos los elementos son ``int`` exactamente (no ``bool`` ni subclases)."""
+    return set(map(type, arr)) == {int}
+
+
+def _ordenar_por_conteo(arr, minimo, maximo, acompanante=None):
+    """
+    Reescribe una lista de enteros en orden a partir de sus frecuencias.
+
+    Los enteros iguales son indistinguibles, de modo que reescribirlos no
+    altera el resultado respecto a moverlos. Con acompañante, en cambio, el
+    orden de los iguales importa y se usa ``_repartir_por_conteo``.
+
+    Args:
+        arr (list): Enteros a ordenar in-place.
+        minimo (int): Valor mínimo de ``arr``.
+        maximo (int): Valor máximo de ``arr``.
+        acompanante (list | array.array, optional): Secuencia paralela a
+            ``arr`` que recibe la misma permutación. Por defecto None.
+    """
+    if acompanante is not None:
+        _repartir_por_conteo(arr, minimo, maximo, acompanante)
+        return
+
+    n = len(arr)
+    if n >= _MIN_NUMPY and _INT64_MIN <= minimo and maximo <= _INT64_MAX:
+        valores = np.frombuffer(array('q', arr), dtype=np.int64)
+        arr[:] = _conteo_numpy(valores, minimo, maximo).tolist()
+        return
+
+    cuentas = [0] * (maximo - minimo + 1)
+    for valor in arr:
+        cuentas[valor - minimo] += 1
+    arr[:] = chain.from_iterable([
+        repeat(valor, veces) for valor, veces in zip(range(minimo, maximo + 1), cuentas) if veces
+    ])
+
+
+def _repartir_por_conteo(arr, minimo, maximo, acompanante):
+    """
+    Ordena por conteo una lista de enteros moviendo con ella su acompañante.
+
+    El reparto es estable: los elementos de igual valor conservan su orden
+    relativo. Los arreglos grandes usan el ``argsort`` estable de NumPy
+    sobre los valores desplazados, que con rangos de hasta 16 bits es una
+    ordenación por radix en O(n).
+
+    Args:
+        arr (list): Enteros a ordenar in-place.
+        minimo (int): Valor mínimo de ``arr``.
+        maximo (int): Valor máximo de ``arr``.
+        acompanante (list | array.array): Secuencia paralela a ``arr``.
+    """
+    n = len(arr)
+    rango = maximo - minimo
+    if n >= _MIN_NUMPY and _INT64_MIN <= minimo and maximo <= _INT64_MAX:
+        valores = np.frombuffer(array('q', arr), dtype=np.int64)
+        desplazados = valores - np.int64(minimo)
+        if rango < 1 << 16:
+            desplazados = desplazados.astype(np.uint8 if rango < 1 << 8 else np.uint16)
+        orden = np.argsort(desplazados, kind='stable')
+        arr[:] = valores[orden].tolist()
+        if isinstance(acompanante, array):
+            # Reordenar el búfer del acompañante sin convertirlo en objetos de Python
+            with memoryview(acompanante) as memoria:
+                reordenado = np.asarray(memoria)[orden].tobytes()
+            acompanante[:] = array(acompanante.typecode, reordenado)
+        else:
+            acompanante[:] = [acompanante[k] for k in orden.tolist()]
+        return
+
+    # Primera posición libre de cada valor: suma prefija de las frecuencias
+    siguiente = [0] * (rango + 1)
+    for valor in arr:
+        siguiente[valor - minimo] += 1
+    acumulado = 0
+    for i, veces in enumerate(siguiente):
+        siguiente[i] = acumulado
+        acumulado += veces
+
+    orden = [0] * n
+    for k, valor in enumerate(arr):
+        posicion = siguiente[valor - minimo]
+        siguiente[valor - minimo] = posicion + 1
+        orden[posicion] = k
+
+    arr[:] = [arr[k] for k in orden]
+    valores = [acompanante[k] for k in orden]
+    if isinstance(acompanante, array):
+        valores = array(acompanante.typecode, valores)
+    acompanante[:] = valores
+
+
+def _conteo_numpy(valores, minimo, maximo):
+    """
+    Devuelve los valores de un arreglo entero de NumPy ordenados por conteo.
+
+    Args:
+        valores (numpy.ndarray): Arreglo unidimensional de enteros que caben
+            en 64 bits con signo.
+        minimo (int): Valor mínimo.
+        maximo (int): Valor máximo.
+
+    Returns:
+        numpy.ndarray: Nuevo arreglo ordenado del mismo tipo de dato.
+    """
+    # Desplazar en 64 bits: en tipos estrechos (int8, ...) la resta podría desbordar
+    desplazados = valores.astype(np.int64) - np.int64(minimo)
+    cuentas = np.bincount(desplazados, minlength=maximo - minimo + 1)
+    return np.repeat(np.arange(minimo, maximo + 1, dtype=valores.dtype), cuentas)
@@ -0,0 +1,248 @@
+"""
+Ordenamiento externo (fuera de memoria) con GeoFlux Sort.
+
+Este módulo ordena archivos binarios de valores numéricos de ancho fijo
+que no caben en memoria. El proceso tiene dos etapas:
+
+    1. Generación de corridas: el archivo se lee mediante ``mmap`` en
+       fragmentos que caben en el límite de memoria; cada fragmento se
+       ordena con el motor GeoFlux y se escribe en un archivo temporal.
+    2. Fusión: las corridas ordenadas se combinan con una fusión k-way
+       basada en un montículo, leyendo y escribiendo en bloques.
+
+La memoria máxima utilizada (medida con ``tracemalloc``) no supera el
+parámetro ``memory_limit``: la sobrecarga fija se descuenta del límite y el
+resto se reparte entre los fragmentos o los búferes de la fusión según el
+coste medido por elemento, que incluye los objetos de Python de las listas.
+No depende del tamaño del archivo.
+"""
+
+import heapq
+import io
+import mmap
+import os
+import tempfile
+
+import numpy as np
+
+from .algorithm import geoflux_sort
+from .numpy_engine import geoflux_sort_numpy
+
+# Límite de memoria por defecto: 64 MiB
+_LIMITE_MEMORIA = 64 * 1024 * 1024
+
+# Sobrecarga fija que se descuenta del límite (montículo y generadores de la
+# fusión, cachés de NumPy y del núcleo); medida entre 30 y 70 KiB
+_SOBRECARGA_FIJA = 96 * 1024
+
+# Bytes auxiliares por elemento del motor NumPy, además de las copias del valor:
+# desplazamientos, bandas e índices o, en la ruta de conteo de los enteros,
+# hasta cuatro contadores de 64 bits (el rango llega a 4·n)
+_AUXILIAR_NUMPY = 48
+
+# Bytes por elemento de un valor de Python dentro de una lista (objeto + puntero)
+_AUXILIAR_LISTA = 40
+
+# Bytes auxiliares por elemento del motor de listas: el valor de Python y los
+# segmentos temporales
+_AUXILIAR_ORDEN_LISTA = 96
+
+# Con enteros, el motor de listas puede tomar la ruta de conteo: hasta cuatro
+# contadores por elemento además del valor de Python
+_AUXILIAR_CONTEO_LISTA = 128
+
+# Tamaño mínimo, en elementos, de cada búfer durante la fusión
+_MIN_BLOQUE = 512
+
+
+def geoflux_sort_file(input_path, output_path, dtype='d', memory_limit=_LIMITE_MEMORIA,
+                      engine='numpy', tmp_dir=None):
+    """
+    Ordena un archivo binario de valores numéricos de ancho fijo.
+
+    Args:
+        input_path (str): Ruta del archivo de entrada.
+        output_path (str): Ruta del archivo ordenado de salida. Puede
+            coincidir con ``input_path``.
+        dtype (str, optional): Tipo de cada registro, como código de
+            ``array`` ('d', 'f', 'q', 'i', ...) o dtype de NumPy ('<f8').
+            Por defecto 'd' (flotante de 64 bits en orden nativo).
+        memory_limit (int, optional): Memoria máxima en bytes, incluida la
+            sobrecarga fija (unos 96 KiB). Por defecto 64 MiB.
+        engine (str, optional): Motor para ordenar cada fragmento:
+            'numpy' (geoflux_sort_numpy) o 'list' (geoflux_sort).
+            Por defecto 'numpy'.
+        tmp_dir (str, optional): Directorio para las corridas temporales.
+            Por defecto el directorio temporal del sistema.
+
+    Returns:
+        int: Número de registros ordenados.
+
+    Raises:
+        ValueError: Si el tamaño del archivo no es múltiplo del tamaño del
+            registro, el motor no existe, el límite de memoria es
+            demasiado pequeño o el archivo contiene valores NaN.
+
+    Ejemplo:
+        >>> geoflux_sort_file("lecturas.bin", "lecturas_ordenadas.bin",
+        ...                   dtype='d', memory_limit=256 * 1024 * 1024)
+    """
+    dtype = np.dtype(dtype)
+    if dtype.kind not in 'iuf':
+        raise ValueError(f"Tipo de registro no soportado: {dtype}")
+    if engine not in ('numpy', 'list'):
+        raise ValueError(f"Motor desconocido: {engine}")
+
+    # Lo que queda del límite tras la sobrecarga fija se reparte por elementos
+    presupuesto = memory_limit - _SOBRECARGA_FIJA
+
+    # Elementos por fragmento según el coste en memoria de cada motor
+    enteros = dtype.kind in 'iu'
+    if engine == 'numpy':
+        # Fragmento y copia permutada; el conteo añade hasta cuatro candidatos
+        coste_elemento = (6 if enteros else 2) * dtype.itemsize + _AUXILIAR_NUMPY
+    else:
+        coste_elemento = dtype.itemsize + (_AUXILIAR_CONTEO_LISTA if enteros else _AUXILIAR_ORDEN_LISTA)
+    elementos_fragmento = presupuesto // coste_elemento
+
+    # Durante la fusión se necesitan al menos dos corridas y la salida en memoria
+    max_corridas_fusion = presupuesto // _coste_bufer(_MIN_BLOQUE, dtype) - 1
+    if elementos_fragmento < _MIN_BLOQUE or max_corridas_fusion < 2:
+        raise ValueError(f"memory_limit demasiado pequeño: {memory_limit} bytes")
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as directorio:
+        # === ETAPA 1: GENERACIÓN DE CORRIDAS ORDENADAS ===
+        corridas, total = _generar_corridas(input_path, dtype, elementos_fragmento, engine, directorio)
+
+        # === ETAPA 2: FUSIÓN K-WAY POR NIVELES ===
+        # Si hay más corridas de las que caben en memoria, se fusionan por tandas
+        nivel = 0
+        while len(corridas) > max_corridas_fusion:
+            nivel += 1
+            nuevas_corridas = []
+            for k in range(0, len(corridas), max_corridas_fusion):
+                destino = os.path.join(directorio, f"nivel{nivel}_{k}.bin")
+                _fusionar_corridas(corridas[k:k + max_corridas_fusion], destino, dtype, presupuesto)
+                nuevas_corridas.append(destino)
+            for ruta in corridas:
+                os.remove(ruta)
+            corridas = nuevas_corridas
+
+        _fusionar_corridas(corridas, output_path, dtype, presupuesto)
+
+    return total
+
+
+def _generar_corridas(input_path, dtype, elementos_fragmento, engine, directorio):
+    """
+    Lee el archivo en fragmentos mediante mmap y escribe cada uno ordenado.
+
+    Args:
+        input_path (str): Ruta del archivo de entrada.
+        dtype (numpy.dtype): Tipo de cada registro.
+        elementos_fragmento (int): Número máximo de registros por fragmento.
+        engine (str): Motor de ordenamiento ('numpy' o 'list').
+        directorio (str): Directorio donde escribir las corridas.
+
+    Returns:
+        tuple: (rutas_corridas, total_registros)
+    """
+    tamano = os.path.getsize(input_path)
+    if tamano % dtype.itemsize:
+        raise ValueError(
+            f"El tamaño del archivo ({tamano} bytes) no es múltiplo del registro ({dtype.itemsize} bytes)"
+        )
+    total = tamano // dtype.itemsize
+
+    corridas = []
+    if total == 0:
+        return corridas, total
+
+    with open(input_path, 'rb') as archivo:
+        with mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            for inicio in range(0, total, elementos_fragmento):
+                cantidad = min(elementos_fragmento, total - inicio)
+
+                # Copiar el fragmento desde el mapa (el mapa es de solo lectura)
+                fragmento = np.frombuffer(
+                    mapa, dtype=dtype, count=cantidad, offset=inicio * dtype.itemsize
+                ).copy()
+
+                # Los NaN no tienen un orden definido (ninguno de los dos motores los admite)
+                if dtype.kind == 'f' and np.isnan(fragmento).any():
+                    raise ValueError("El archivo contiene valores NaN")
+
+                if engine == 'numpy':
+                    geoflux_sort_numpy(fragmento)
+                else:
+                    valores = fragmento.tolist()
+                    del fragmento
+                    geoflux_sort(valores)
+                    fragmento = np.array(valores, dtype=dtype)
+                    del valores
+
+                ruta = os.path.join(directorio, f"corrida{len(corridas)}.bin")
+                fragmento.tofile(ruta)
+                corridas.append(ruta)
+                del fragmento
+
+    return corridas, total
+
+
+def _coste_bufer(elementos, dtype):
+    """
+    Bytes que ocupa un búfer de la fusión con ``elementos`` valores.
+
+    Cada valor está en el bloque de NumPy leído (y en el siguiente mientras
+    se lee) y como objeto de Python en una lista; cada archivo abierto
+    añade además su búfer de lectura o escritura.
+    """
+    return elementos * (2 * dtype.itemsize + _AUXILIAR_LISTA) + io.DEFAULT_BUFFER_SIZE
+
+
+def _fusionar_corridas(corridas, output_path, dtype, presupuesto):
+    """
+    Fusiona corridas ordenadas en un archivo mediante un montículo.
+
+    Cada corrida se lee en bloques y la salida se escribe también en bloques,
+    de modo que solo hay ``len(corridas) + 1`` búferes en memoria.
+
+    Args:
+        corridas (list): Rutas de las corridas ordenadas.
+        output_path (str): Ruta del archivo de salida.
+        dtype (numpy.dtype): Tipo de cada registro.
+        presupuesto (int): Memoria en bytes para los búferes, ya descontada
+            la sobrecarga fija.
+    """
+    bytes_bufer = presupuesto // (len(corridas) + 1) - io.DEFAULT_BUFFER_SIZE
+    elementos_bloque = max(_MIN_BLOQUE, bytes_bufer // (2 * dtype.itemsize + _AUXILIAR_LISTA))
+
+    with open(output_path, 'wb') as salida:
+        bufer = []
+        for valor in heapq.merge(*(_leer_corrida(ruta, dtype, elementos_bloque) for ruta in corridas)):
+            bufer.append(valor)
+            if len(bufer) == elementos_bloque:
+                np.array(bufer, dtype=dtype).tofile(salida)
+                bufer.clear()
+        if bufer:
+            np.array(bufer, dtype=dtype).tofile(salida)
+
+
+def _leer_corrida(ruta, dtype, elementos_bloque):
+    """
+    Genera los valores de una corrida leyéndola en bloques.
+
+    Args:
+        ruta (str): Ruta de la corrida.
+        dtype (numpy.dtype): Tipo de cada registro.
+        elementos_bloque (int): Registros por bloque de lectura.
+
+    Yields:
+        int | float: Valores de la corrida en orden.
+    """
+    with open(ruta, 'rb') as archivo:
+        while True:
+            bloque = np.fromfile(archivo, dtype=dtype, count=elementos_bloque)
+            if bloque.size == 0:
+                return
+            yield from bloque.tolist()
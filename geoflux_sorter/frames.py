@@ -0,0 +1,98 @@
+"""
+Reconstrucción de estados a partir de pasos delta.
+
+``geoflux_sort_generator(..., frames='delta')`` cede en cada paso solo el
+tramo del arreglo que cambió. Este módulo define ``FrameReplayer``, que
+aplica esos tramos sobre un único arreglo mantenido en memoria y solo
+construye copias completas cuando un consumidor las pide.
+"""
+
+
+class FrameReplayer:
+    """
+    Reproduce pasos delta sobre un arreglo propio.
+
+    Aplicar un paso cuesta O(k), con k el tamaño del tramo modificado; los
+    pasos sin cambios (comparaciones, identificación de grupos) cuestan O(1).
+    El primer paso del generador contiene el arreglo completo y sirve de base,
+    por lo que cada ejecución del generador necesita su propio reproductor.
+
+    Ejemplo:
+        >>> reproductor = FrameReplayer()
+        >>> for estado in geoflux_sort_generator([3, 1, 2], frames='delta'):
+        ...     reproductor.apply(estado)
+        ...     if estado['pass_type'] == 'Finalizado':
+        ...         print(reproductor.snapshot(estado)['array'])
+        [1, 2, 3]
+    """
+
+    def __init__(self):
+        self.array = []
+        self.keys = None
+
+    def apply(self, frame):
+        """
+        Aplica el tramo modificado de un paso delta.
+
+        Args:
+            frame (dict): Paso cedido por ``geoflux_sort_generator`` en modo
+                'delta'.
+
+        Returns:
+            bool: True si el paso modificó el arreglo.
+        """
+        cambio = frame['delta']
+        if cambio is None:
+            return False
+        inicio, valores = cambio
+        self.array[inicio:inicio + len(valores)] = valores
+
+        cambio_claves = frame.get('keys_delta')
+        if cambio_claves is not None:
+            if self.keys is None:
+                self.keys = []
+            inicio, claves = cambio_claves
+            self.keys[inicio:inicio + len(claves)] = claves
+        return True
+
+    def snapshot(self, frame):
+        """
+        Construye el estado completo equivalente al modo 'full'.
+
+        Debe llamarse después de ``apply(frame)``.
+
+        Args:
+            frame (dict): Paso delta ya aplicado.
+
+        Returns:
+            dict: Estado con 'array' (y 'keys', si las hay), 'pass_type',
+                'status', 'highlights' y 'operation'.
+        """
+        estado = {'array': list(self.array)}
+        if self.keys is not None:
+            estado['keys'] = list(self.keys)
+        estado['pass_type'] = frame['pass_type']
+        estado['status'] = frame['status']
+        estado['highlights'] = frame['highlights']
+        estado['operation'] = frame['operation']
+        return estado
+
+
+def expand_frames(frames):
+    """
+    Convierte una secuencia de pasos delta en estados completos.
+
+    Útil para consumidores que esperan el formato 'full'; cada estado
+    cedido incluye una copia del arreglo, por lo que solo conviene cuando
+    realmente se necesitan todos.
+
+    Args:
+        frames (iterable): Pasos cedidos en modo 'delta'.
+
+    Yields:
+        dict: Estados con el mismo formato que el modo 'full'.
+    """
+    reproductor = FrameReplayer()
+    for frame in frames:
+        reproductor.apply(frame)
+        yield reproductor.snapshot(frame)
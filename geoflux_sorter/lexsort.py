@@ -0,0 +1,142 @@
+"""
+Ordenamiento lexicográfico por varias columnas.
+
+``geoflux_lexsort`` ordena por una columna principal y resuelve los empates
+con las siguientes sin construir una tupla por fila: la columna principal
+se ordena con la migración de grupos llevando como acompañante un arreglo
+compacto de índices, y cada columna secundaria solo se consulta dentro de
+los tramos de claves iguales que deja la anterior.
+
+El umbral de similitud del algoritmo necesita claves numéricas; las
+columnas de otro tipo (cadenas, fechas...) se sustituyen por su rango denso
+entre los valores distintos, que conserva el orden y admite resta.
+"""
+
+from array import array
+
+import numpy as np
+
+from .algorithm import _MOTORES, _preparar_nucleo
+
+
+def geoflux_lexsort(columns, reverse=False, stats=None, trace=None, engine='geoflux'):
+    """
+    Devuelve la permutación que ordena filas por varias columnas clave.
+
+    La primera columna es la clave principal (al contrario que
+    ``numpy.lexsort``, que usa la última). El algoritmo ordena la columna
+    principal moviendo a la vez los índices de fila; después recorre los
+    tramos de claves iguales y ordena cada tramo con más de un elemento por
+    la columna siguiente, y así sucesivamente. Las columnas secundarias solo
+    se leen para las filas empatadas.
+
+    Args:
+        columns: Columnas clave de igual longitud, como secuencia de
+            secuencias paralelas (listas, ``array.array``,
+            ``numpy.ndarray``) o como un arreglo estructurado de NumPy, cuyos
+            campos se usan en orden (``tabla[['region', 'ts']]`` selecciona
+            y ordena los campos).
+        reverse (bool, optional): Si es True, la permutación produce orden
+            lexicográfico descendente. Por defecto False.
+        stats (SortStats, optional): Colector de contadores, como en
+            ``geoflux_sort``. Por defecto None.
+        trace (SortTrace, optional): Registro de fases, como en
+            ``geoflux_sort``. Por defecto None.
+        engine (str, optional): Motor de ordenamiento de cada columna, como
+            en ``geoflux_sort``. Por defecto 'geoflux'.
+
+    Returns:
+        array.array: Índices de tipo 'q' de las filas en orden; se aplican a
+            las columnas con ``apply_permutation``.
+
+    Raises:
+        ValueError: Si no hay columnas, sus longitudes difieren o ``engine``
+            no es un motor conocido.
+        TypeError: Si una columna no numérica contiene valores no hashables
+            o no comparables.
+
+    Nota:
+        Como ``geoflux_sort``, no es estable: las filas con todas las claves
+        iguales pueden quedar en cualquier orden relativo.
+
+    Ejemplo:
+        >>> regiones = ['sur', 'norte', 'sur', 'norte']
+        >>> instantes = [3, 2, 1, 1]
+        >>> list(geoflux_lexsort([regiones, instantes]))
+        [3, 1, 2, 0]
+    """
+    if engine not in _MOTORES:
+        raise ValueError(f"engine debe ser uno de {', '.join(_MOTORES)}; se recibió {engine!r}")
+
+    if isinstance(columns, np.ndarray) and columns.dtype.names is not None:
+        columns = [columns[nombre] for nombre in columns.dtype.names]
+    columns = list(columns)
+    if not columns:
+        raise ValueError("geoflux_lexsort requiere al menos una columna clave")
+    n = len(columns[0])
+    for columna in columns:
+        if len(columna) != n:
+            raise ValueError("Todas las columnas clave deben tener la misma longitud")
+
+    nucleo, stats = _preparar_nucleo(stats, trace, engine)
+    if trace is not None:
+        t_total = trace.now()
+
+    indices = array('q', range(n))
+    # Tramos (inicio, fin, nivel) pendientes de ordenar por la columna ``nivel``
+    pendientes = [(0, n, 0)] if n > 1 else []
+    claves_columnas = [None] * len(columns)
+
+    while pendientes:
+        inicio, fin, nivel = pendientes.pop()
+        if claves_columnas[nivel] is None:
+            claves_columnas[nivel] = _claves_numericas(columns[nivel])
+        columna = claves_columnas[nivel]
+
+        # Claves del tramo en el orden actual de sus filas; los índices las acompañan
+        tramo = indices[inicio:fin]
+        claves = [columna[k] for k in tramo]
+        nucleo(claves, tramo)
+        indices[inicio:fin] = tramo
+
+        # Los empates de esta columna se resuelven con la siguiente
+        if nivel + 1 < len(columns):
+            pendientes.extend(
+                (inicio + a, inicio + b, nivel + 1) for a, b in _tramos_iguales(claves)
+            )
+
+    if reverse:
+        indices.reverse()
+
+    if trace is not None:
+        trace.complete('geoflux_lexsort', t_total, n=n, columns=len(columns))
+    return indices
+
+
+def _claves_numericas(columna):
+    """
+    Devuelve una columna como lista de números comparables por resta.
+
+    Las columnas de enteros o flotantes se convierten a números de Python;
+    las demás se sustituyen por el rango denso de cada valor entre los
+    valores distintos (0 para el menor), que conserva el orden y los
+    empates.
+    """
+    if isinstance(columna, np.ndarray) and columna.dtype.kind in 'iuf':
+        return columna.tolist()
+    valores = columna.tolist() if hasattr(columna, 'tolist') else list(columna)
+    if set(map(type, valores)) <= {int, float}:
+        return valores
+    rangos = {valor: rango for rango, valor in enumerate(sorted(set(valores)))}
+    return [rangos[valor] for valor in valores]
+
+
+def _tramos_iguales(claves):
+    """Recorre los tramos (inicio, fin) de al menos dos claves iguales consecutivas."""
+    n = len(claves)
+    inicio = 0
+    for i in range(1, n + 1):
+        if i == n or claves[i] != claves[inicio]:
+            if i - inicio > 1:
+                yield inicio, i
+            inicio = i
@@ -0,0 +1,282 @@
+"""
+Motor vectorizado de GeoFlux Sort para arreglos de NumPy.
+
+Este módulo implementa una versión de GeoFlux Sort pensada para columnas
+numéricas grandes (millones de valores) almacenadas en un ``numpy.ndarray``.
+En lugar de recorrer el arreglo elemento por elemento, cada fase del
+algoritmo se expresa con operaciones vectorizadas:
+
+    - Detección de secciones ordenadas mediante máscaras de ``diff``
+    - Cálculo del rango y del umbral de similitud con reducciones de NumPy
+    - Ordenamiento por conteo (``bincount``) para enteros de rango acotado
+    - Detección de grupos similares mediante bandas de umbral
+    - Migración de grupos mediante asignación por rebanadas (slices)
+"""
+
+import numpy as np
+
+from .counting import counting_sort_applicable, _conteo_numpy, _INT64_MAX
+
+# Tipos de dato soportados: enteros con signo ('i'), sin signo ('u') y flotantes ('f')
+_TIPOS_SOPORTADOS = 'iuf'
+
+# Con un umbral de similitud del 5% del rango, el arreglo se divide en 20 bandas
+_NUM_BANDAS = 20
+
+
+def geoflux_sort_numpy(arr):
+    """
+    Ordena un arreglo de NumPy in-place utilizando un motor GeoFlux vectorizado.
+
+    El motor sigue la misma estructura que ``geoflux_sort``: detecta las
+    secciones ya ordenadas al inicio y al final, identifica grupos de valores
+    similares (elementos cuya distancia es menor al 5% del rango) en la zona
+    desordenada, los migra como unidades a su región y finalmente fusiona
+    la zona central con las secciones ordenadas mediante los flujos
+    ascendente y descendente.
+
+    Args:
+        arr (numpy.ndarray): Arreglo unidimensional de enteros o flotantes
+            a ordenar in-place.
+
+    Returns:
+        None: El arreglo se modifica directamente.
+
+    Raises:
+        TypeError: Si ``arr`` no es un ``numpy.ndarray`` o su tipo de dato
+            no es entero ni flotante.
+        ValueError: Si el arreglo no es unidimensional, no es escribible
+            o contiene valores NaN.
+
+    Complejidad Temporal:
+        - Mejor caso: O(n) para arreglos ya ordenados
+        - Caso promedio: O(n log n)
+
+    Complejidad Espacial:
+        - O(n) auxiliar (índices y copias temporales de los grupos migrados)
+
+    Ejemplo:
+        >>> import numpy as np
+        >>> datos = np.array([5, 2, 9, 1, 5, 6])
+        >>> geoflux_sort_numpy(datos)
+        >>> print(datos)
+        [1 2 5 5 6 9]
+    """
+    if not isinstance(arr, np.ndarray):
+        raise TypeError("geoflux_sort_numpy requiere un numpy.ndarray")
+    if arr.dtype.kind not in _TIPOS_SOPORTADOS:
+        raise TypeError(f"Tipo de dato no soportado: {arr.dtype}")
+    if arr.ndim != 1:
+        raise ValueError("geoflux_sort_numpy solo admite arreglos unidimensionales")
+    if not arr.flags.writeable:
+        raise ValueError("El arreglo debe ser escribible para ordenarse in-place")
+
+    n = arr.size
+
+    # Caso base: arreglos de 0 o 1 elemento ya están ordenados
+    if n <= 1:
+        return
+
+    # Los NaN no tienen un orden definido respecto al resto de valores
+    if arr.dtype.kind == 'f' and np.isnan(arr).any():
+        raise ValueError("El arreglo contiene valores NaN")
+
+    # Detección vectorizada de secciones ordenadas: posiciones donde A[i+1] < A[i]
+    descensos = np.flatnonzero(arr[1:] < arr[:-1])
+    if descensos.size == 0:
+        return
+
+    # Para arreglos pequeños el coste de vectorizar no compensa
+    if n <= 20:
+        arr.sort()
+        return
+
+    # Enteros de rango acotado: ordenamiento por conteo en O(n + rango)
+    if arr.dtype.kind in 'iu':
+        minimo, maximo = int(arr.min()), int(arr.max())
+        if maximo <= _INT64_MAX and counting_sort_applicable(n, maximo - minimo):
+            arr[:] = _conteo_numpy(arr, minimo, maximo)
+            return
+
+    # arr[0..seccion_ordenada_inicio] y arr[seccion_ordenada_fin..n-1] ya están ordenados
+    seccion_ordenada_inicio = int(descensos[0])
+    seccion_ordenada_fin = int(descensos[-1]) + 1
+
+    # Migrar por grupos la zona central desordenada (vista, sin copia)
+    centro = arr[seccion_ordenada_inicio + 1:seccion_ordenada_fin]
+    if centro.size > 1:
+        _migrar_grupos(centro)
+
+    # === FASE 1: FLUJO ASCENDENTE ===
+    # Los elementos del centro menores que el final del prefijo migran a la izquierda
+    _fluir_hacia_prefijo(arr, seccion_ordenada_inicio + 1, seccion_ordenada_fin)
+
+    # === FASE 2: FLUJO DESCENDENTE ===
+    # Los elementos mayores que el inicio del sufijo migran a la derecha
+    _fluir_hacia_sufijo(arr, seccion_ordenada_fin)
+
+
+def _ordenar_bufer(buf, reverse=False):
+    """
+    Ordena in-place, sin copias, un objeto con protocolo de búfer.
+
+    Acepta ``array.array``, ``bytearray``, ``memoryview`` o cualquier objeto
+    que exponga un búfer unidimensional escribible de enteros o flotantes.
+    El búfer se envuelve en un ``numpy.ndarray`` que comparte su memoria y
+    se ordena con ``geoflux_sort_numpy``: los valores nunca se convierten
+    en objetos de Python.
+
+    Args:
+        buf: Objeto con protocolo de búfer (o ``numpy.ndarray``).
+        reverse (bool, optional): Orden descendente. Por defecto False.
+
+    Raises:
+        TypeError: Si el formato del búfer no es entero ni flotante.
+        ValueError: Si el búfer no es unidimensional, no es escribible o
+            contiene valores NaN.
+    """
+    if isinstance(buf, np.ndarray):
+        _ordenar_vista(buf, reverse)
+        return
+
+    # La vista debe liberarse antes que el memoryview para no bloquear el búfer
+    with memoryview(buf) as memoria:
+        vista = np.asarray(memoria)
+        try:
+            _ordenar_vista(vista, reverse)
+        finally:
+            del vista
+
+
+def _es_bufer(arr):
+    """Indica si ``arr`` expone el protocolo de búfer."""
+    try:
+        memoryview(arr).release()
+    except TypeError:
+        return False
+    return True
+
+
+def _ordenar_vista(vista, reverse):
+    """Ordena un ``numpy.ndarray`` in-place, opcionalmente en orden descendente."""
+    geoflux_sort_numpy(vista)
+    if reverse and vista.size > 1:
+        # NumPy detecta el solapamiento entre origen y destino
+        vista[:] = vista[::-1]
+
+
+def _migrar_grupos(segmento):
+    """
+    Agrupa los valores similares de un segmento y los migra a su región.
+
+    Cada elemento se asigna a una banda de ancho igual al umbral de similitud
+    (5% del rango). Todos los grupos se desplazan a la vez a la región de su
+    banda con una única permutación estable, y después cada grupo se ordena
+    internamente con una operación sobre su rebanada.
+
+    Args:
+        segmento (numpy.ndarray): Vista unidimensional que se ordena in-place.
+    """
+    valor_min = segmento.min()
+    valor_max = segmento.max()
+
+    # El rango se calcula en punto flotante para evitar desbordes en enteros
+    rango = float(valor_max) - float(valor_min)
+
+    # Si todos los elementos son iguales, el segmento ya está ordenado
+    if rango == 0:
+        return
+
+    umbral_similitud = rango * 0.05
+
+    # Con ±inf o un rango que desborda (o que se redondea a 0.0 con flotantes
+    # subnormales) no hay bandas utilizables: el segmento se ordena directamente
+    if not np.isfinite(rango) or umbral_similitud == 0:
+        segmento.sort()
+        return
+
+    # Máscara de bandas: la conversión a flotante es monótona, por lo que las
+    # bandas respetan el orden de los valores aunque se pierda precisión
+    desplazamiento = segmento.astype(np.float64) - float(valor_min)
+    bandas = np.minimum(desplazamiento // umbral_similitud, _NUM_BANDAS - 1).astype(np.uint8)
+
+    # Migrar todos los grupos a su región (ordenamiento por radix sobre uint8)
+    segmento[:] = segmento[np.argsort(bandas, kind='stable')]
+
+    # Ordenar internamente cada grupo mediante su rebanada
+    limites = np.cumsum(np.bincount(bandas, minlength=_NUM_BANDAS))
+    grupo_inicio = 0
+    for grupo_fin in limites.tolist():
+        if grupo_fin - grupo_inicio > 1:
+            segmento[grupo_inicio:grupo_fin].sort()
+        grupo_inicio = grupo_fin
+
+
+def _fluir_hacia_prefijo(arr, inicio_centro, fin_centro):
+    """
+    Migra hacia el prefijo ordenado los elementos del centro que le pertenecen.
+
+    Args:
+        arr (numpy.ndarray): Arreglo completo.
+        inicio_centro (int): Primer índice posterior al prefijo ordenado.
+        fin_centro (int): Índice donde comienza el sufijo ordenado.
+    """
+    if inicio_centro >= fin_centro:
+        return
+
+    # Solo migran los elementos del centro menores que el último del prefijo
+    ultimo_prefijo = arr[inicio_centro - 1]
+    num_migrantes = int(np.searchsorted(arr[inicio_centro:fin_centro], ultimo_prefijo, side='left'))
+    if num_migrantes == 0:
+        return
+
+    # El primer punto de inserción delimita la parte del prefijo desplazada
+    punto_insercion = int(np.searchsorted(arr[:inicio_centro], arr[inicio_centro], side='right'))
+    _fusionar(arr, punto_insercion, inicio_centro, inicio_centro + num_migrantes)
+
+
+def _fluir_hacia_sufijo(arr, inicio_sufijo):
+    """
+    Migra hacia el sufijo ordenado los elementos previos que le pertenecen.
+
+    Args:
+        arr (numpy.ndarray): Arreglo completo, ordenado en arr[:inicio_sufijo].
+        inicio_sufijo (int): Índice donde comienza el sufijo ordenado.
+    """
+    n = arr.size
+    if inicio_sufijo >= n or inicio_sufijo == 0:
+        return
+
+    # Solo migran los elementos mayores que el primero del sufijo
+    primero_sufijo = arr[inicio_sufijo]
+    inicio_migrantes = int(np.searchsorted(arr[:inicio_sufijo], primero_sufijo, side='right'))
+    if inicio_migrantes == inicio_sufijo:
+        return
+
+    # El punto final delimita la parte del sufijo desplazada
+    punto_final = inicio_sufijo + int(np.searchsorted(arr[inicio_sufijo:], arr[inicio_sufijo - 1], side='left'))
+    _fusionar(arr, inicio_migrantes, inicio_sufijo, punto_final)
+
+
+def _fusionar(arr, inicio, medio, fin):
+    """
+    Fusiona in-place las secciones ordenadas arr[inicio:medio] y arr[medio:fin].
+
+    Cada elemento calcula su posición destino de forma vectorizada con
+    ``searchsorted``; los empates conservan primero a la sección izquierda.
+
+    Args:
+        arr (numpy.ndarray): Arreglo a modificar.
+        inicio (int): Inicio de la sección izquierda.
+        medio (int): Inicio de la sección derecha.
+        fin (int): Final (exclusivo) de la sección derecha.
+    """
+    izquierda = arr[inicio:medio].copy()
+    derecha = arr[medio:fin].copy()
+
+    destino_izquierda = np.arange(izquierda.size) + np.searchsorted(derecha, izquierda, side='left')
+    destino_derecha = np.arange(derecha.size) + np.searchsorted(izquierda, derecha, side='right')
+
+    segmento = arr[inicio:fin]
+    segmento[destino_izquierda] = izquierda
+    segmento[destino_derecha] = derecha
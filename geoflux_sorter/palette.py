@@ -0,0 +1,65 @@
+"""
+Colores de las visualizaciones de GeoFlux Sort.
+
+Este módulo define ``COLOR_MAP`` y la traducción de los highlights de cada
+paso del generador a colores por índice. Lo comparten la animación de
+matplotlib (``animator``) y el renderizador rasterizado (``raster``).
+"""
+
+# Mapa de colores para diferentes estados de elementos en la visualización
+COLOR_MAP = {
+    'default': 'skyblue',            # Color por defecto de las barras
+    'i': 'cornflowerblue',           # Índice principal actual
+    'j': 'sandybrown',               # Índice de comparación
+    'key_floating': 'hotpink',       # Elemento siendo movido
+    'shifting': 'lightcoral',        # Elementos siendo desplazados
+    'insertion_at': 'mediumpurple',  # Punto de inserción
+    'all_sorted': 'lightgreen',      # Arreglo completamente ordenado
+    'grupo': 'gold',                 # Grupo de elementos similares identificado
+    'moved_group': 'limegreen'       # Grupo que ha sido reubicado
+}
+
+# Highlights especiales que señalan un único índice, en orden de prioridad
+_HIGHLIGHTS_INDICE = (
+    ('insertion_at', 'insertion_at'),
+    ('key_floating', 'key_floating'),
+    ('shifting_to', 'shifting'),
+    ('shifting_from', 'shifting'),
+    ('i', 'i'),
+    ('j', 'j'),
+)
+
+# Prioridad de cada color cuando varias barras comparten un píxel (de menor a mayor)
+_PRIORIDAD_COLORES = (
+    'default', 'all_sorted', 'grupo', 'moved_group', 'shifting',
+    'key_floating', 'i', 'insertion_at', 'j',
+)
+
+
+def _colores_resaltados(highlights, n_elements):
+    """
+    Traduce los highlights de un frame a colores por índice.
+
+    Args:
+        highlights (dict): Highlights del frame.
+        n_elements (int): Número de barras.
+
+    Returns:
+        tuple: (color_base, colores) con la clave de COLOR_MAP de las barras
+            no resaltadas y un diccionario índice -> clave de COLOR_MAP.
+    """
+    if highlights.get('all_sorted'):
+        return 'all_sorted', {}
+
+    colores = {}
+    for idx, highlight_type in highlights.items():
+        if type(idx) is int and 0 <= idx < n_elements:
+            # Un tipo de highlight desconocido deja la barra con el color por defecto
+            colores[idx] = highlight_type if highlight_type in COLOR_MAP else 'default'
+
+    # Highlights especiales (punto de inserción, etc.)
+    for clave, color in _HIGHLIGHTS_INDICE:
+        idx = highlights.get(clave)
+        if type(idx) is int and 0 <= idx < n_elements:
+            colores.setdefault(idx, color)
+    return 'default', colores
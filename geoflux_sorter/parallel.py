@@ -0,0 +1,158 @@
+"""
+Ejecución multinúcleo de GeoFlux Sort.
+
+Este módulo divide el arreglo en particiones por índice, ordena cada una
+con ``geoflux_sort`` en un proceso independiente y fusiona los resultados
+con una fusión k-way basada en un montículo (heap).
+
+Los datos se comparten con los procesos mediante
+``multiprocessing.shared_memory``: cada proceso lee y escribe su partición
+directamente en un bloque de memoria compartida, sin serializar listas.
+"""
+
+import heapq
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .algorithm import geoflux_sort
+
+# Rango representable con el código de tipo 'q' (entero con signo de 64 bits)
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+
+# Por debajo de este tamaño de partición el coste de crear procesos no compensa
+_MIN_PARTICION = 2000
+
+
+def geoflux_sort_parallel(arr, workers=None, min_partition_size=_MIN_PARTICION):
+    """
+    Ordena una lista in-place repartiendo el trabajo entre varios procesos.
+
+    El arreglo se copia una sola vez a memoria compartida y se divide en
+    ``workers`` particiones contiguas de tamaño similar. Cada proceso ordena
+    su partición con ``geoflux_sort`` y la deja en la misma memoria
+    compartida; finalmente las particiones ordenadas se fusionan con
+    ``heapq.merge`` y se escriben de vuelta en ``arr``.
+
+    Como la migración de grupos es O(n²) en el caso promedio (hasta agotar
+    su presupuesto de trabajo), dividir en k particiones reduce el trabajo
+    total a O(n²/k) incluso antes de repartirlo entre núcleos.
+
+    Args:
+        arr (list): Lista de enteros (representables en 64 bits) o de
+            flotantes a ordenar in-place.
+        workers (int, optional): Número de procesos. Por defecto
+            ``os.cpu_count()``.
+        min_partition_size (int, optional): Tamaño mínimo de cada partición.
+            Si el arreglo no alcanza para dos particiones, se ordena de forma
+            secuencial. Por defecto 2000.
+
+    Returns:
+        None: El arreglo se modifica directamente.
+
+    Raises:
+        TypeError: Si los elementos no son todos enteros o todos flotantes.
+        ValueError: Si ``workers`` es menor que 1.
+
+    Ejemplo:
+        >>> import random
+        >>> datos = random.sample(range(1_000_000), 100_000)
+        >>> geoflux_sort_parallel(datos, workers=8)
+        >>> datos == sorted(datos)
+        True
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers debe ser al menos 1")
+
+    n = len(arr)
+    num_particiones = min(workers, n // max(1, min_partition_size))
+
+    # Sin paralelismo posible: ordenar de forma secuencial
+    if num_particiones <= 1:
+        geoflux_sort(arr)
+        return
+
+    codigo_tipo = _codigo_tipo(arr)
+    datos = array(codigo_tipo, arr)
+
+    # Límites de las particiones contiguas por índice
+    limites = [n * k // num_particiones for k in range(num_particiones + 1)]
+
+    memoria = shared_memory.SharedMemory(create=True, size=len(datos) * datos.itemsize)
+    try:
+        vista = memoria.buf[:len(datos) * datos.itemsize].cast(codigo_tipo)
+        try:
+            vista[:] = datos
+            del datos
+
+            # Cada proceso ordena su partición directamente en la memoria compartida
+            with ProcessPoolExecutor(max_workers=num_particiones) as executor:
+                futuros = [
+                    executor.submit(_ordenar_particion, memoria.name, codigo_tipo, inicio, fin)
+                    for inicio, fin in zip(limites, limites[1:])
+                ]
+                for futuro in futuros:
+                    futuro.result()
+
+            # Fusión k-way de las particiones ordenadas mediante un montículo
+            particiones = [vista[inicio:fin] for inicio, fin in zip(limites, limites[1:])]
+            arr[:] = heapq.merge(*particiones)
+            for particion in particiones:
+                particion.release()
+        finally:
+            vista.release()
+    finally:
+        memoria.close()
+        memoria.unlink()
+
+
+def _ordenar_particion(nombre_memoria, codigo_tipo, inicio, fin):
+    """
+    Ordena in-place la partición [inicio, fin) de un bloque de memoria compartida.
+
+    Se ejecuta dentro de un proceso del pool: solo recibe el nombre del
+    bloque y los límites, no los datos.
+
+    Args:
+        nombre_memoria (str): Nombre del bloque de memoria compartida.
+        codigo_tipo (str): Código de tipo de ``array`` de los elementos.
+        inicio (int): Primer índice de la partición.
+        fin (int): Índice final (exclusivo) de la partición.
+    """
+    memoria = shared_memory.SharedMemory(name=nombre_memoria)
+    try:
+        vista = memoria.buf.cast(codigo_tipo)
+        try:
+            particion = vista[inicio:fin].tolist()
+            geoflux_sort(particion)
+            vista[inicio:fin] = array(codigo_tipo, particion)
+        finally:
+            vista.release()
+    finally:
+        memoria.close()
+
+
+def _codigo_tipo(arr):
+    """
+    Determina el código de tipo de ``array`` adecuado para los elementos.
+
+    Args:
+        arr (list): Elementos a compartir entre procesos.
+
+    Returns:
+        str: 'q' para enteros de 64 bits o 'd' para flotantes.
+
+    Raises:
+        TypeError: Si los elementos no son todos enteros o todos flotantes.
+    """
+    if all(type(x) is int for x in arr):
+        if min(arr) < _INT64_MIN or max(arr) > _INT64_MAX:
+            raise TypeError("Los enteros deben ser representables en 64 bits")
+        return 'q'
+    if all(type(x) is float for x in arr):
+        return 'd'
+    raise TypeError("geoflux_sort_parallel requiere elementos todos enteros o todos flotantes")
@@ -0,0 +1,99 @@
+"""
+Aplicación de permutaciones a columnas paralelas.
+
+``geoflux_argsort`` devuelve la permutación que ordena una columna de
+claves; ``apply_permutation`` reordena con ella cualquier número de
+columnas paralelas (listas, ``array.array``, ``bytearray`` o
+``numpy.ndarray``). La permutación se valida y se convierte a un arreglo de
+índices una sola vez; cada columna numérica se reordena con una única
+indexación vectorizada sobre su propio búfer, sin pasar por objetos de
+Python.
+"""
+
+import numpy as np
+
+from .numpy_engine import _es_bufer
+
+
+def apply_permutation(perm, *columns):
+    """
+    Reordena in-place varias columnas paralelas según una permutación.
+
+    Tras la llamada, ``columna[i]`` es el valor que antes estaba en
+    ``columna[perm[i]]`` para cada columna, de modo que
+    ``apply_permutation(geoflux_argsort(claves), claves, otra)`` deja
+    ``claves`` ordenada y ``otra`` alineada con ella.
+
+    Args:
+        perm (sequence): Permutación de ``range(n)`` (``array.array``,
+            lista o ``numpy.ndarray`` de enteros).
+        *columns: Secuencias mutables de longitud n. Las listas se
+            reordenan con una lista de índices; los objetos con protocolo de
+            búfer (``array.array``, ``bytearray``, ``memoryview``,
+            ``numpy.ndarray``) con una indexación de NumPy sobre su memoria.
+
+    Returns:
+        None: Las columnas se modifican directamente.
+
+    Raises:
+        ValueError: Si ``perm`` no es una permutación de ``range(n)`` o una
+            columna no tiene longitud n o no es escribible.
+
+    Ejemplo:
+        >>> from array import array
+        >>> precios = [9.5, 3.0, 7.25]
+        >>> nombres = ['c', 'a', 'b']
+        >>> cantidades = array('i', [30, 10, 20])
+        >>> apply_permutation([1, 2, 0], precios, nombres, cantidades)
+        >>> nombres, cantidades.tolist()
+        (['a', 'b', 'c'], [10, 20, 30])
+    """
+    indices = _validar_permutacion(perm)
+    n = indices.size
+    for columna in columns:
+        if len(columna) != n:
+            raise ValueError(
+                f"Todas las columnas deben tener {n} elementos; se recibió una de {len(columna)}"
+            )
+
+    # Índices como enteros de Python para las columnas que no son búferes
+    lista_indices = None
+    for columna in columns:
+        if isinstance(columna, np.ndarray):
+            _reordenar_vista(columna, indices)
+        elif not isinstance(columna, list) and _es_bufer(columna):
+            # La vista debe liberarse antes que el memoryview para no bloquear el búfer
+            with memoryview(columna) as memoria:
+                vista = np.asarray(memoria)
+                try:
+                    _reordenar_vista(vista, indices)
+                finally:
+                    del vista
+        else:
+            if lista_indices is None:
+                lista_indices = indices.tolist()
+            columna[:] = [columna[k] for k in lista_indices]
+
+
+def _validar_permutacion(perm):
+    """Convierte ``perm`` a índices int64 comprobando que es una permutación."""
+    indices = np.asarray(perm)
+    if indices.ndim != 1 or (indices.size and indices.dtype.kind not in 'iu'):
+        raise ValueError("perm debe ser una secuencia unidimensional de enteros")
+    indices = indices.astype(np.int64, copy=False)
+    n = indices.size
+    # Cada índice de range(n) debe aparecer exactamente una vez
+    if n and (indices.min() < 0 or indices.max() >= n
+              or not (np.bincount(indices, minlength=n) == 1).all()):
+        raise ValueError("perm no es una permutación de range(n)")
+    return indices
+
+
+def _reordenar_vista(vista, indices):
+    """Reordena un ``numpy.ndarray`` in-place con una indexación por índices."""
+    if vista.ndim != 1:
+        raise ValueError("Las columnas deben ser unidimensionales")
+    if not vista.flags.writeable:
+        raise ValueError("Las columnas deben ser escribibles para reordenarse in-place")
+    # La indexación avanzada copia los valores antes de asignarlos
+    vista[:] = vista[indices]
@@ -0,0 +1,348 @@
+"""
+Renderizado rasterizado de GeoFlux Sort sin matplotlib.
+
+Este módulo dibuja las barras de cada paso del algoritmo directamente en
+búferes de NumPy, sin figuras ni ejes, y los escribe como GIF animado,
+secuencia de PNG o flujo de frames RGB crudos (apto para
+``ffmpeg -f rawvideo -pix_fmt rgb24``). Se usan los mismos colores de
+``COLOR_MAP`` que la animación de matplotlib, aunque no se dibujan textos.
+
+Cada frame se guarda como índices de una paleta fija: solo se redibujan las
+columnas de píxeles de las barras que cambiaron de altura o de color, y los
+GIF se escriben sin cuantizar colores. Con más elementos que columnas, cada
+columna resume varios elementos (mínimo, máximo y highlight dominante).
+"""
+
+import os
+
+import numpy as np
+from matplotlib.colors import to_rgb
+from PIL import Image
+
+from .algorithm import geoflux_sort_generator
+from .palette import COLOR_MAP, _PRIORIDAD_COLORES, _colores_resaltados
+
+# Formatos de exportación admitidos
+_FORMATOS = ('gif', 'png', 'raw')
+
+# Proporción del ancho de cada barra que se rellena (igual que la animación)
+_RELLENO_BARRA = 0.8
+
+# Color de fondo del lienzo
+_FONDO = 'white'
+
+# Proporción de blanco en el tono aclarado del rango mínimo-máximo de una columna
+_ACLARADO = 0.55
+
+
+class RasterRenderer:
+    """
+    Lienzo de barras en un búfer de NumPy.
+
+    Si hay más elementos que columnas de píxeles, cada columna agrupa varios
+    elementos consecutivos (nivel de detalle): se rellena de color sólido
+    hasta el mínimo de la columna y con un tono aclarado hasta su máximo, y
+    los highlights se combinan mostrando el color de mayor prioridad.
+
+    Args:
+        initial_data (list): Valores iniciales.
+        width (int, optional): Ancho del lienzo en píxeles. Por defecto 800.
+        height (int, optional): Alto del lienzo en píxeles. Por defecto 450.
+
+    Raises:
+        ValueError: Si no hay datos o las dimensiones no son positivas.
+
+    Ejemplo:
+        >>> lienzo = RasterRenderer([3, 1, 2], width=60, height=40)
+        >>> for estado in geoflux_sort_generator([3, 1, 2], frames='delta'):
+        ...     lienzo.update(estado)
+        >>> lienzo.rgb().shape
+        (40, 60, 3)
+    """
+
+    def __init__(self, initial_data, width=800, height=450):
+        if len(initial_data) == 0:
+            raise ValueError("No se proporcionaron datos para renderizar")
+        if width < 1 or height < 1:
+            raise ValueError("width y height deben ser positivos")
+        n_elements = len(initial_data)
+        self.width = width
+        self.height = height
+
+        # Paleta: fondo, un color sólido por clave de COLOR_MAP (ordenadas por
+        # prioridad) y el mismo color aclarado para el rango mínimo-máximo
+        claves = sorted(COLOR_MAP, key=lambda clave: (
+            _PRIORIDAD_COLORES.index(clave) if clave in _PRIORIDAD_COLORES else len(_PRIORIDAD_COLORES)
+        ))
+        self._indice_color = {clave: k + 1 for k, clave in enumerate(claves)}
+        self._aclarado = len(claves)
+        solidos = np.array([to_rgb(COLOR_MAP[clave]) for clave in claves])
+        colores_rgb = np.vstack([to_rgb(_FONDO), solidos, solidos + (1 - solidos) * _ACLARADO])
+        self.palette = np.round(colores_rgb * 255).astype(np.uint8)
+
+        columnas = np.arange(width)
+        self._agrupado = n_elements > width
+        if self._agrupado:
+            # Primer elemento de cada columna: todas contienen al menos uno
+            self._inicio_columna = (columnas * n_elements + width - 1) // width
+            self._columnas_barras = columnas
+        else:
+            # Barra que ocupa cada columna de píxeles (-1 en los huecos entre barras)
+            barra = columnas * n_elements // width
+            inicio_barra = (np.arange(n_elements) * width + n_elements - 1) // n_elements
+            ancho_barra = np.diff(np.append(inicio_barra, width))
+            relleno = np.maximum(1, np.round(ancho_barra * _RELLENO_BARRA)).astype(np.int64)
+            self._barra_columna = np.where(columnas - inicio_barra[barra] < relleno[barra], barra, -1)
+            self._columnas_barras = np.flatnonzero(self._barra_columna >= 0)
+
+        # Escala vertical como en la animación (máximo * 1.1)
+        self._alturas = np.array(initial_data, dtype=np.float64)
+        maximo = self._alturas.max()
+        self._escala = height / (maximo * 1.1) if maximo > 0 else 0.0
+        self._filas = np.arange(height)[:, None]
+
+        self._color_base = 'default'
+        self._colores = {}
+        self._alto_px = self._a_pixeles(self._alturas)
+        self._color_px = np.full(n_elements, self._indice_color['default'], dtype=np.uint8)
+        if self._agrupado:
+            self._minimos, self._maximos, self._color_columna = self._agregar()
+
+        self.frame = np.zeros((height, width), dtype=np.uint8)
+        self._dibujar_columnas(self._columnas_barras)
+
+    def update(self, frame_data):
+        """
+        Aplica un frame del generador redibujando solo las columnas que cambian.
+
+        Acepta frames completos ('array') y frames delta ('delta').
+
+        Args:
+            frame_data (dict): Datos del frame actual del generador.
+
+        Returns:
+            numpy.ndarray: Índices de las columnas de píxeles redibujadas.
+        """
+        n_elements = len(self._alturas)
+
+        # Alturas: comparación vectorizada del tramo recibido
+        if 'delta' in frame_data:
+            cambio = frame_data['delta']
+            inicio, valores = cambio if cambio is not None else (0, ())
+        else:
+            inicio, valores = 0, frame_data.get('array', ())
+        sucias = []
+        if len(valores):
+            nuevos = np.asarray(valores[:n_elements - inicio], dtype=np.float64)
+            posiciones = np.flatnonzero(self._alturas[inicio:inicio + len(nuevos)] != nuevos)
+            if posiciones.size:
+                nuevos = nuevos[posiciones]
+                posiciones += inicio
+                self._alturas[posiciones] = nuevos
+                self._alto_px[posiciones] = self._a_pixeles(nuevos)
+                sucias.append(posiciones)
+
+        # Colores: índices resaltados ahora o en el frame anterior
+        color_base, colores = _colores_resaltados(frame_data.get('highlights', {}), n_elements)
+        todas = color_base != self._color_base
+        if todas:
+            self._color_px[:] = self._indice_color[color_base]
+            for idx, color in colores.items():
+                self._color_px[idx] = self._indice_color[color]
+        else:
+            cambiados = []
+            for idx in self._colores.keys() | colores.keys():
+                nuevo = colores.get(idx, color_base)
+                if nuevo != self._colores.get(idx, color_base):
+                    self._color_px[idx] = self._indice_color[nuevo]
+                    cambiados.append(idx)
+            if cambiados:
+                sucias.append(np.array(cambiados, dtype=np.int64))
+        self._color_base = color_base
+        self._colores = colores
+
+        if not todas and not sucias:
+            return np.empty(0, dtype=np.int64)
+        if self._agrupado:
+            # Recalcular los agregados y redibujar las columnas que cambiaron
+            minimos, maximos, color_columna = self._agregar()
+            columnas = np.flatnonzero(
+                (minimos != self._minimos) | (maximos != self._maximos) | (color_columna != self._color_columna)
+            )
+            self._minimos, self._maximos, self._color_columna = minimos, maximos, color_columna
+        elif todas:
+            columnas = self._columnas_barras
+        else:
+            columnas = np.flatnonzero(np.isin(self._barra_columna, np.concatenate(sucias)))
+        self._dibujar_columnas(columnas)
+        return columnas
+
+    @property
+    def heights(self):
+        """Copia de los valores mostrados actualmente, en su orden actual."""
+        return self._alturas.copy()
+
+    def rgb(self):
+        """
+        Devuelve el frame actual como imagen RGB.
+
+        Returns:
+            numpy.ndarray: Arreglo (height, width, 3) de tipo uint8.
+        """
+        return self.palette[self.frame]
+
+    def _a_pixeles(self, valores):
+        """Alturas en píxeles de las barras."""
+        return np.clip(np.round(valores * self._escala), 0, self.height).astype(np.int64)
+
+    def _agregar(self):
+        """Calcula el mínimo, el máximo y el color de mayor prioridad de cada columna."""
+        inicios = self._inicio_columna
+        return (
+            np.minimum.reduceat(self._alto_px, inicios),
+            np.maximum.reduceat(self._alto_px, inicios),
+            np.maximum.reduceat(self._color_px, inicios),
+        )
+
+    def _dibujar_columnas(self, columnas):
+        """Redibuja en el búfer las columnas de píxeles indicadas."""
+        if columnas.size == 0:
+            return
+        if self._agrupado:
+            color = self._color_columna[columnas]
+            solido = self._filas >= self.height - self._minimos[columnas]
+            rango = self._filas >= self.height - self._maximos[columnas]
+            self.frame[:, columnas] = np.where(solido, color, np.where(rango, color + self._aclarado, 0))
+        else:
+            barras = self._barra_columna[columnas]
+            relleno = self._filas >= self.height - self._alto_px[barras]
+            self.frame[:, columnas] = np.where(relleno, self._color_px[barras], 0)
+
+
+def render_frames(initial_data, frames=None, width=800, height=450, max_frames=None):
+    """
+    Genera los frames rasterizados de la ejecución de GeoFlux Sort.
+
+    Args:
+        initial_data (list): Lista de valores numéricos a ordenar.
+        frames (iterable, optional): Frames del generador a dibujar. Por
+            defecto ``geoflux_sort_generator(initial_data, frames='delta')``.
+        width (int, optional): Ancho en píxeles. Por defecto 800.
+        height (int, optional): Alto en píxeles. Por defecto 450.
+        max_frames (int, optional): Número máximo de frames. Por defecto todos.
+
+    Yields:
+        numpy.ndarray: Frame RGB (height, width, 3) de tipo uint8.
+    """
+    for lienzo in _recorrer(initial_data, frames, width, height, max_frames):
+        yield lienzo.rgb()
+
+
+def export_geoflux_animation(initial_data, path, format=None, interval=300, width=800,
+                             height=450, frames=None, max_frames=1000):
+    """
+    Exporta la animación de GeoFlux Sort sin pasar por matplotlib.
+
+    Args:
+        initial_data (list): Lista de valores numéricos a ordenar.
+        path (str | file): Destino. Archivo .gif para 'gif', directorio para
+            'png' (``frame_00000.png``, ...) y archivo o flujo binario para
+            'raw' (frames RGB24 consecutivos).
+        format (str, optional): 'gif', 'png' o 'raw'. Por defecto se deduce
+            de la extensión (.gif, .raw/.rgb); sin extensión, 'png'.
+        interval (int, optional): Milisegundos entre frames del GIF.
+            Por defecto 300.
+        width (int, optional): Ancho en píxeles. Por defecto 800.
+        height (int, optional): Alto en píxeles. Por defecto 450.
+        frames (iterable, optional): Frames del generador a dibujar. Por
+            defecto ``geoflux_sort_generator(initial_data, frames='delta')``.
+        max_frames (int, optional): Número máximo de frames; None para
+            todos. Por defecto 1000, como ``create_geoflux_animation``.
+
+    Returns:
+        int: Número de frames escritos.
+
+    Raises:
+        ValueError: Si el formato no es válido o no hay datos.
+
+    Ejemplo:
+        >>> export_geoflux_animation(datos, "geoflux.gif", interval=50)
+        >>> export_geoflux_animation(datos, "frames/", format='png')
+    """
+    if format is None:
+        extension = os.path.splitext(path)[1].lower() if isinstance(path, str) else '.raw'
+        format = {'.gif': 'gif', '.raw': 'raw', '.rgb': 'raw'}.get(extension, 'png')
+    if format not in _FORMATOS:
+        raise ValueError(f"Formato desconocido: {format}")
+
+    lienzos = _recorrer(initial_data, frames, width, height, max_frames)
+    if format == 'gif':
+        return _escribir_gif(lienzos, path, interval)
+    if format == 'png':
+        return _escribir_png(lienzos, path)
+    return _escribir_raw(lienzos, path)
+
+
+def _recorrer(initial_data, frames, width, height, max_frames):
+    """Aplica cada frame a un único ``RasterRenderer`` y lo cede tras cada paso."""
+    lienzo = RasterRenderer(initial_data, width, height)
+    if frames is None:
+        frames = geoflux_sort_generator(list(initial_data), frames='delta')
+    for cantidad, frame_data in enumerate(frames):
+        if max_frames is not None and cantidad >= max_frames:
+            return
+        lienzo.update(frame_data)
+        yield lienzo
+
+
+def _imagen_paleta(lienzo):
+    """Convierte el frame actual en una imagen de Pillow en modo paleta."""
+    imagen = Image.fromarray(lienzo.frame)
+    # Asignar la paleta convierte la imagen de índices ('L') a modo 'P'
+    imagen.putpalette(lienzo.palette.tobytes())
+    return imagen
+
+
+def _escribir_gif(lienzos, path, interval):
+    """Escribe los frames como GIF animado; la paleta fija evita cuantizar."""
+    imagenes = (_imagen_paleta(lienzo) for lienzo in lienzos)
+    primera = next(imagenes, None)
+    if primera is None:
+        return 0
+
+    cantidad = 1
+
+    def contar(imagenes):
+        nonlocal cantidad
+        for imagen in imagenes:
+            cantidad += 1
+            yield imagen
+
+    primera.save(path, save_all=True, append_images=contar(imagenes),
+                 duration=interval, loop=0, optimize=False)
+    return cantidad
+
+
+def _escribir_png(lienzos, directorio):
+    """Escribe cada frame como ``frame_NNNNN.png`` dentro de un directorio."""
+    os.makedirs(directorio, exist_ok=True)
+    cantidad = 0
+    for lienzo in lienzos:
+        ruta = os.path.join(directorio, f"frame_{cantidad:05d}.png")
+        _imagen_paleta(lienzo).save(ruta, compress_level=1)
+        cantidad += 1
+    return cantidad
+
+
+def _escribir_raw(lienzos, destino):
+    """Escribe los frames como RGB24 consecutivos en un archivo o flujo binario."""
+    archivo = open(destino, 'wb') if isinstance(destino, str) else destino
+    cantidad = 0
+    try:
+        for lienzo in lienzos:
+            archivo.write(lienzo.rgb().tobytes())
+            cantidad += 1
+    finally:
+        if archivo is not destino:
+            archivo.close()
+    return cantidad
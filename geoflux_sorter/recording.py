@@ -0,0 +1,417 @@
+"""
+Grabaciones binarias de una ejecución paso a paso con acceso aleatorio.
+
+``geoflux_sort_generator`` solo avanza hacia delante: para ver el paso 5000
+hay que repetir los 4999 anteriores, y guardar todos los estados completos
+ocupa n valores por paso. ``record_sort`` convierte una ejecución en un
+registro compacto de operaciones en un archivo binario:
+
+    - Una tabla de pasos de tamaño fijo con el tipo de paso, los límites del
+      grupo, el índice comparado o el punto de inserción y el tramo
+      reescrito. Las migraciones dejan el tramo ordenado, así que se guardan
+      como "ordenar [inicio, fin)" y solo los cambios que no se pueden
+      describir así (varios pasos acumulados con ``every``) llevan sus
+      valores.
+    - Fotogramas clave con el arreglo completo cada ``keyframe_interval``
+      pasos (por defecto, max(1024, n)), o antes si desde el anterior se
+      reescribieron n elementos.
+
+``SortRecording`` abre el archivo con ``mmap`` y reconstruye cualquier paso
+partiendo del fotograma clave anterior, sin ejecutar de nuevo el algoritmo.
+Cada paso se codifica a partir de su campo 'operation' y, al leerlo, los
+textos de estado y los highlights se regeneran con la misma función que
+usa el generador.
+
+Formato del archivo (little-endian):
+    cabecera | valores (fotogramas clave y cambios literales) |
+    tabla de pasos | tabla de fotogramas clave
+"""
+
+import mmap
+import struct
+from bisect import bisect_right
+
+import numpy as np
+
+from .algorithm import geoflux_sort_generator, _describir_paso
+
+# Identificador y versión del formato
+_MAGICO = b'GEOFLUXR'
+_VERSION = 1
+
+# Cabecera: mágico, versión, tipo de valor ('q' o 'd'), n, pasos, fotogramas
+# clave, desplazamiento de la tabla de pasos, desplazamiento de la tabla de
+# fotogramas clave e intervalo entre fotogramas clave
+_CABECERA = struct.Struct('<8sI1s3xqqqqqq')
+
+# Registro de cada paso: límites [a, b) del grupo o del tramo resaltado,
+# índice c (comparación o punto de inserción), tramo reescrito [inicio, fin)
+# y desplazamiento en bytes de sus valores si el cambio es literal
+_PASO = np.dtype([
+    ('tipo', 'u1'), ('fase', 'u1'), ('cambio', 'u1'), ('relleno', 'u1'),
+    ('a', '<i4'), ('b', '<i4'), ('c', '<i4'),
+    ('inicio', '<i4'), ('fin', '<i4'), ('datos', '<i8'),
+])
+
+# Registro de cada fotograma clave: paso y desplazamiento de sus valores
+_CLAVE = np.dtype([('paso', '<i8'), ('datos', '<i8')])
+
+# Tipos de valor admitidos: código de la cabecera -> dtype de NumPy
+_TIPOS_VALOR = {b'q': np.dtype('<i8'), b'd': np.dtype('<f8')}
+
+# Tipos de operación del generador, en el orden en que se codifican
+_OPERACIONES = ('pass', 'stopped', 'trivial', 'presorted', 'sorted',
+                'group', 'extract', 'compare', 'insertion', 'migration')
+
+# Operaciones con tramo [inicio, fin) y con índice (comparación o inserción)
+_CON_TRAMO = frozenset({'group', 'extract', 'compare', 'insertion', 'migration'})
+_CON_INDICE = frozenset({'compare', 'insertion'})
+
+# Tipos de cambio del arreglo en un paso
+_SIN_CAMBIO, _ORDENAR, _INVERTIR, _LITERAL = range(4)
+
+# Tipos de pasada, en el orden en que se codifican
+_FASES = ('Flujo Ascendente', 'Flujo Descendente', 'Finalizado', 'Detenido')
+
+# Mínimo de pasos entre dos fotogramas clave por defecto; con arreglos
+# mayores el intervalo es n, de modo que aplicar los pasos cuesta como
+# cargar el fotograma clave y los fotogramas no dominan el archivo
+_INTERVALO_CLAVES = 1024
+
+# Pasos acumulados en memoria antes de volcarlos a un bloque de NumPy
+_BLOQUE_PASOS = 4096
+
+
+def record_sort(arr, path, reverse=False, granularity='comparison', every=1,
+                keyframe_interval=None):
+    """
+    Ejecuta ``geoflux_sort_generator`` y guarda la ejecución en un archivo binario.
+
+    Cada paso ocupa 32 bytes más, solo si su cambio no es una ordenación ni
+    una inversión de un tramo, los valores reescritos. Cada fotograma clave
+    ocupa n valores de 8 bytes. La lista original no se modifica.
+
+    Args:
+        arr (list): Lista de enteros (que quepan en 64 bits) o de flotantes,
+            sin mezclar tipos.
+        path (str): Ruta del archivo a crear.
+        reverse (bool, optional): Graba la ordenación descendente. Por
+            defecto False.
+        granularity (str, optional): Nivel de detalle de los pasos, como en
+            ``geoflux_sort_generator``. Por defecto 'comparison'.
+        every (int, optional): Graba uno de cada ``every`` pasos, como en
+            ``geoflux_sort_generator``. Por defecto 1.
+        keyframe_interval (int, optional): Pasos máximos entre dos
+            fotogramas clave. Por defecto max(1024, n).
+
+    Returns:
+        int: Número de pasos grabados.
+
+    Raises:
+        TypeError: Si la lista mezcla tipos o contiene valores que no son
+            enteros ni flotantes.
+        ValueError: Si ``keyframe_interval`` es menor que 1, la lista es
+            demasiado larga para el formato (2**31 - 1 elementos) o algún
+            entero no cabe en 64 bits.
+
+    Ejemplo:
+        >>> record_sort([5, 2, 9, 1, 5, 6], "ejecucion.gfr")
+        26
+    """
+    datos = list(arr)
+    n = len(datos)
+    if keyframe_interval is None:
+        keyframe_interval = max(_INTERVALO_CLAVES, n)
+    if keyframe_interval < 1:
+        raise ValueError("keyframe_interval debe ser al menos 1")
+    if n >= 2 ** 31:
+        raise ValueError("La lista es demasiado larga para el formato de grabación")
+    tipos = set(map(type, datos))
+    if tipos <= {int}:
+        codigo = b'q'
+    elif tipos == {float}:
+        codigo = b'd'
+    else:
+        raise TypeError("record_sort solo admite listas de enteros o de flotantes, sin mezclar tipos")
+    tipo = _TIPOS_VALOR[codigo]
+    try:
+        np.asarray(datos, dtype=tipo)
+    except OverflowError:
+        raise ValueError("Los enteros deben caber en 64 bits") from None
+
+    with open(path, 'wb') as archivo:
+        archivo.write(bytes(_CABECERA.size))
+        desplazamiento = _CABECERA.size
+
+        def escribir(valores):
+            """Añade valores a la zona de datos y devuelve su desplazamiento."""
+            nonlocal desplazamiento
+            bloque = np.asarray(valores, dtype=tipo).tobytes()
+            archivo.write(bloque)
+            inicio = desplazamiento
+            desplazamiento += len(bloque)
+            return inicio
+
+        bloques = []
+        pendientes = []
+        claves = []
+        actual = []
+        ultima_clave = 0
+        reescritos = 0
+
+        pasos = geoflux_sort_generator(datos, reverse=reverse, frames='delta',
+                                       granularity=granularity, every=every)
+        for indice, estado in enumerate(pasos):
+            tipo_paso, fase, a, b, c = _clasificar(estado)
+            cambio = estado['delta']
+            modo, inicio, fin, posicion = _SIN_CAMBIO, 0, 0, -1
+            if indice == 0:
+                # El primer paso contiene el arreglo completo: es el primer fotograma clave
+                actual = list(cambio[1])
+            elif cambio is not None:
+                inicio, valores = cambio
+                fin = inicio + len(valores)
+                modo = _codificar_cambio(actual[inicio:fin], valores, tipo)
+                if modo == _LITERAL:
+                    posicion = escribir(valores)
+                actual[inicio:fin] = valores
+                reescritos += fin - inicio
+            pendientes.append((tipo_paso, fase, modo, 0, a, b, c, inicio, fin, posicion))
+
+            if indice == 0 or indice - ultima_clave >= keyframe_interval or reescritos >= n:
+                claves.append((indice, escribir(actual)))
+                ultima_clave = indice
+                reescritos = 0
+            if len(pendientes) == _BLOQUE_PASOS:
+                bloques.append(np.array(pendientes, dtype=_PASO))
+                pendientes = []
+        bloques.append(np.array(pendientes, dtype=_PASO))
+
+        total = sum(len(bloque) for bloque in bloques)
+        inicio_pasos = desplazamiento
+        for bloque in bloques:
+            archivo.write(bloque.tobytes())
+        inicio_claves = inicio_pasos + total * _PASO.itemsize
+        archivo.write(np.array(claves, dtype=_CLAVE).tobytes())
+
+        archivo.seek(0)
+        archivo.write(_CABECERA.pack(_MAGICO, _VERSION, codigo, n, total, len(claves),
+                                     inicio_pasos, inicio_claves, keyframe_interval))
+    return total
+
+
+class SortRecording:
+    """
+    Lectura con acceso aleatorio de una grabación de ``record_sort``.
+
+    El archivo se proyecta en memoria con ``mmap``: abrirlo no lee los
+    pasos, y cada paso o fotograma clave se lee solo cuando se necesita.
+    ``seek(step)`` carga el fotograma clave anterior a ``step`` (O(n)) y
+    aplica como máximo ``keyframe_interval`` pasos, que en total reescriben
+    O(n) elementos. Avanzar desde la posición actual sin pasar un fotograma
+    clave solo aplica los pasos intermedios.
+
+    Args:
+        path (str): Ruta de un archivo creado con ``record_sort``.
+
+    Raises:
+        ValueError: Si el archivo no es una grabación válida.
+
+    Ejemplo:
+        >>> record_sort(datos, "ejecucion.gfr")
+        >>> with SortRecording("ejecucion.gfr") as grabacion:
+        ...     estado = grabacion.seek(5000)
+        ...     anterior = grabacion.seek(4999)
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as archivo:
+            self._mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(self._mapa) < _CABECERA.size:
+                raise ValueError("El archivo no es una grabación de GeoFlux Sort")
+            (magico, version, codigo, n, pasos, claves,
+             inicio_pasos, inicio_claves, intervalo) = _CABECERA.unpack_from(self._mapa)
+            if magico != _MAGICO or codigo not in _TIPOS_VALOR:
+                raise ValueError("El archivo no es una grabación de GeoFlux Sort")
+            if version != _VERSION:
+                raise ValueError(f"Versión de grabación no soportada: {version}")
+            self._pasos = np.frombuffer(self._mapa, dtype=_PASO, count=pasos, offset=inicio_pasos)
+            self._claves = np.frombuffer(self._mapa, dtype=_CLAVE, count=claves, offset=inicio_claves)
+        except Exception:
+            self._mapa.close()
+            raise
+        self._tipo = _TIPOS_VALOR[codigo]
+        self._pasos_clave = self._claves['paso'].tolist()
+        self.size = n
+        self.keyframe_interval = intervalo
+
+        # Posición actual: índice del paso reconstruido y arreglo en ese paso
+        self._paso = -1
+        self._arr = []
+
+    def __len__(self):
+        return len(self._pasos)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.close()
+
+    def close(self):
+        """Libera la proyección del archivo."""
+        if self._mapa is not None:
+            # Las vistas de NumPy deben soltarse antes de cerrar el mmap
+            self._pasos = self._claves = None
+            self._mapa.close()
+            self._mapa = None
+
+    def seek(self, step):
+        """
+        Reconstruye el estado de un paso.
+
+        Args:
+            step (int): Índice del paso; los negativos cuentan desde el final.
+
+        Returns:
+            dict: Estado con el mismo formato que ``geoflux_sort_generator``
+                en modo 'full': 'array', 'pass_type', 'status',
+                'highlights' y 'operation'.
+
+        Raises:
+            IndexError: Si ``step`` está fuera de la grabación.
+        """
+        step = self._posicionar(step)
+        estado = self._describir(self._pasos[step].item())
+        estado['array'] = list(self._arr)
+        return estado
+
+    def replay(self, start=0, stop=None, frames='delta'):
+        """
+        Reproduce hacia delante los pasos [start, stop).
+
+        Args:
+            start (int, optional): Primer paso. Por defecto 0.
+            stop (int, optional): Paso final (excluido). Por defecto, el
+                final de la grabación.
+            frames (str, optional): 'delta' cede solo el tramo modificado en
+                cada paso (el primero contiene el arreglo completo), como el
+                generador en modo 'delta'; 'full' cede una copia completa del
+                arreglo. Por defecto 'delta'.
+
+        Yields:
+            dict: Estados con el formato del generador en el modo elegido.
+
+        Raises:
+            ValueError: Si ``frames`` no es válido.
+            IndexError: Si ``start`` está fuera de la grabación.
+        """
+        if frames not in ('full', 'delta'):
+            raise ValueError(f"Modo de frames desconocido: {frames}")
+        stop = len(self) if stop is None else min(stop, len(self))
+        if start >= stop:
+            return
+        self._posicionar(start)
+        tramo = (0, self.size)
+        for paso, registro in enumerate(self._pasos[start:stop].tolist(), start):
+            if paso > start:
+                # Un seek() entre dos pasos cedidos mueve la posición actual
+                if self._paso != paso - 1:
+                    self._posicionar(paso - 1)
+                tramo = self._aplicar(registro)
+                self._paso = paso
+            estado = self._describir(registro)
+            if frames == 'full':
+                estado['array'] = list(self._arr)
+            elif tramo is None:
+                estado['delta'] = None
+            else:
+                estado['delta'] = (tramo[0], self._arr[tramo[0]:tramo[1]])
+            yield estado
+
+    def _posicionar(self, paso):
+        """Lleva la posición actual al paso indicado y devuelve su índice."""
+        total = len(self)
+        if paso < 0:
+            paso += total
+        if not 0 <= paso < total:
+            raise IndexError("Paso fuera de la grabación")
+
+        # Partir del fotograma clave anterior salvo que la posición actual esté más cerca
+        clave = bisect_right(self._pasos_clave, paso) - 1
+        paso_clave = self._pasos_clave[clave]
+        if not paso_clave <= self._paso <= paso:
+            self._arr = self._valores(int(self._claves[clave]['datos']), self.size)
+            self._paso = paso_clave
+        for registro in self._pasos[self._paso + 1:paso + 1].tolist():
+            self._aplicar(registro)
+        self._paso = paso
+        return paso
+
+    def _aplicar(self, registro):
+        """Aplica el cambio de un paso al arreglo actual; devuelve el tramo o None."""
+        modo, inicio, fin, posicion = registro[2], registro[7], registro[8], registro[9]
+        arr = self._arr
+        if modo == _SIN_CAMBIO:
+            return None
+        if modo == _ORDENAR:
+            arr[inicio:fin] = sorted(arr[inicio:fin])
+        elif modo == _INVERTIR:
+            arr[inicio:fin] = reversed(arr[inicio:fin])
+        else:
+            arr[inicio:fin] = self._valores(posicion, fin - inicio)
+        return inicio, fin
+
+    def _valores(self, posicion, cantidad):
+        """Lee ``cantidad`` valores de la zona de datos como lista de Python."""
+        return np.frombuffer(self._mapa, dtype=self._tipo, count=cantidad, offset=posicion).tolist()
+
+    def _describir(self, registro):
+        """Regenera el estado de un paso (sin el arreglo) a partir de su registro."""
+        tipo = _OPERACIONES[registro[0]]
+        pass_type = _FASES[registro[1]]
+        a, b, c = registro[4:7]
+        operacion = (
+            tipo,
+            a if tipo in _CON_TRAMO else None,
+            b if tipo in _CON_TRAMO else None,
+            c if tipo in _CON_INDICE else None,
+        )
+        status, highlights = _describir_paso(pass_type, operacion, self._arr)
+        return {'pass_type': pass_type, 'status': status,
+                'highlights': highlights, 'operation': operacion}
+
+
+def _clasificar(estado):
+    """
+    Codifica la operación de un paso del generador.
+
+    Returns:
+        tuple: (tipo, fase, a, b, c) con los campos del registro del paso.
+    """
+    tipo, inicio, fin, indice = estado['operation']
+    return (
+        _OPERACIONES.index(tipo),
+        _FASES.index(estado['pass_type']),
+        0 if inicio is None else inicio,
+        0 if fin is None else fin,
+        0 if indice is None else indice,
+    )
+
+
+def _codificar_cambio(anterior, valores, tipo):
+    """
+    Elige cómo guardar la reescritura de un tramo.
+
+    Las migraciones dejan el tramo ordenado y la inversión final lo invierte;
+    en esos casos basta con los límites. La comparación se hace sobre los
+    bytes para distinguir 0.0 de -0.0, que el orden estable puede colocar de
+    otra forma.
+    """
+    valores = np.asarray(valores, dtype=tipo).tobytes()
+    if np.asarray(sorted(anterior), dtype=tipo).tobytes() == valores:
+        return _ORDENAR
+    if np.asarray(anterior[::-1], dtype=tipo).tobytes() == valores:
+        return _INVERTIR
+    return _LITERAL
@@ -0,0 +1,336 @@
+"""
+Ordenamiento parcial, selección del k-ésimo y top-k para GeoFlux Sort.
+
+Estas funciones solo ordenan la región que la consulta necesita. Una
+muestra aleatoria estima el valor que ocupará la frontera pedida (la
+posición k) y la banda de valores similares que lo rodea; una pasada de
+filtrado separa los menores, la banda y los mayores, y solo la banda se
+sigue refinando. Las regiones que sí deben quedar ordenadas migran a bandas
+de ancho igual al umbral de similitud (5% del rango), como en el motor
+vectorizado, y las bandas pequeñas pasan por el núcleo de GeoFlux Sort
+(flujos ascendente y descendente).
+
+    - ``geoflux_partial_sort``: los k menores, en orden, al inicio.
+    - ``geoflux_nth_element``: el valor de la posición k, con los menores a
+      su izquierda y los mayores a su derecha (percentiles, medianas).
+    - ``geoflux_topk``: los k mayores (o menores) en una lista nueva.
+
+Como en ``geoflux_sort``, los valores deben admitir resta y ``abs``.
+"""
+
+import math
+import random
+from itertools import chain
+
+from .algorithm import _geoflux_nucleo
+
+# Número de bandas: con un umbral de similitud del 5% del rango hay 20
+_NUM_BANDAS = 20
+
+# Regiones de hasta este tamaño se ordenan directamente con el núcleo
+_MAX_REGION = 64
+
+# Redistribuciones máximas de una región (protege frente a rangos degenerados)
+_MAX_NIVELES = 32
+
+# Tamaño de la muestra que estima la frontera; regiones menores ya no se filtran
+_MUESTRA = 2048
+
+# Margen de la banda de la frontera, en posiciones de la muestra a cada lado
+_MARGEN = 2 * math.isqrt(_MUESTRA)
+
+
+def geoflux_partial_sort(arr, k):
+    """
+    Ordena in-place solo los k menores elementos de un arreglo.
+
+    Tras la llamada, ``arr[:k]`` contiene los k menores valores en orden no
+    decreciente y ``arr[k:]`` el resto en un orden no especificado (todos
+    mayores o iguales que ``arr[k - 1]``).
+
+    Args:
+        arr (list): Valores numéricos a reordenar in-place.
+        k (int): Número de elementos a dejar ordenados al inicio. Si supera
+            la longitud se ordena el arreglo completo.
+
+    Returns:
+        None: El arreglo se modifica directamente.
+
+    Raises:
+        ValueError: Si ``k`` es negativo.
+
+    Complejidad Temporal:
+        - O(n) para aislar la frontera más el ordenamiento de los k primeros
+
+    Ejemplo:
+        >>> datos = [9, 4, 7, 1, 8, 2, 6]
+        >>> geoflux_partial_sort(datos, 3)
+        >>> datos[:3]
+        [1, 2, 4]
+
+        Los rangos de flotantes subnormales, cuyo umbral de similitud se
+        redondea a 0.0, se ordenan con el núcleo sin repartirse en bandas:
+
+        >>> diminutos = [1e-323, 0.0, 5e-324] * 40
+        >>> geoflux_partial_sort(diminutos, 50)
+        >>> diminutos[38:42], diminutos[49]
+        ([0.0, 0.0, 5e-324, 5e-324], 5e-324)
+
+        Tampoco se reparten las regiones con ±inf o cuyo rango desborda:
+
+        >>> extremos = [1.7e308, -1.7e308] * 50
+        >>> geoflux_partial_sort(extremos, 10)
+        >>> extremos[:10] == [-1.7e308] * 10
+        True
+        >>> geoflux_topk([float('inf'), 1.0, 2.0, float('-inf')] * 25, 3)
+        [inf, inf, inf]
+    """
+    if k < 0:
+        raise ValueError("k no puede ser negativo")
+    n = len(arr)
+    k = min(k, n)
+    if k == 0:
+        return
+
+    inicio, fin = _aislar_frontera(arr, k - 1)
+    _ordenar_region(arr, inicio, fin)
+    _ordenar_region(arr, 0, inicio)
+
+
+def geoflux_nth_element(arr, k):
+    """
+    Coloca en la posición k el valor que ocuparía con el arreglo ordenado.
+
+    Tras la llamada, ``arr[:k]`` contiene valores menores o iguales que
+    ``arr[k]`` y ``arr[k + 1:]`` valores mayores o iguales, ambos en un
+    orden no especificado. Sirve para medianas y percentiles sin ordenar
+    todo el arreglo.
+
+    Args:
+        arr (list): Valores numéricos a reordenar in-place.
+        k (int): Posición buscada, entre 0 y ``len(arr) - 1``.
+
+    Returns:
+        El valor que queda en ``arr[k]``.
+
+    Raises:
+        IndexError: Si ``k`` está fuera del arreglo.
+
+    Ejemplo:
+        >>> datos = [9, 4, 7, 1, 8, 2, 6]
+        >>> geoflux_nth_element(datos, len(datos) // 2)  # mediana
+        6
+    """
+    n = len(arr)
+    if not 0 <= k < n:
+        raise IndexError(f"k debe estar entre 0 y {n - 1}; se recibió {k}")
+
+    inicio, fin = _aislar_frontera(arr, k)
+    _ordenar_region(arr, inicio, fin)
+    return arr[k]
+
+
+def geoflux_topk(arr, k, largest=True):
+    """
+    Devuelve los k mayores (o menores) valores de un arreglo, en orden.
+
+    El arreglo original no se modifica: un recorrido filtra los candidatos
+    (los valores a partir de la banda estimada para la frontera) y la
+    selección trabaja solo sobre ellos.
+
+    Args:
+        arr (iterable): Valores numéricos.
+        k (int): Número de valores a devolver. Si supera la longitud se
+            devuelven todos.
+        largest (bool, optional): Si es True (por defecto) devuelve los
+            mayores en orden descendente; si es False, los menores en orden
+            ascendente.
+
+    Returns:
+        list: Los k valores seleccionados.
+
+    Raises:
+        ValueError: Si ``k`` es negativo.
+
+    Ejemplo:
+        >>> geoflux_topk([9, 4, 7, 1, 8, 2, 6], 3)
+        [9, 8, 7]
+        >>> geoflux_topk([9, 4, 7, 1, 8, 2, 6], 2, largest=False)
+        [1, 2]
+    """
+    if k < 0:
+        raise ValueError("k no puede ser negativo")
+    valores = arr if isinstance(arr, list) else list(arr)
+    n = len(valores)
+    k = min(k, n)
+    if k == 0:
+        return []
+
+    # Un único recorrido filtra los candidatos: los que superan la banda estimada
+    # para la frontera n - k (o no llegan a la de k - 1, si se piden los menores)
+    frontera = n - k if largest else k - 1
+    candidatos = None
+    if n > 2 * _MUESTRA:
+        bajo, alto = _estimar_banda(valores, frontera, random.Random(0))
+        if largest:
+            candidatos = [valor for valor in valores if bajo <= valor]
+        else:
+            candidatos = [valor for valor in valores if valor <= alto]
+        if len(candidatos) < k:
+            # La muestra falló: se trabaja con todos los valores
+            candidatos = None
+    if candidatos is None:
+        candidatos = list(valores)
+
+    m = len(candidatos)
+    if not largest:
+        geoflux_partial_sort(candidatos, k)
+        return candidatos[:k]
+
+    # La frontera de los k mayores es la posición m - k
+    inicio, fin = _aislar_frontera(candidatos, m - k)
+    _ordenar_region(candidatos, inicio, fin)
+    _ordenar_region(candidatos, fin, m)
+    mayores = candidatos[m - k:]
+    mayores.reverse()
+    return mayores
+
+
+def _aislar_frontera(arr, k):
+    """
+    Aísla la región del arreglo que contiene la posición k.
+
+    En cada nivel, una muestra de la región estima la banda de valores que
+    rodea la posición k (``_estimar_banda``). Los valores se reparten en
+    menores, banda y mayores con comparaciones simples y se continúa con la
+    parte que contiene k, que normalmente es la banda. Si la muestra falla,
+    la parte elegida sigue siendo correcta y solo se pierde un nivel.
+
+    Returns:
+        tuple: (inicio, fin) con ``inicio <= k < fin``, tal que
+            ``arr[:inicio] <= arr[inicio:fin] <= arr[fin:]`` elemento a
+            elemento.
+    """
+    inicio, fin = 0, len(arr)
+    aleatorio = random.Random(0)
+    margen = _MARGEN
+    for _ in range(_MAX_NIVELES):
+        tamano = fin - inicio
+        if tamano <= 2 * _MUESTRA:
+            break
+        region = arr[inicio:fin]
+        bajo, alto = _estimar_banda(region, k - inicio, aleatorio, margen)
+
+        # Dos recorridos completos: el lado de la frontera (pequeño si k está
+        # cerca de un extremo) se separa primero y después se divide
+        if 2 * (k - inicio) < tamano:
+            lado = [valor for valor in region if valor <= alto]
+            mayores = [valor for valor in region if alto < valor]
+            menores = [valor for valor in lado if valor < bajo]
+            banda = [valor for valor in lado if bajo <= valor]
+        else:
+            lado = [valor for valor in region if bajo <= valor]
+            menores = [valor for valor in region if valor < bajo]
+            banda = [valor for valor in lado if valor <= alto]
+            mayores = [valor for valor in lado if alto < valor]
+        if len(banda) == tamano:
+            if bajo == alto:
+                # Todos los valores de la región son iguales: ya está asentada
+                break
+            # Pocos valores distintos: la banda se reduce al valor estimado
+            margen = 0
+            continue
+        arr[inicio:fin] = chain(menores, banda, mayores)
+
+        # Continuar con la parte que contiene la posición k
+        limite_banda = inicio + len(menores)
+        limite_mayores = limite_banda + len(banda)
+        if k < limite_banda:
+            fin = limite_banda
+        elif k < limite_mayores:
+            inicio, fin = limite_banda, limite_mayores
+        else:
+            inicio = limite_mayores
+    return inicio, fin
+
+
+def _estimar_banda(region, k, aleatorio, margen=None):
+    """
+    Estima la banda de valores que rodea la posición k de una región.
+
+    Una muestra aleatoria ordenada da el valor esperado en la posición k y
+    los límites de la banda a ``margen`` posiciones de la muestra a cada
+    lado; por defecto 2·√m (unas cuatro desviaciones típicas del rango
+    muestral).
+
+    Returns:
+        tuple: (bajo, alto), valores de la región con ``bajo <= alto``.
+    """
+    muestra = aleatorio.sample(region, _MUESTRA)
+    # La muestra es aleatoria: se ordena con el motor de respaldo de Python
+    muestra.sort()
+    if margen is None:
+        margen = _MARGEN
+    posicion = k * _MUESTRA // len(region)
+    return muestra[max(0, posicion - margen)], muestra[min(_MUESTRA - 1, posicion + margen)]
+
+
+def _ordenar_region(arr, inicio, fin):
+    """
+    Ordena in-place ``arr[inicio:fin]``.
+
+    Las regiones grandes se redistribuyen por bandas y cada banda se ordena
+    por separado; las pequeñas (o las que agotan los niveles o no se pueden
+    repartir en bandas) pasan por el núcleo de GeoFlux Sort.
+    """
+    pendientes = [(inicio, fin, 0)]
+    while pendientes:
+        inicio, fin, nivel = pendientes.pop()
+        if fin - inicio <= 1:
+            continue
+        if fin - inicio > _MAX_REGION and nivel < _MAX_NIVELES:
+            bandas = _migrar_a_bandas(arr, inicio, fin)
+            if bandas is not None:
+                pendientes.extend((a, b, nivel + 1) for a, b in bandas)
+                continue
+        region = arr[inicio:fin]
+        _geoflux_nucleo(region, None)
+        arr[inicio:fin] = region
+
+
+def _migrar_a_bandas(arr, inicio, fin):
+    """
+    Migra los valores de ``arr[inicio:fin]`` a bandas del ancho del umbral.
+
+    El valor mínimo cae en la primera banda y el máximo en la última, de
+    modo que ninguna banda contiene toda una región con valores distintos.
+
+    Returns:
+        list | None: Límites (inicio, fin) de cada banda no vacía, en orden;
+            None si la región no se puede repartir: todos los valores son
+            iguales, el rango es tan pequeño (flotantes subnormales) que el
+            umbral se redondea a 0.0, o el umbral no es finito (±inf o un
+            rango que desborda).
+    """
+    region = arr[inicio:fin]
+    minimo, maximo = min(region), max(region)
+    if minimo == maximo:
+        return None
+
+    umbral_similitud = (maximo - minimo) * 0.05
+    if umbral_similitud <= 0 or not math.isfinite(umbral_similitud):
+        return None
+    ultima = _NUM_BANDAS - 1
+    bandas = [[] for _ in range(_NUM_BANDAS)]
+    # La división entera en flotante es monótona: las bandas respetan el orden
+    for valor in region:
+        banda = int((valor - minimo) // umbral_similitud)
+        bandas[banda if banda < ultima else ultima].append(valor)
+    arr[inicio:fin] = chain.from_iterable(bandas)
+
+    limites = []
+    for banda in bandas:
+        if banda:
+            limites.append((inicio, inicio + len(banda)))
+            inicio += len(banda)
+    return limites
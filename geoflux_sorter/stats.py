@@ -0,0 +1,117 @@
+"""
+Estadísticas de ejecución de GeoFlux Sort.
+
+Este módulo define el colector que ``geoflux_sort`` rellena cuando se le
+pasa el argumento ``stats``. Permite cuantificar el trabajo realizado por
+el algoritmo sin alterar su resultado. Cuando no se pasa, ``geoflux_sort``
+ejecuta una versión del núcleo sin contadores.
+"""
+
+from collections import Counter
+
+
+class SortStats:
+    """
+    Contadores de operaciones acumulados durante uno o varios ordenamientos.
+
+    Attributes:
+        sorts (int): Ordenamientos registrados.
+        passes (int): Pasadas del bucle principal (un flujo ascendente y uno
+            descendente cada una).
+        groups_found (int): Grupos de elementos similares identificados.
+        groups_migrated (int): Grupos que migraron a otra posición.
+        scan_comparisons (int): Comparaciones realizadas al buscar el punto
+            de inserción de los grupos (recorrido lineal más galope).
+        elements_shifted (int): Elementos desplazados por los grupos que
+            migraron.
+        group_sizes (collections.Counter): Histograma tamaño -> número de
+            grupos identificados.
+        migrated_group_sizes (collections.Counter): Histograma tamaño ->
+            número de grupos migrados.
+        engines (collections.Counter): Motor usado -> número de
+            ordenamientos (decisiones de ``engine='auto'`` incluidas).
+        gallop_searches (int): Búsquedas del punto de inserción resueltas
+            por galope dentro de una sección ordenada.
+        gallop_comparisons (int): Comparaciones realizadas por esas búsquedas.
+        linear_comparisons (int): Comparaciones que habría necesitado el
+            recorrido lineal para encontrar los mismos puntos de inserción.
+
+    Ejemplo:
+        >>> from geoflux_sorter import geoflux_sort, SortStats
+        >>> stats = SortStats()
+        >>> # Flotantes: los enteros de rango acotado irían por la ruta de conteo
+        >>> datos = [x + 0.5 for x in range(1000, 0, -1)]
+        >>> geoflux_sort(datos, stats=stats)
+        >>> stats.comparisons_saved > 0
+        True
+        >>> stats.groups_migrated == sum(stats.migrated_group_sizes.values())
+        True
+    """
+
+    def __init__(self):
+        self.sorts = 0
+        self.passes = 0
+        self.groups_found = 0
+        self.groups_migrated = 0
+        self.scan_comparisons = 0
+        self.elements_shifted = 0
+        self.group_sizes = Counter()
+        self.migrated_group_sizes = Counter()
+        self.engines = Counter()
+        self.gallop_searches = 0
+        self.gallop_comparisons = 0
+        self.linear_comparisons = 0
+
+    @property
+    def comparisons_saved(self):
+        """int: Comparaciones evitadas por el galope frente al recorrido lineal."""
+        return self.linear_comparisons - self.gallop_comparisons
+
+    @property
+    def mean_group_size(self):
+        """float: Tamaño medio de los grupos identificados (0.0 si no hay)."""
+        if not self.groups_found:
+            return 0.0
+        return sum(tamano * cuenta for tamano, cuenta in self.group_sizes.items()) / self.groups_found
+
+    def as_dict(self):
+        """
+        Devuelve los contadores como un diccionario serializable a JSON.
+
+        Returns:
+            dict: Contadores, ``comparisons_saved`` e histogramas con las
+                claves ordenadas por tamaño.
+        """
+        return {
+            'sorts': self.sorts,
+            'passes': self.passes,
+            'groups_found': self.groups_found,
+            'groups_migrated': self.groups_migrated,
+            'scan_comparisons': self.scan_comparisons,
+            'elements_shifted': self.elements_shifted,
+            'gallop_searches': self.gallop_searches,
+            'gallop_comparisons': self.gallop_comparisons,
+            'linear_comparisons': self.linear_comparisons,
+            'comparisons_saved': self.comparisons_saved,
+            'group_sizes': dict(sorted(self.group_sizes.items())),
+            'migrated_group_sizes': dict(sorted(self.migrated_group_sizes.items())),
+            'engines': dict(self.engines),
+        }
+
+    def _registrar_galope(self, comparaciones, comparaciones_lineales):
+        """Acumula el resultado de una búsqueda por galope."""
+        self.gallop_searches += 1
+        self.gallop_comparisons += comparaciones
+        self.linear_comparisons += comparaciones_lineales
+
+    def __repr__(self):
+        return (
+            f"SortStats(sorts={self.sorts}, passes={self.passes}, "
+            f"groups_found={self.groups_found}, groups_migrated={self.groups_migrated}, "
+            f"scan_comparisons={self.scan_comparisons}, "
+            f"elements_shifted={self.elements_shifted}, "
+            f"gallop_searches={self.gallop_searches}, "
+            f"gallop_comparisons={self.gallop_comparisons}, "
+            f"linear_comparisons={self.linear_comparisons}, "
+            f"comparisons_saved={self.comparisons_saved})"
+        )
@@ -0,0 +1,175 @@
+"""
+Trazas de fases y perfilado de GeoFlux Sort.
+
+Este módulo define ``SortTrace``, el registro que ``geoflux_sort`` rellena
+cuando se le pasa el argumento ``trace``: cada fase del ordenamiento
+(detección inicial de orden, cálculo del rango y, en cada pasada, detección
+de secciones ordenadas, FASE 1 y FASE 2) queda anotada como un intervalo
+con su duración. El registro se exporta en el formato trace-event JSON de
+Chrome, que abren ``chrome://tracing``, Perfetto (ui.perfetto.dev) o
+speedscope.
+
+También incluye ``profile_sort``, un envoltorio de ``cProfile`` que
+muestra solo las funciones del propio paquete.
+"""
+
+import cProfile
+import json
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+
+from .algorithm import geoflux_sort
+
+# Archivos del paquete: filtro de ``profile_sort`` para mostrar solo sus funciones
+_PATRON_PAQUETE = re.escape(os.path.dirname(os.path.abspath(__file__)))
+
+
+class SortTrace:
+    """
+    Registro de intervalos temporizados de uno o varios ordenamientos.
+
+    Los intervalos se guardan como tuplas con tiempos de
+    ``time.perf_counter_ns`` y solo se convierten a eventos al exportar, de
+    modo que anotar una fase cuesta dos lecturas del reloj y un ``append``.
+
+    Attributes:
+        spans (list): Tuplas (nombre, inicio_ns, fin_ns, hilo, argumentos)
+            en el orden en que terminaron.
+
+    Ejemplo:
+        >>> from geoflux_sorter import geoflux_sort
+        >>> from geoflux_sorter.tracing import SortTrace
+        >>> traza = SortTrace()
+        >>> # Flotantes: los enteros de rango acotado irían por la ruta de conteo
+        >>> geoflux_sort([x + 0.5 for x in [5, 3, 8, 1] * 50], trace=traza)
+        >>> sorted(traza.totals())
+        ['geoflux_sort', 'pass', 'phase1', 'phase2', 'range', 'sorted_sections', 'sortedness_scan']
+        >>> traza.save('geoflux_trace.json')  # doctest: +SKIP
+    """
+
+    def __init__(self):
+        self.spans = []
+        self._origen = time.perf_counter_ns()
+        self._pid = os.getpid()
+
+    now = staticmethod(time.perf_counter_ns)
+
+    def complete(self, name, start, **args):
+        """
+        Registra un intervalo que empezó en ``start`` y termina ahora.
+
+        Args:
+            name (str): Nombre de la fase.
+            start (int): Instante inicial, obtenido con ``now()``.
+            **args: Datos adicionales que se muestran con el evento.
+        """
+        self.spans.append((name, start, time.perf_counter_ns(), threading.get_ident(), args))
+
+    def totals(self):
+        """
+        Resume el tiempo registrado por fase.
+
+        Returns:
+            dict: Nombre -> {'count': int, 'total': float, 'mean': float},
+                con tiempos en segundos.
+        """
+        resumen = {}
+        for nombre, inicio, fin, _, _ in self.spans:
+            entrada = resumen.setdefault(nombre, {'count': 0, 'total': 0.0})
+            entrada['count'] += 1
+            entrada['total'] += (fin - inicio) / 1e9
+        for entrada in resumen.values():
+            entrada['mean'] = entrada['total'] / entrada['count']
+        return resumen
+
+    def to_chrome_trace(self):
+        """
+        Convierte el registro al formato trace-event JSON de Chrome.
+
+        Cada intervalo es un evento completo (``"ph": "X"``) con ``ts`` y
+        ``dur`` en microsegundos desde la creación del registro; los visores
+        anidan los intervalos de un mismo hilo por contención temporal.
+
+        Returns:
+            dict: Documento con ``traceEvents`` y ``displayTimeUnit``.
+        """
+        eventos = [{
+            'name': 'process_name', 'ph': 'M', 'pid': self._pid, 'tid': 0,
+            'args': {'name': 'geoflux_sorter'},
+        }]
+        for nombre, inicio, fin, hilo, args in self.spans:
+            eventos.append({
+                'name': nombre,
+                'cat': 'geoflux',
+                'ph': 'X',
+                'ts': (inicio - self._origen) / 1000,
+                'dur': (fin - inicio) / 1000,
+                'pid': self._pid,
+                'tid': hilo,
+                'args': args,
+            })
+        # Los visores esperan los intervalos contenedores antes que los contenidos
+        eventos[1:] = sorted(eventos[1:], key=lambda e: (e['tid'], e['ts'], -e['dur']))
+        return {'traceEvents': eventos, 'displayTimeUnit': 'ms'}
+
+    def save(self, path):
+        """Escribe el registro como trace-event JSON de Chrome en ``path``."""
+        with open(path, 'w', encoding='utf-8') as archivo:
+            json.dump(self.to_chrome_trace(), archivo)
+
+    def clear(self):
+        """Descarta los intervalos registrados."""
+        self.spans.clear()
+
+    def __len__(self):
+        return len(self.spans)
+
+    def __repr__(self):
+        return f"SortTrace(spans={len(self.spans)})"
+
+
+def profile_sort(data, func=None, repeats=1, sort_by='cumulative', limit=25, stream=None,
+                 path=None):
+    """
+    Perfila un ordenamiento con ``cProfile`` mostrando solo el paquete.
+
+    Cada repetición ordena una copia nueva de ``data``; la copia queda fuera
+    del perfil. El informe se limita a las funciones definidas en
+    ``geoflux_sorter`` (el tiempo de ``sorted``, ``abs`` y demás funciones
+    integradas se incluye en el acumulado de quien las llama).
+
+    Args:
+        data (list): Datos de entrada; no se modifican.
+        func (callable, optional): Función que ordena una lista in-place.
+            Por defecto ``geoflux_sort``.
+        repeats (int, optional): Ordenamientos perfilados. Por defecto 1.
+        sort_by (str, optional): Criterio de ``pstats.Stats.sort_stats``.
+            Por defecto 'cumulative'.
+        limit (int, optional): Máximo de filas del informe. Por defecto 25.
+        stream (file, optional): Destino del informe. Por defecto
+            ``sys.stdout``.
+        path (str, optional): Archivo donde guardar el perfil completo
+            (formato de ``pstats``, legible con snakeviz). Por defecto None.
+
+    Returns:
+        pstats.Stats: Estadísticas completas del perfil.
+    """
+    if func is None:
+        func = geoflux_sort
+
+    perfil = cProfile.Profile()
+    for _ in range(repeats):
+        copia = list(data)
+        perfil.enable()
+        func(copia)
+        perfil.disable()
+
+    if path is not None:
+        perfil.dump_stats(path)
+    estadisticas = pstats.Stats(perfil, stream=stream if stream is not None else sys.stdout)
+    estadisticas.sort_stats(sort_by).print_stats(_PATRON_PAQUETE, limit)
+    return estadisticas